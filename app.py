@@ -5,17 +5,22 @@ import math
 import os
 import time
 import hashlib
+import ipaddress
 import signal
 import sys
+import threading
 from datetime import date, datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
 from functools import wraps
 
 # Third-party imports
 print("[DEBUG] 2a - Importing Flask...", flush=True)
-from flask import Flask, render_template, request, redirect, url_for, flash, session, render_template_string
+from flask import Flask, render_template, request, redirect, url_for, flash, session, render_template_string, g, has_request_context
 print("[DEBUG] 2b - Importing SQLAlchemy...", flush=True)
-from sqlalchemy import text
+from sqlalchemy import text, func, or_, inspect as sqlalchemy_inspect
+from sqlalchemy.exc import OperationalError
 print("[DEBUG] 2c - Importing dotenv...", flush=True)
 from dotenv import load_dotenv
 
@@ -29,6 +34,9 @@ from models import (
     db,
     Game,
     TeamStats,
+    TeamGame,
+    RankingResult,
+    SeasonRevision,
     ScheduledGame,
     ArchivedSeason,
     WeeklySnapshot,
@@ -36,6 +44,11 @@ from models import (
     ExternalPoll
 )
 
+# Local imports - Request performance instrumentation, bounded cache and static export
+import cfb_performance
+import cfb_cache
+import cfb_static_export
+
 # Bowl Pick'em Blueprint
 print("[DEBUG] 5/8 - Importing bowl_pickem blueprint...")
 from blueprints.bowl_pickem import bp as bowl_pickem_bp
@@ -70,6 +83,25 @@ except ImportError as e:
     def export_prediction_data():
         return None
 
+# Local imports - CFB vector ranking (NumPy backend for bulk rankings)
+# Set VECTOR_RANKING=false to force the pure Python path
+CFB_VECTOR_RANKING_ENABLED = False
+try:
+    import cfb_vector_ranking
+    CFB_VECTOR_RANKING_ENABLED = os.environ.get('VECTOR_RANKING', 'true').lower() == 'true'
+    print(f"✅ CFB vector ranking module loaded (enabled: {CFB_VECTOR_RANKING_ENABLED})")
+except ImportError as e:
+    print(f"⚠️ CFB vector ranking not available: {e}")
+
+# Local imports - CFB season simulator (Monte Carlo CFP / bowl odds, needs NumPy)
+CFB_SEASON_SIMULATOR_ENABLED = False
+try:
+    import cfb_season_simulator
+    CFB_SEASON_SIMULATOR_ENABLED = True
+    print("✅ CFB season simulator module loaded")
+except ImportError as e:
+    print(f"⚠️ CFB season simulator not available: {e}")
+
 # Local imports - CFB Gen AI (with error handling)
 # This section replaces lines 65-99 in your app.py
 
@@ -125,63 +157,94 @@ if not ENABLE_GEN_AI:
         return "Weekly report temporarily unavailable"
 
 
-# Simple in-memory cache (for production, use Redis)
-performance_cache = {}
-CACHE_TIMEOUT = 300  # 5 minutes
+# Bounded cache for derived data (see cfb_cache). CACHE_BACKEND picks where it lives:
+# memory (per process, the default), sqlite (CACHE_SQLITE_PATH, shared by the workers on
+# this host) or redis (CACHE_REDIS_URL, shared by every host). Keys carry the season
+# revision, so entries stay valid until the next write and then simply age out (LRU).
+# Concurrent misses for a key are computed once; the other requests wait up to
+# CACHE_COALESCE_TIMEOUT seconds for that result before computing it themselves.
+CACHE_COALESCE_TIMEOUT = float(os.environ.get('CACHE_COALESCE_TIMEOUT', '30'))
+performance_cache = cfb_cache.cache_from_env(
+    'perf',
+    max_entries=int(os.environ.get('PERFORMANCE_CACHE_MAX_ENTRIES', '2048')),
+    max_bytes=int(os.environ.get('PERFORMANCE_CACHE_MAX_MB', '64')) * 1024 * 1024,
+    wait_timeout=CACHE_COALESCE_TIMEOUT
+)
 
-def cache_result(timeout=CACHE_TIMEOUT):
-    """Decorator to cache expensive function results"""
+def cache_result(timeout=None):
+    """
+    Decorator to cache expensive function results for the current season revision.
+    timeout (seconds) is only needed when the result also depends on something else.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            cache_key = f"{func.__name__}_{hashlib.md5(str(args).encode()).hexdigest()}"
-            
-            # Check if result is in cache and not expired
-            if cache_key in performance_cache:
-                cached_result, timestamp = performance_cache[cache_key]
-                if time.time() - timestamp < timeout:
-                    return cached_result
-            
-            # Not in cache or expired - calculate result
-            result = func(*args, **kwargs)
+            # Create cache key from function name, season revision and arguments
+            cache_key = cfb_cache.make_key(f"{func.__name__}@{get_season_data_revision()}", args, kwargs)
             
-            # Store in cache
-            performance_cache[cache_key] = (result, time.time())
-            
-            return result
+            # Not in cache - calculate once, concurrent callers share the result
+            return performance_cache.get_or_compute(
+                cache_key, lambda: func(*args, **kwargs), ttl=timeout, namespace=func.__name__
+            )
         return wrapper
     return decorator
 
+def get_or_compute_from_rankings(cache_key, compute, namespace):
+    """
+    performance_cache.get_or_compute for values built from get_all_team_stats_bulk().
+    Right after a write that can serve the previous revision's rankings (stale-while-
+    revalidate) - such values are shared with concurrent callers but never cached under
+    the new revision, and every caller's request is labeled stale (no page validators).
+    """
+    def compute_with_snapshot():
+        value = compute()
+        return value, g.get('_ranking_snapshot')
+    
+    value, snapshot = performance_cache.get_or_compute(
+        cache_key, compute_with_snapshot, namespace=namespace,
+        cacheable=lambda result: not (result[1] and result[1]['stale'])
+    )
+    if snapshot is not None and g.get('_ranking_snapshot') is None:
+        g._ranking_snapshot = snapshot
+    return value
+
 # Cache management functions
 def clear_cache():
     """Clear all cached results"""
-    global performance_cache
     performance_cache.clear()
 
 def get_cache_stats():
-    """Get cache statistics"""
-    total_entries = len(performance_cache)
-    total_size = sum(len(str(v)) for v in performance_cache.values())
+    """Get cache statistics (sizes are tracked when entries are stored)"""
+    stats = performance_cache.stats()
     
     return {
-        'total_entries': total_entries,
-        'total_size_bytes': total_size,
-        'entries': list(performance_cache.keys())
+        'backend': stats['backend'],
+        'total_entries': stats['entries'],
+        'total_size_bytes': stats['bytes'],
+        'max_entries': stats['max_entries'],
+        'max_size_bytes': stats['max_bytes'],
+        'hits': stats['hits'],
+        'misses': stats['misses'],
+        'coalesced': stats['coalesced'],
+        'evictions': stats['evictions'],
+        'expirations': stats['expirations'],
+        'errors': stats['errors'],
+        'functions': stats['namespaces'],
+        'entries': performance_cache.keys()
     }
 
 # Apply caching to your expensive functions
-@cache_result(timeout=300)  # Cache for 5 minutes
+@cache_result()
 def calculate_comprehensive_stats_cached(team_name):
     """Cached version of calculate_comprehensive_stats"""
     return calculate_comprehensive_stats(team_name)
 
-@cache_result(timeout=300)  # Cache for 5 minutes  
+@cache_result()
 def calculate_enhanced_scientific_ranking_cached(team_name):
     """Cached version of calculate_enhanced_scientific_ranking"""
     return calculate_enhanced_scientific_ranking(team_name)
 
-@cache_result(timeout=180)  # Cache for 3 minutes
+@cache_result()
 def get_current_opponent_quality_cached(opponent_name):
     """Cached version of get_current_opponent_quality"""
     return get_current_opponent_quality(opponent_name)
@@ -206,7 +269,7 @@ OFFSEASON_MODE = os.environ.get('OFFSEASON_MODE', 'false').lower() == 'true'
 
 if OFFSEASON_MODE:
     print("🏈 OFFSEASON MODE - Using local SQLite database (no RDS connection)")
-    DATABASE_URL = 'sqlite:///offseason.db'
+    DATABASE_URL = os.environ.get('OFFSEASON_DATABASE_URL', 'sqlite:///offseason.db')  # Override for scratch/benchmark DBs
     app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 else:
@@ -1236,50 +1299,20 @@ def generate_bowl_projections():
 
 def is_rivalry_game(team1, team2):
     """Check if two teams are rivals"""
-    return (team2 in RIVALRIES.get(team1, []) or 
-            team1 in RIVALRIES.get(team2, []))
+    return TEAM_DIRECTORY.is_rivalry(team1, team2)
 
 def get_rivalry_bonus(team_name, opponent_name):
     """
     Calculate rivalry bonus for beating a rival.
     Returns bonus points to add to victory value.
+    Tier 1 rivalries (MAJOR_RIVALRY_BONUSES) earn 1.0, other rivalries 0.6.
     """
-    if not is_rivalry_game(team_name, opponent_name):
-        return 0.0
-    
-    # Different tiers of rivalry bonuses based on intensity
-    major_rivalries = {
-        # Tier 1: Historic, intense rivalries (1.0 bonus)
-        ('Alabama', 'Auburn'): 1.0,
-        ('Ohio State', 'Michigan'): 1.0,
-        ('Texas', 'Oklahoma'): 1.0,
-        ('Florida', 'Georgia'): 1.0,
-        ('USC', 'UCLA'): 1.0,
-        ('Army', 'Navy'): 1.0,
-        ('Florida State', 'Miami'): 1.0,
-        ('Clemson', 'South Carolina'): 1.0,
-        ('North Carolina', 'NC State'): 1.0,
-        ('Notre Dame', 'USC'): 1.0,
-        ('Virginia', 'Virginia Tech'): 1.0,
-        ('Stanford', 'California'): 1.0,
-        ('Oregon', 'Oregon State'): 1.0,
-        ('Washington', 'Washington State'): 1.0,
-        
-        # Add more Tier 1 rivalries as needed
-    }
-    
-    # Check if this is a Tier 1 rivalry (order doesn't matter)
-    rivalry_pair = tuple(sorted([team_name, opponent_name]))
-    for (team_a, team_b), bonus in major_rivalries.items():
-        if rivalry_pair == tuple(sorted([team_a, team_b])):
-            return bonus
-    
-    # Default rivalry bonus for other rivalries
-    return 0.6  # Standard rivalry bonus
+    return TEAM_DIRECTORY.rivalry_bonus(team_name, opponent_name)
 
-def calculate_victory_value_with_rivalry(game, team_name):
+def calculate_victory_value_with_rivalry(game, team_name, quality_table=None):
     """
     Calculate victory value with special FCS penalty
+    Pass quality_table (from the ranking state) to skip the per-call quality lookup.
     """
     if game['result'] != 'W':
         return 0.0
@@ -1294,7 +1327,10 @@ def calculate_victory_value_with_rivalry(game, team_name):
     is_fcs_game = (opponent == 'FCS' or opponent.upper() == 'FCS')
     
     # 1. Base Opponent Quality (0.5 for FCS, 1-10 for others)
-    opponent_quality = get_current_opponent_quality(opponent)
+    if quality_table is not None:
+        opponent_quality = lookup_opponent_quality(opponent, quality_table)
+    else:
+        opponent_quality = get_current_opponent_quality(opponent)
     
     # 2. Location Multiplier (no bonus for FCS games)
     if is_fcs_game:
@@ -1365,10 +1401,7 @@ def get_team_logo_url(team_name, size='60'):
     Returns:
         str: URL path to logo, or None if team not found
     """
-    team_id = TEAM_LOGOS.get(team_name)
-    if team_id:
-        return f"/static/images/team-logos/{team_id}_{size}.png"
-    return None
+    return TEAM_DIRECTORY.logo_url(team_name, size)
     
 # All conferences organized
 CONFERENCES = {
@@ -1406,6 +1439,150 @@ P4_INDEPENDENT_TEAMS = ['Notre Dame']
 G6_INDEPENDENT_TEAMS = ['Connecticut']
 NONE_INDEPENDENT_TEAMS = ['FCS']
 
+# Rivalry bonus tiers: historic, intense rivalries (order doesn't matter)
+MAJOR_RIVALRY_BONUSES = {
+    # Tier 1: Historic, intense rivalries (1.0 bonus)
+    ('Alabama', 'Auburn'): 1.0,
+    ('Ohio State', 'Michigan'): 1.0,
+    ('Texas', 'Oklahoma'): 1.0,
+    ('Florida', 'Georgia'): 1.0,
+    ('USC', 'UCLA'): 1.0,
+    ('Army', 'Navy'): 1.0,
+    ('Florida State', 'Miami'): 1.0,
+    ('Clemson', 'South Carolina'): 1.0,
+    ('North Carolina', 'NC State'): 1.0,
+    ('Notre Dame', 'USC'): 1.0,
+    ('Virginia', 'Virginia Tech'): 1.0,
+    ('Stanford', 'California'): 1.0,
+    ('Oregon', 'Oregon State'): 1.0,
+    ('Washington', 'Washington State'): 1.0,
+    
+    # Add more Tier 1 rivalries as needed
+}
+
+# Time zone mappings for travel adjustments
+PACIFIC_TEAMS = ['Stanford', 'California', 'UCLA', 'USC', 'Oregon', 'Oregon State', 
+                 'Washington', 'Washington State', 'San Diego State', 'San Jose State',
+                 'Fresno State', 'Hawaii', 'Nevada', 'UNLV']
+
+MOUNTAIN_TEAMS = ['Colorado', 'Utah', 'Arizona', 'Arizona State', 'Boise State',
+                  'Colorado State', 'New Mexico', 'Utah State', 'Wyoming', 'Air Force']
+
+CENTRAL_TEAMS = ['Texas', 'Oklahoma', 'Texas A&M', 'LSU', 'Arkansas', 'Missouri',
+                 'Texas Tech', 'Oklahoma State', 'TCU', 'Baylor', 'Houston',
+                 'Kansas', 'Kansas State', 'Iowa State', 'Nebraska', 'Iowa',
+                 'Minnesota', 'Wisconsin', 'Illinois', 'Northwestern']
+
+EASTERN_TEAMS = ['Florida', 'Georgia', 'Alabama', 'Auburn', 'Tennessee', 'Kentucky',
+                 'South Carolina', 'Vanderbilt', 'Mississippi State', 'Ole Miss',
+                 'Clemson', 'Florida State', 'Miami', 'North Carolina', 'NC State',
+                 'Duke', 'Wake Forest', 'Virginia', 'Virginia Tech', 'Pittsburgh',
+                 'Syracuse', 'Boston College', 'Louisville', 'Georgia Tech',
+                 'Ohio State', 'Michigan', 'Penn State', 'Michigan State',
+                 'Indiana', 'Purdue', 'Maryland', 'Rutgers']
+
+TIME_ZONE_ORDER = {'Pacific': 0, 'Mountain': 1, 'Central': 2, 'Eastern': 3}
+
+
+class TeamDirectory:
+    """
+    Frozen lookup tables for per-team facts used inside every per-game loop:
+    conference, P4/G6 tier, rivalries, time zone and logo.
+    Built once at import from CONFERENCES, RIVALRIES, TEAM_LOGOS and the time zone
+    tables - every lookup is a single dict/set probe.
+    """
+    
+    __slots__ = ('_conferences', '_p4_teams', '_g6_teams', '_rivalry_bonuses', '_time_zones', '_logos')
+    
+    def __init__(self, conferences, rivalries, major_rivalries, logos, time_zones,
+                 p4_conferences, g6_conferences, p4_independents, g6_independents):
+        team_conferences = {}
+        for conf_name, teams in conferences.items():
+            for team in teams:
+                team_conferences.setdefault(team, conf_name)  # First listing wins, like the old scan
+        
+        p4_teams = set(p4_independents)
+        g6_teams = set(g6_independents)
+        for team, conf_name in team_conferences.items():
+            if conf_name in p4_conferences:
+                p4_teams.add(team)
+            if conf_name in g6_conferences:
+                g6_teams.add(team)
+        
+        major_bonuses = {frozenset(pair): bonus for pair, bonus in major_rivalries.items()}
+        rivalry_bonuses = {}
+        for team, rivals in rivalries.items():
+            for rival in rivals:
+                pair = frozenset((team, rival))
+                rivalry_bonuses[pair] = major_bonuses.get(pair, 0.6)  # Standard rivalry bonus
+        
+        team_time_zones = {}
+        for zone, teams in time_zones.items():
+            for team in teams:
+                team_time_zones.setdefault(team, zone)
+        
+        object.__setattr__(self, '_conferences', MappingProxyType(team_conferences))
+        object.__setattr__(self, '_p4_teams', frozenset(p4_teams))
+        object.__setattr__(self, '_g6_teams', frozenset(g6_teams))
+        object.__setattr__(self, '_rivalry_bonuses', MappingProxyType(rivalry_bonuses))
+        object.__setattr__(self, '_time_zones', MappingProxyType(team_time_zones))
+        object.__setattr__(self, '_logos', MappingProxyType(dict(logos)))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError('TeamDirectory is read-only')
+    
+    def conference(self, team_name):
+        return self._conferences.get(team_name, 'Unknown')
+    
+    def tier(self, team_name):
+        """'P4', 'G6' or 'None' (same as get_auto_game_type)"""
+        if team_name in self._p4_teams:
+            return 'P4'
+        elif team_name in self._g6_teams:
+            return 'G6'
+        return 'None'
+    
+    def is_p4(self, team_name):
+        return team_name in self._p4_teams
+    
+    def is_g6(self, team_name):
+        return team_name in self._g6_teams
+    
+    def is_rivalry(self, team_name, opponent_name):
+        return frozenset((team_name, opponent_name)) in self._rivalry_bonuses
+    
+    def rivalry_bonus(self, team_name, opponent_name):
+        return self._rivalry_bonuses.get(frozenset((team_name, opponent_name)), 0.0)
+    
+    def time_zone(self, team_name):
+        return self._time_zones.get(team_name, 'Central')  # Default
+    
+    def zone_order(self, team_name):
+        return TIME_ZONE_ORDER[self.time_zone(team_name)]
+    
+    def logo_url(self, team_name, size='60'):
+        team_id = self._logos.get(team_name)
+        if team_id:
+            return f"/static/images/team-logos/{team_id}_{size}.png"
+        return None
+
+TEAM_DIRECTORY = TeamDirectory(
+    conferences=CONFERENCES,
+    rivalries=RIVALRIES,
+    major_rivalries=MAJOR_RIVALRY_BONUSES,
+    logos=TEAM_LOGOS,
+    time_zones={
+        'Pacific': PACIFIC_TEAMS,
+        'Mountain': MOUNTAIN_TEAMS,
+        'Central': CENTRAL_TEAMS,
+        'Eastern': EASTERN_TEAMS
+    },
+    p4_conferences=P4_CONFERENCES,
+    g6_conferences=G6_CONFERENCES,
+    p4_independents=P4_INDEPENDENT_TEAMS,
+    g6_independents=G6_INDEPENDENT_TEAMS
+)
+
 # In-memory storage for games and rankings
 games_data = []
 team_stats = defaultdict(lambda: {
@@ -1417,33 +1594,19 @@ team_stats = defaultdict(lambda: {
 
 def get_team_conference(team_name):
     """Get the conference for a given team"""
-    for conf_name, teams in CONFERENCES.items():
-        if team_name in teams:
-            return conf_name
-    return 'Unknown'
+    return TEAM_DIRECTORY.conference(team_name)
 
 def is_p4_team(team_name):
     """Determine if a team is P4"""
-    if team_name in P4_INDEPENDENT_TEAMS:
-        return True
-    conference = get_team_conference(team_name)
-    return conference in P4_CONFERENCES
+    return TEAM_DIRECTORY.is_p4(team_name)
 
 def is_G6_team(team_name):
     """Determine if a team is G6"""
-    if team_name in G6_INDEPENDENT_TEAMS:
-        return True
-    conference = get_team_conference(team_name)
-    return conference in G6_CONFERENCES
+    return TEAM_DIRECTORY.is_g6(team_name)
 
 def get_auto_game_type(team_name):
     """Get the automatic game type for a team"""
-    if is_p4_team(team_name):
-        return 'P4'
-    elif is_G6_team(team_name):
-        return 'G6'
-    else:
-        return 'None'
+    return TEAM_DIRECTORY.tier(team_name)
 
 # Admin credentials from environment variables
 ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME', 'testuser')
@@ -1475,6 +1638,259 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function        
 
+# ===============================================
+# REQUEST PERFORMANCE INSTRUMENTATION
+# ===============================================
+# Every request counts and times its SQL statements (cfb_performance engine events).
+# Admins see them on each response (X-DB-Queries / X-DB-Time / X-DB-Slowest) and
+# aggregated per route at /admin/perf. The same hooks feed the Prometheus metrics
+# at /metrics. Registered before the other request hooks so the timing wraps them.
+# PERF_QUERY_TRACKING=false turns the SQL tracking off.
+
+PERF_QUERY_TRACKING_ENABLED = os.environ.get('PERF_QUERY_TRACKING', 'true').lower() == 'true'
+route_performance = cfb_performance.RoutePerformanceTable()
+
+if PERF_QUERY_TRACKING_ENABLED:
+    cfb_performance.install_query_tracking()
+
+# /metrics is open to admins and these addresses/networks (comma separated; empty by default -
+# behind a reverse proxy every client connects from the proxy's address, often 127.0.0.1).
+# TRUSTED_PROXY_COUNT=N tells the app it runs behind N proxies that set X-Forwarded-For /
+# X-Forwarded-Proto: the client address is then taken from the Nth-from-last X-Forwarded-For
+# entry (werkzeug ProxyFix). Only set it when the proxy overwrites or appends these headers -
+# otherwise clients can claim any address.
+METRICS_ALLOWED_NETWORKS = [
+    ipaddress.ip_network(address.strip(), strict=False)
+    for address in os.environ.get('METRICS_ALLOWED_IPS', '').split(',') if address.strip()
+]
+TRUSTED_PROXY_COUNT = int(os.environ.get('TRUSTED_PROXY_COUNT', '0'))
+if TRUSTED_PROXY_COUNT > 0:
+    from werkzeug.middleware.proxy_fix import ProxyFix
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_COUNT, x_proto=TRUSTED_PROXY_COUNT)
+
+metrics = cfb_performance.MetricsRegistry()
+http_requests_total = metrics.counter(
+    'cfb_http_requests_total', 'HTTP requests by route, method and status code', ('route', 'method', 'status'))
+http_request_errors_total = metrics.counter(
+    'cfb_http_request_errors_total', 'HTTP requests that ended with a 5xx response', ('route', 'method'))
+http_requests_in_flight = metrics.gauge(
+    'cfb_http_requests_in_flight', 'HTTP requests currently being handled', ('route',))
+http_request_duration_seconds = metrics.histogram(
+    'cfb_http_request_duration_seconds', 'HTTP request latency in seconds', ('route', 'method'))
+cache_hits_total = metrics.counter('cfb_cache_hits_total', 'Cache lookups served from the cache', ('cache',))
+cache_misses_total = metrics.counter('cfb_cache_misses_total', 'Cache lookups that had to compute the value', ('cache',))
+cache_entries = metrics.gauge('cfb_cache_entries', 'Entries currently in the cache', ('cache',))
+cache_coalesced_total = metrics.counter(
+    'cfb_cache_coalesced_total', 'Cache misses served by a concurrent caller\'s computation', ('cache',))
+cache_evictions_total = metrics.counter(
+    'cfb_cache_evictions_total', 'Entries evicted to stay within the cache budgets', ('cache',))
+cache_bytes = metrics.gauge('cfb_cache_bytes', 'Estimated size of the cached values in bytes', ('cache',))
+cache_errors_total = metrics.counter(
+    'cfb_cache_errors_total', 'Shared cache backend failures (served as misses)', ('cache',))
+
+def collect_cache_metrics():
+    """Copy the caches' own hit/miss counters into the registry at scrape time"""
+    caches = [('performance_cache', performance_cache)]
+    if CFB_GEN_AI_ENABLED:
+        caches.append(('ai_response_cache', cfb_gen_ai.ai_response_cache))
+    for name, cache in caches:
+        stats = cache.stats()
+        cache_hits_total.set_total(stats['hits'], cache=name)
+        cache_misses_total.set_total(stats['misses'], cache=name)
+        cache_coalesced_total.set_total(stats['coalesced'], cache=name)
+        cache_evictions_total.set_total(stats['evictions'], cache=name)
+        cache_errors_total.set_total(stats['errors'], cache=name)
+        # Shared backends may not report sizes (redis keeps no byte count per prefix)
+        if stats['entries'] is not None:
+            cache_entries.set(stats['entries'], cache=name)
+        if stats['bytes'] is not None:
+            cache_bytes.set(stats['bytes'], cache=name)
+
+metrics.add_collector(collect_cache_metrics)
+
+# Admin-only request profiler: add ?profile=1 (or send X-Profile: 1) to any page
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(app.instance_path, 'profiles'))
+profile_store = cfb_performance.ProfileStore(
+    PROFILE_DIR,
+    max_profiles=int(os.environ.get('PROFILE_MAX_COUNT', '50')),
+    max_bytes=int(os.environ.get('PROFILE_MAX_MB', '100')) * 1024 * 1024
+)
+
+# Timing spans around the ranking modules, aggregated over a rolling window at
+# /admin/perf/ranking. RANKING_SPANS=false leaves only a no-op call per span.
+ranking_spans = cfb_performance.SpanRecorder(
+    enabled=os.environ.get('RANKING_SPANS', 'true').lower() == 'true',
+    window_seconds=int(os.environ.get('RANKING_SPAN_WINDOW_MINUTES', '15')) * 60
+)
+
+def profile_requested():
+    return request.args.get('profile') == '1' or request.headers.get('X-Profile') == '1'
+
+def metrics_client_allowed(remote_addr):
+    try:
+        address = ipaddress.ip_address(remote_addr or '')
+    except ValueError:
+        return False
+    return any(address in network for network in METRICS_ALLOWED_NETWORKS)
+
+@app.before_request
+def start_request_performance():
+    g._perf_start = time.perf_counter()
+    g._perf_route = request.endpoint or 'unmatched'
+    http_requests_in_flight.inc(route=g._perf_route)
+    if PERF_QUERY_TRACKING_ENABLED:
+        cfb_performance.start_request_stats()
+    if profile_requested() and is_admin():
+        try:
+            g._request_profile = cfb_performance.RequestProfile().start()
+        except ValueError as e:
+            g._request_profile_error = str(e)  # Another profiler is active in this process
+
+@app.after_request
+def record_request_performance(response):
+    if g.get('_perf_start') is None:
+        return response
+    stats = cfb_performance.stop_request_stats()
+    elapsed = time.perf_counter() - g._perf_start
+    route = g._perf_route
+    
+    http_requests_total.inc(route=route, method=request.method, status=response.status_code)
+    if response.status_code >= 500:
+        http_request_errors_total.inc(route=route, method=request.method)
+    http_request_duration_seconds.observe(elapsed, route=route, method=request.method)
+    route_performance.record(route, elapsed * 1000, stats, response.status_code)
+    
+    if stats is not None and is_admin():
+        response.headers['X-DB-Queries'] = str(stats.count)
+        response.headers['X-DB-Time'] = f"{stats.total_ms:.1f}ms"
+        response.headers['X-DB-Slowest'] = f"{stats.slowest_ms:.1f}ms"
+    
+    profile = g.pop('_request_profile', None)
+    if profile is not None:
+        try:
+            pstats_data, collapsed = profile.finish()
+            response.headers['X-Profile-Id'] = profile_store.save({
+                'method': request.method,
+                'path': request.full_path.rstrip('?'),
+                'endpoint': route,
+                'status': response.status_code,
+                'elapsed_ms': round(profile.elapsed_ms, 1),
+                'samples': profile.sampler.samples,
+                'queries': stats.count if stats is not None else None
+            }, pstats_data, collapsed)
+        except Exception as e:
+            print(f"Error saving request profile: {e}")
+    elif g.get('_request_profile_error'):
+        response.headers['X-Profile-Error'] = g._request_profile_error
+    return response
+
+@app.teardown_request
+def stop_request_performance(exc):
+    # Runs even when the request raised - never leave the thread tracking/profiling or the gauge up
+    cfb_performance.stop_request_stats()
+    profile = g.pop('_request_profile', None)
+    if profile is not None:
+        profile.finish()
+    route = g.pop('_perf_route', None)
+    if route is not None:
+        http_requests_in_flight.dec(route=route)
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus text format - admins and METRICS_ALLOWED_IPS only"""
+    if not (is_admin() or metrics_client_allowed(request.remote_addr)):
+        return 'Forbidden', 403
+    from flask import Response
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/admin/perf')
+@login_required
+def admin_perf():
+    """SQL queries and timing per route since the last reset, plus the cache counters (?format=json for raw data)"""
+    routes = route_performance.routes()
+    slowest = route_performance.slowest_statements()
+    if request.args.get('format') == 'json':
+        from flask import jsonify
+        return jsonify({'since': route_performance.since, 'routes': routes, 'slowest_statements': slowest,
+                        'cache': performance_cache.stats()})
+    return render_template('admin_perf.html',
+                           routes=routes,
+                           slowest_statements=slowest,
+                           cache_stats=get_cache_stats(),
+                           since=datetime.fromtimestamp(route_performance.since),
+                           tracking_enabled=PERF_QUERY_TRACKING_ENABLED)
+
+@app.route('/admin/perf/reset', methods=['POST'])
+@login_required
+def admin_perf_reset():
+    route_performance.reset()
+    flash('Performance counters reset', 'success')
+    return redirect(url_for('admin_perf'))
+
+@app.route('/admin/perf/ranking')
+@login_required
+def admin_perf_ranking():
+    """Ranking pipeline spans over the rolling window (?format=json for raw data)"""
+    groups = ranking_spans.summary()
+    if request.args.get('format') == 'json':
+        from flask import jsonify
+        return jsonify({'enabled': ranking_spans.enabled, 'window_seconds': ranking_spans.window_seconds,
+                        'groups': groups})
+    return render_template('admin_perf_ranking.html',
+                           groups=groups,
+                           enabled=ranking_spans.enabled,
+                           window_minutes=ranking_spans.window_seconds // 60)
+
+@app.route('/admin/perf/ranking/reset', methods=['POST'])
+@login_required
+def admin_perf_ranking_reset():
+    ranking_spans.reset()
+    flash('Ranking spans reset', 'success')
+    return redirect(url_for('admin_perf_ranking'))
+
+@app.route('/admin/perf/profiles')
+@app.route('/admin/perf/profiles/<profile_id>')
+@login_required
+def admin_perf_profiles(profile_id=None):
+    """Saved request profiles; with an id, that profile's top functions and hottest stacks"""
+    selected = None
+    if profile_id:
+        selected = profile_store.get(profile_id) if cfb_performance.PROFILE_ID_PATTERN.match(profile_id) else None
+        if selected is None:
+            flash(f'Profile {profile_id} not found', 'error')
+            return redirect(url_for('admin_perf_profiles'))
+        sort = request.args.get('sort', 'cumulative')
+        if sort not in ('cumulative', 'tottime', 'ncalls'):
+            sort = 'cumulative'
+        with open(profile_store.file_path(profile_id, 'collapsed')) as f:
+            hottest_stacks = [line.rsplit(' ', 1) for line in f.read().splitlines()[:25]]
+        selected = dict(selected, sort=sort, report=profile_store.top_functions(profile_id, sort=sort),
+                        hottest_stacks=hottest_stacks)
+    return render_template('admin_perf_profiles.html',
+                           profiles=profile_store.list(),
+                           selected=selected,
+                           profile_dir=PROFILE_DIR,
+                           max_profiles=profile_store.max_profiles)
+
+@app.route('/admin/perf/profiles/<profile_id>/<kind>')
+@login_required
+def admin_perf_profile_download(profile_id, kind):
+    from flask import send_file, abort
+    if kind not in cfb_performance.PROFILE_KINDS or not cfb_performance.PROFILE_ID_PATTERN.match(profile_id):
+        abort(404)
+    path = profile_store.file_path(profile_id, kind)
+    if not os.path.exists(path):
+        abort(404)
+    return send_file(path, as_attachment=True, download_name=os.path.basename(path))
+
+@app.route('/admin/perf/profiles/<profile_id>/delete', methods=['POST'])
+@login_required
+def admin_perf_profile_delete(profile_id):
+    if cfb_performance.PROFILE_ID_PATTERN.match(profile_id):
+        profile_store.delete(profile_id)
+        flash(f'Profile {profile_id} deleted', 'success')
+    return redirect(url_for('admin_perf_profiles'))
+
 # Data persistence functions
 def save_data():
     """Database auto-saves, so this function now does nothing"""
@@ -1503,9 +1919,8 @@ def get_team_stats_dict():
         'games': []
     })
     
-    team_stats_records = TeamStats.query.all()
-    for record in team_stats_records:
-        stats_dict[record.team_name] = record.to_dict()
+    # One TeamGame query for the migrated game logs, not one per team
+    stats_dict.update(TeamStats.to_dicts(TeamStats.query.all()))
     
     return stats_dict
 
@@ -1685,16 +2100,15 @@ CONFERENCE_STRENGTH_MULTIPLIERS = {
     'Independent': 1.0      # Varies by team (Notre Dame vs UConn)
 }
 
-def calculate_all_basic_team_strengths():
+def calculate_all_basic_team_strengths(season_data=None):
     """Pre-calculate basic strength ratings for all teams to avoid recursion"""
     basic_strengths = {}
     
-    # Get all teams from database
-    all_teams = TeamStats.query.all()
+    # Without a preloaded season, reuse the table built for the current data revision
+    if season_data is None:
+        return dict(get_opponent_quality_state()['basic_strengths'])
     
-    for team_record in all_teams:
-        team_name = team_record.team_name
-        stats = team_record.to_dict()
+    for team_name, stats in season_data.items():
         total_games = stats['wins'] + stats['losses']
         
         if total_games == 0:
@@ -1705,6 +2119,96 @@ def calculate_all_basic_team_strengths():
     
     return basic_strengths
 
+def solve_iterative_team_strengths(season_data, max_iterations=100, tolerance=1e-6):
+    """
+    Opponent-adjusted strength for every team, iterated to a fixed point.
+    Same formula as calculate_team_base_strength, but opponents are rated with the
+    solved strengths instead of one-level win-percentage proxies:
+        s_i = (2 + 4 * win_pct_i) + mean over games of w_g * (s_opp - 5)
+    with w_g = 0.3 * min(1, margin / 14) for wins and 0.4 * min(1, margin / 21) for losses.
+    Every weight is <= 0.4, so the Jacobi iteration is a contraction and converges
+    geometrically on any game graph (FBS only or the full FBS+FCS graph). The early
+    season P4 floor / G6 ceiling are applied every iteration (clamping keeps it a
+    contraction), so opponents are rated with the bounded strengths too.
+    Returns {'strengths', 'iterations', 'converged', 'residual', 'elapsed_ms'}
+    """
+    start_time = time.perf_counter()
+    
+    # Sparse game graph: base score and (opponent index, weight) edges per team
+    teams = list(season_data.keys())
+    team_index = {team_name: i for i, team_name in enumerate(teams)}
+    base_scores = []
+    edges = []
+    bounds = []
+    for team_name in teams:
+        stats = season_data[team_name]
+        total_games = stats['wins'] + stats['losses']
+        team_edges = []
+        if total_games == 0:
+            base_scores.append(5.0)
+            edges.append(team_edges)
+            bounds.append((float('-inf'), float('inf')))
+            continue
+        
+        base_scores.append(2.0 + (stats['wins'] / total_games * 4.0))
+        bounds.append(get_early_season_strength_bounds(team_name, total_games))
+        for game in stats['games']:
+            opponent = game['opponent']
+            if opponent not in team_index or opponent == team_name:
+                continue
+            margin = abs(game['team_score'] - game['opp_score'])
+            if game['result'] == 'W':
+                weight = 0.3 * min(1.0, margin / 14.0)
+            else:
+                weight = 0.4 * min(1.0, margin / 21.0)
+            team_edges.append((team_index[opponent], weight))
+        edges.append(team_edges)
+    
+    strengths = list(base_scores)
+    iterations = 0
+    residual = 0.0
+    converged = False
+    
+    while iterations < max_iterations:
+        iterations += 1
+        next_strengths = [
+            min(max(base + sum(weight * (strengths[o] - 5.0) for o, weight in team_edges) / len(team_edges)
+                    if team_edges else base, floor), ceiling)
+            for base, team_edges, (floor, ceiling) in zip(base_scores, edges, bounds)
+        ]
+        residual = max((abs(a - b) for a, b in zip(next_strengths, strengths)), default=0.0)
+        strengths = next_strengths
+        if residual < tolerance:
+            converged = True
+            break
+    
+    return {
+        'strengths': {team_name: max(1.0, min(10.0, value)) for team_name, value in zip(teams, strengths)},
+        'iterations': iterations,
+        'converged': converged,
+        'residual': residual,
+        'elapsed_ms': round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+def calculate_all_iterative_team_strengths(season_data=None):
+    """Alternative to calculate_all_basic_team_strengths using the fixed-point solver"""
+    if season_data is None:
+        return dict(get_iterative_strength_solve()['strengths'])
+    
+    solve = solve_iterative_team_strengths(season_data)
+    print(f"⏱️ Strength solver: {solve['iterations']} iterations, {solve['elapsed_ms']} ms "
+          f"(converged: {solve['converged']})")
+    return solve['strengths']
+
+# Opponent strength model feeding the opponent quality table: 'basic' or 'iterative'
+OPPONENT_STRENGTH_MODEL = os.environ.get('OPPONENT_STRENGTH_MODEL', 'basic').lower()
+
+def calculate_opponent_strengths(season_data):
+    """Opponent strengths for the configured OPPONENT_STRENGTH_MODEL"""
+    if OPPONENT_STRENGTH_MODEL == 'iterative':
+        return calculate_all_iterative_team_strengths(season_data)
+    return calculate_all_basic_team_strengths(season_data)
+
 def get_enhanced_opponent_quality(opponent_name):
     """Enhanced opponent quality WITHOUT conference strength multipliers"""
     
@@ -1712,6 +2216,9 @@ def get_enhanced_opponent_quality(opponent_name):
     if opponent_name == 'FCS' or opponent_name.upper() == 'FCS':
         return 0.5
     
+    # The in-memory team_stats is never loaded, so every FBS opponent rates 1.5 here.
+    # The enhanced ranking is tuned to that; switching it to the shared opponent
+    # quality table changes rankings and is a separate formula change.
     if opponent_name not in team_stats:
         return 1.5
     
@@ -1731,7 +2238,7 @@ def get_enhanced_opponent_quality(opponent_name):
     
     return max(1.0, min(10.0, base_strength))
 
-def calculate_team_base_strength(team_name, basic_strengths_cache=None):
+def calculate_team_base_strength(team_name, basic_strengths_cache=None, team_data=None):
     """
     Calculate a team's base strength using pre-computed basic strengths to avoid recursion.
     Returns value between 1-10 (10 = elite, 5 = average, 1 = terrible)
@@ -1740,11 +2247,12 @@ def calculate_team_base_strength(team_name, basic_strengths_cache=None):
     if basic_strengths_cache is None:
         basic_strengths_cache = calculate_all_basic_team_strengths()
     
-    team_record = TeamStats.query.filter_by(team_name=team_name).first()
-    if not team_record:
-        return 5.0
+    if team_data is None:
+        team_data = get_opponent_quality_state()['season_data'].get(team_name)
+        if not team_data:
+            return 5.0
     
-    stats = team_record.to_dict()
+    stats = team_data
     total_games = stats['wins'] + stats['losses']
     
     if total_games == 0:
@@ -1787,16 +2295,23 @@ def calculate_team_base_strength(team_name, basic_strengths_cache=None):
         team_conf = get_team_conference(team_name)
         print(f"EARLY SEASON ADJUSTMENT: {team_name} ({team_conf}) - games: {total_games}, final_strength: {final_strength}")
         
-        
-        if team_conf in P4_CONFERENCES:
-            # P4 teams get quality floor - prevent 0-1 P4 teams from rating too low
-            final_strength = max(final_strength, 4.0)
-        elif team_conf in G6_CONFERENCES:
-            # G6 teams get quality ceiling - prevent 1-0 G6 teams from rating too high  
-            final_strength = min(final_strength, 6.5)
+        floor, ceiling = get_early_season_strength_bounds(team_name, total_games)
+        final_strength = min(max(final_strength, floor), ceiling)
 
     return max(1.0, min(10.0, final_strength))
 
+def get_early_season_strength_bounds(team_name, total_games):
+    """(floor, ceiling) on a team's strength through its first 3 games - shared by both strength models"""
+    if total_games <= 3:
+        team_conf = get_team_conference(team_name)
+        if team_conf in P4_CONFERENCES:
+            # P4 teams get quality floor - prevent 0-1 P4 teams from rating too low
+            return 4.0, float('inf')
+        if team_conf in G6_CONFERENCES:
+            # G6 teams get quality ceiling - prevent 1-0 G6 teams from rating too high
+            return float('-inf'), 6.5
+    return float('-inf'), float('inf')
+
 def get_current_opponent_quality(opponent_name):
     """Get current quality rating for an opponent (1-10 scale) with FCS independence"""
     
@@ -1804,18 +2319,15 @@ def get_current_opponent_quality(opponent_name):
     if opponent_name == 'FCS' or opponent_name.upper() == 'FCS':
         return 0.5  # Fixed quality - never changes regardless of FCS "record"
     
-    # Handle other non-FBS opponents
-    opponent_record = TeamStats.query.filter_by(team_name=opponent_name).first()  # 
-    if not opponent_record:  # 
-        return 1.5  # Lower default for unknown opponents
-    
-    # Use cached basic strengths to avoid recursion
-    basic_strengths_cache = calculate_all_basic_team_strengths()
-    base_strength = calculate_team_base_strength(opponent_name, basic_strengths_cache)
+    # Unknown opponents fall back to 1.5 inside the lookup
+    return lookup_opponent_quality(opponent_name, get_opponent_quality_state()['qualities'])
+
+def calculate_opponent_quality_from_stats(opponent_name, opponent_stats, basic_strengths_cache):
+    """Opponent quality (1-10 scale) from already-loaded stats - no database access"""
+    base_strength = calculate_team_base_strength(opponent_name, basic_strengths_cache, opponent_stats)
     
     # Adjust for recent form (last 4 games) - only for real teams
-    opponent_stats = opponent_record.to_dict()  # 
-    recent_games = opponent_stats['games'][-4:]  # 
+    recent_games = opponent_stats['games'][-4:]
     if len(recent_games) >= 2:
         recent_wins = sum(1 for g in recent_games if g['result'] == 'W')
         recent_form_bonus = (recent_wins / len(recent_games) - 0.5) * 1.0
@@ -1823,6 +2335,12 @@ def get_current_opponent_quality(opponent_name):
     
     return max(1.0, min(10.0, base_strength))
 
+def lookup_opponent_quality(opponent_name, quality_table):
+    """Read an opponent's quality from a pre-built table (same defaults as get_current_opponent_quality)"""
+    if opponent_name == 'FCS' or opponent_name.upper() == 'FCS':
+        return 0.5
+    return quality_table.get(opponent_name, 1.5)
+
 # ===============================================
 # MODULE 2: ENHANCED VICTORY VALUE CALCULATOR  
 # ===============================================
@@ -2481,13 +2999,14 @@ def get_temporal_weight_by_week(week):
     
     return week_weights.get(str(week), 1.0)
 
-def calculate_enhanced_temporal_adjustment(team_name):
+def calculate_enhanced_temporal_adjustment(team_name, games=None):
     """Enhanced temporal adjustment with early season consideration"""
-    team_stats_record = TeamStats.query.filter_by(team_name=team_name).first()
-    if not team_stats_record:
-        return 0
-    
-    games = team_stats_record.to_dict()['games']
+    if games is None:
+        team_stats_record = TeamStats.query.filter_by(team_name=team_name).first()
+        if not team_stats_record:
+            return 0
+        
+        games = team_stats_record.to_dict()['games']
     if len(games) < 4:
         return 0
     
@@ -2614,25 +3133,29 @@ def calculate_temporal_adjustment(team_name):
 # MODULE 5: CONSISTENCY ANALYZER
 # ===============================================
 
-def calculate_consistency_factor(team_name):
+def calculate_consistency_factor(team_name, games=None, quality_table=None):
     """
     Measure team consistency/reliability - DATABASE VERSION
     Returns adjustment based on performance variance (-0.6 to +0.5 range).
     """
-    # Get team stats from database
-    team_stats_record = TeamStats.query.filter_by(team_name=team_name).first()
-    
-    if not team_stats_record:
-        return 0
-    
-    games = team_stats_record.to_dict()['games']
+    # Get team stats from database (unless the caller already loaded them)
+    if games is None:
+        team_stats_record = TeamStats.query.filter_by(team_name=team_name).first()
+        
+        if not team_stats_record:
+            return 0
+        
+        games = team_stats_record.to_dict()['games']
     if len(games) < 4:
         return 0  # Need multiple games for consistency analysis
     
     # Calculate game-by-game performance scores
     performance_scores = []
     for game in games:
-        opponent_quality = get_current_opponent_quality(game['opponent'])
+        if quality_table is not None:
+            opponent_quality = lookup_opponent_quality(game['opponent'], quality_table)
+        else:
+            opponent_quality = get_current_opponent_quality(game['opponent'])
         margin = game['team_score'] - game['opp_score']
         
         # Expected margin based on opponent quality (rough approximation)
@@ -2670,15 +3193,27 @@ def calculate_consistency_factor(team_name):
 # MODULE 6: ENHANCED FINAL RANKING COMPOSER
 # ===============================================
 
-def calculate_enhanced_scientific_ranking(team_name):
+@ranking_spans.timed('enhanced_ranking.total')
+def calculate_enhanced_scientific_ranking(team_name, season_data=None, quality_table=None):
     """
     Enhanced scientific ranking with all new modules
+    
+    Pass season_data/quality_table from the season ranking engine to rank
+    without touching the database; otherwise the season is loaded once here.
     """
-    team_stats_record = TeamStats.query.filter_by(team_name=team_name).first()
-    if not team_stats_record:
+    if season_data is None:
+        state = get_opponent_quality_state()
+        season_data = state['season_data']
+        if quality_table is None:
+            quality_table = state['qualities']
+    if quality_table is None:
+        quality_table = build_opponent_quality_table(season_data)
+    
+    stats = season_data.get(team_name)
+    if not stats:
         return create_default_ranking_result()
     
-    stats = team_stats_record.to_dict()
+    games = stats['games']
     total_games = stats['wins'] + stats['losses']
     
     if total_games == 0:
@@ -2687,40 +3222,46 @@ def calculate_enhanced_scientific_ranking(team_name):
     # COMPONENT 1: Enhanced Victory Value
     victory_value = 0
     victory_details = []
-    for game in stats['games']:
-        if game['result'] == 'W':
-            value = calculate_enhanced_victory_value(game, team_name)
-            victory_value += value
-            victory_details.append({
-                'opponent': game['opponent'],
-                'value': value,
-                'week': game.get('week', '1')
-            })
+    with ranking_spans.span('enhanced_ranking.victory_value'):
+        for game in stats['games']:
+            if game['result'] == 'W':
+                value = calculate_enhanced_victory_value(game, team_name)
+                victory_value += value
+                victory_details.append({
+                    'opponent': game['opponent'],
+                    'value': value,
+                    'week': game.get('week', '1')
+                })
     
     # COMPONENT 2: Enhanced Loss Penalties
     loss_penalty = 0
     loss_details = []
-    for game in stats['games']:
-        if game['result'] == 'L':
-            penalty = calculate_enhanced_loss_penalty(game, team_name)
-            loss_penalty += penalty
-            loss_details.append({
-                'opponent': game['opponent'],
-                'penalty': penalty,
-                'week': game.get('week', '1')
-            })
+    with ranking_spans.span('enhanced_ranking.loss_penalty'):
+        for game in stats['games']:
+            if game['result'] == 'L':
+                penalty = calculate_enhanced_loss_penalty(game, team_name)
+                loss_penalty += penalty
+                loss_details.append({
+                    'opponent': game['opponent'],
+                    'penalty': penalty,
+                    'week': game.get('week', '1')
+                })
     
     # COMPONENT 3: Enhanced Temporal Adjustment
-    temporal_adj = calculate_enhanced_temporal_adjustment(team_name)
+    with ranking_spans.span('enhanced_ranking.temporal_adjustment'):
+        temporal_adj = calculate_enhanced_temporal_adjustment(team_name, games)
     
     # COMPONENT 4: Consistency Factor (existing)
-    consistency_factor = calculate_consistency_factor(team_name)
+    with ranking_spans.span('enhanced_ranking.consistency'):
+        consistency_factor = calculate_consistency_factor(team_name, games, quality_table)
     
     # COMPONENT 5: Schedule Quality Penalty (NEW)
-    schedule_penalty = calculate_schedule_quality_penalty(team_name)
+    with ranking_spans.span('enhanced_ranking.schedule_penalty'):
+        schedule_penalty = calculate_schedule_quality_penalty(team_name, games)
 
     # COMPONENT 5B: Schedule Manipulation Penalties
-    manipulation_flags = detect_schedule_manipulation(team_name)
+    with ranking_spans.span('enhanced_ranking.manipulation_detection'):
+        manipulation_flags = detect_schedule_manipulation(team_name, games)
     manipulation_penalty = 0
     for flag in manipulation_flags:
         manipulation_penalty += SCHEDULE_MANIPULATION_PENALTIES.get(flag, 0)
@@ -2729,7 +3270,8 @@ def calculate_enhanced_scientific_ranking(team_name):
     games_bonus = min(2.5, total_games * 0.18)  # Slightly enhanced
     
     # COMPONENT 7: Strength of Schedule Rating (NEW)
-    sos_rating = calculate_strength_of_schedule_rating(team_name)
+    with ranking_spans.span('enhanced_ranking.sos'):
+        sos_rating = calculate_strength_of_schedule_rating(team_name, games)
     sos_bonus = (sos_rating - 5.0) * 0.3  # Bonus/penalty for strong/weak schedules
     
     # Conference Multiplier (existing)
@@ -2774,7 +3316,7 @@ def calculate_enhanced_scientific_ranking(team_name):
         },
         'schedule_analysis': {
             'strength_rating': sos_rating,
-            'manipulation_flags': detect_schedule_manipulation(team_name)
+            'manipulation_flags': manipulation_flags
         }
     }
 
@@ -2807,211 +3349,1569 @@ def create_default_ranking_result():
     }
 
 
-# Add these new functions near your other calculation functions
-# (around where calculate_comprehensive_stats, calculate_victory_value, etc. are)
+# ===============================================
+# MODULE 6B: SEASON RANKING ENGINE
+# ===============================================
+
+def load_season_team_data():
+    """Load every TeamStats row in ONE query (plus one for migrated game logs) -> {team_name: stats dict}"""
+    return TeamStats.to_dicts(TeamStats.query.all())
+
+def build_opponent_quality_table(season_data, basic_strengths=None):
+    """Opponent quality (same scale as get_current_opponent_quality) for every team in the season"""
+    if basic_strengths is None:
+        basic_strengths = calculate_opponent_strengths(season_data)
+    return {
+        team_name: calculate_opponent_quality_from_stats(team_name, stats, basic_strengths)
+        for team_name, stats in season_data.items()
+    }
+
+def calculate_season_enhanced_rankings(team_names=None, season_data=None, quality_table=None):
+    """
+    Enhanced scientific ranking for many teams in a single pass.
+    The season is loaded once and every component (victory value, loss penalty,
+    temporal, consistency, SOS, manipulation flags) reads from memory.
+    Returns {team_name: enhanced ranking result}
+    """
+    if season_data is None and quality_table is None:
+        # Shared per-revision table, kept current incrementally
+        ranking_table = get_enhanced_ranking_table()
+        if team_names is None:
+            return dict(ranking_table)
+        return {
+            team_name: ranking_table.get(team_name) or create_default_ranking_result()
+            for team_name in team_names
+        }
+    if season_data is None:
+        season_data = get_opponent_quality_state()['season_data']
+    if quality_table is None:
+        quality_table = build_opponent_quality_table(season_data)
+    
+    if team_names is None:
+        team_names = list(season_data.keys())
+    
+    return {
+        team_name: calculate_enhanced_scientific_ranking(team_name, season_data, quality_table)
+        for team_name in team_names
+    }
+
+
+# Ranking state shared by every caller: season data, opponent strengths/qualities and
+# ranking tables. Rebuilt per data revision - incrementally when only a few teams changed.
+SEASON_REVISION_ROW_ID = 1
+_season_revision_table_ready = False
+# Revisions this process bumped -> frozenset of the teams whose results changed (None: unknown).
+# The ranking state updates incrementally only across revisions all recorded here; a revision
+# bumped by another worker (or without team names) means a full rebuild.
+_local_revision_changes = {}
+_opponent_quality_state = {
+    'revision': None,
+    'season_data': {},
+    'played_by': {},
+    'basic_strengths': {},
+    'strength_solve': None,
+    'qualities': {},
+    'bulk_stats': None,
+    'enhanced_rankings': None,
+    'last_update': None
+}
+_opponent_quality_lock = threading.Lock()
+
+def ensure_season_revision_table():
+    """Create cfb_season_revision and its single row on first use (existing databases predate it)"""
+    global _season_revision_table_ready
+    if _season_revision_table_ready:
+        return
+    create_table_if_missing(SeasonRevision.__table__)
+    if db.session.get(SeasonRevision, SEASON_REVISION_ROW_ID) is None:
+        try:
+            db.session.add(SeasonRevision(id=SEASON_REVISION_ROW_ID, revision=0))
+            db.session.commit()
+        except Exception:
+            # Another worker inserted the row first
+            db.session.rollback()
+    _season_revision_table_ready = True
+
+def bump_season_data_revision(changed_teams=None):
+    """
+    Record a write to the season data - call after committing it.
+    Derived tables and caches keyed on the revision rebuild on next use, in every worker.
+    changed_teams names every team whose results the write changed (lets this process
+    update its ranking state incrementally); () when no team's results changed (schedule
+    only); None when unknown, which forces a full rebuild.
+    """
+    ensure_season_revision_table()
+    revision = None
+    try:
+        SeasonRevision.query.filter_by(id=SEASON_REVISION_ROW_ID).update(
+            {SeasonRevision.revision: SeasonRevision.revision + 1, SeasonRevision.updated_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        # Read back inside the same transaction - the row is locked, so this is our bump
+        revision = db.session.query(SeasonRevision.revision).filter(SeasonRevision.id == SEASON_REVISION_ROW_ID).scalar()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        revision = None
+        print(f"❌ Season revision not bumped - cached rankings may be stale until the next write: {e}")
+    if revision is not None:
+        _local_revision_changes[revision] = frozenset(changed_teams) if changed_teams is not None else None
+    if has_request_context():
+        # Re-read the revision after this write and re-materialize once the request is done
+        g.pop('_season_revision', None)
+        g._ranking_results_stale = True
+
+def get_season_data_revision():
+    """
+    Current season revision (SeasonRevision.revision).
+    Read once per request - and again after a bump in it - so writes made by
+    other workers are picked up on their next request.
+    """
+    revision = g.get('_season_revision') if has_request_context() else None
+    if revision is None:
+        ensure_season_revision_table()
+        revision = db.session.query(SeasonRevision.revision).filter(
+            SeasonRevision.id == SEASON_REVISION_ROW_ID
+        ).scalar() or 0
+        if has_request_context():
+            g._season_revision = revision
+    return revision
+
+def record_team_results_changed(*team_names):
+    """Bump the revision, noting which teams' results changed so the ranking state can update just their neighborhood"""
+    bump_season_data_revision(team_names)
+
+def build_played_by_index(season_data):
+    """{team: frozenset of teams that list it as an opponent} - reverse edges of the game graph"""
+    played_by = defaultdict(set)
+    for team_name, stats in season_data.items():
+        for game in stats['games']:
+            played_by[game['opponent']].add(team_name)
+    return {team_name: frozenset(teams) for team_name, teams in played_by.items()}
+
+def load_ranking_state_tables():
+    """Full rebuild: every TeamStats row in one query, then all derived tables"""
+    records = TeamStats.query.all()
+    season_data = TeamStats.to_dicts(records)
+    
+    basic_strengths = calculate_all_basic_team_strengths(season_data)
+    strength_solve = None
+    if OPPONENT_STRENGTH_MODEL == 'iterative':
+        strength_solve = solve_iterative_team_strengths(season_data)
+        qualities = build_opponent_quality_table(season_data, strength_solve['strengths'])
+    else:
+        qualities = build_opponent_quality_table(season_data, basic_strengths)
+    
+    return {
+        'season_data': season_data,
+        'played_by': build_played_by_index(season_data),
+        'basic_strengths': basic_strengths,
+        'strength_solve': strength_solve,
+        'qualities': qualities,
+        'bulk_stats': None,
+        'enhanced_rankings': None
+    }
+
+def apply_incremental_ranking_update(state, revision):
+    """
+    Update the ranking state for the teams whose results changed.
+    A new or removed game changes the two teams' records, which changes the
+    opponent quality of everyone they played, which changes the rankings of
+    everyone who played those teams - so only changed teams, their opponents
+    and their opponents' opponents are recomputed.
+    Returns the update summary, or None when a full rebuild is required.
+    """
+    start_time = time.perf_counter()
+    season_data = state['season_data']
+    
+    # The iterative strength model couples every team - no local update possible
+    if state['revision'] is None or revision <= state['revision'] or OPPONENT_STRENGTH_MODEL != 'basic':
+        return None
+    
+    # Every revision since the last build must be a write this process recorded with its teams
+    steps = [_local_revision_changes.get(step) for step in range(state['revision'] + 1, revision + 1)]
+    if any(step is None for step in steps):
+        return None  # Written by another worker, or without team names
+    records = TeamStats.query.filter(TeamStats.team_name.in_(frozenset().union(*steps))).all()
+    changed = TeamStats.to_dicts(records)
+    
+    team_count = db.session.query(func.count(TeamStats.id)).scalar()
+    if team_count != len(season_data) or any(name not in season_data for name in changed):
+        return None  # Teams added or removed
+    if len(changed) * 2 > len(season_data):
+        return None  # Most of the season changed - a full rebuild is cheaper
+    
+    # Copy-on-write: callers may still hold the previous tables
+    new_season_data = dict(season_data)
+    new_season_data.update(changed)
+    
+    played_by = dict(state['played_by'])
+    neighbors = defaultdict(set)  # team -> teams listing it before OR after the change
+    for team_name in changed:
+        old_opponents = {game['opponent'] for game in season_data[team_name]['games']}
+        new_opponents = {game['opponent'] for game in changed[team_name]['games']}
+        for opponent in old_opponents - new_opponents:
+            played_by[opponent] = played_by.get(opponent, frozenset()) - {team_name}
+            neighbors[opponent].add(team_name)
+        for opponent in new_opponents - old_opponents:
+            played_by[opponent] = played_by.get(opponent, frozenset()) | {team_name}
+    
+    def listed_by(team_name):
+        return played_by.get(team_name, frozenset()) | neighbors.get(team_name, set())
+    
+    basic_strengths = dict(state['basic_strengths'])
+    basic_strengths.update(calculate_all_basic_team_strengths(changed))
+    
+    # Level 1: opponent quality uses the team's record and its opponents' basic strengths
+    quality_teams = set(changed)
+    for team_name in changed:
+        quality_teams |= listed_by(team_name)
+    quality_teams &= new_season_data.keys()
+    qualities = dict(state['qualities'])
+    for team_name in quality_teams:
+        qualities[team_name] = calculate_opponent_quality_from_stats(
+            team_name, new_season_data[team_name], basic_strengths
+        )
+    
+    # Level 2: enhanced rankings read the qualities of each team's opponents
+    ranking_teams = set(quality_teams)
+    for team_name in quality_teams:
+        ranking_teams |= listed_by(team_name)
+    ranking_teams &= new_season_data.keys()
+    enhanced_rankings = state['enhanced_rankings']
+    if enhanced_rankings is not None:
+        enhanced_rankings = dict(enhanced_rankings)
+        for team_name in ranking_teams:
+            enhanced_rankings[team_name] = calculate_enhanced_scientific_ranking(team_name, new_season_data, qualities)
+    
+    # Bulk rankings read opponents' records directly (one level)
+    bulk_teams = set(changed)
+    for team_name in changed:
+        bulk_teams |= listed_by(team_name)
+    bulk_stats = state['bulk_stats']
+    if bulk_stats is not None:
+        team_lookup = get_bulk_team_lookup(new_season_data)
+        recomputed = {
+            stats['team']: stats
+            for stats in calculate_bulk_team_stats(team_lookup, [name for name in bulk_teams if name in team_lookup])
+        }
+        # Same order as a full build so ties sort identically
+        bulk_stats = {
+            team_name: recomputed.get(team_name) or bulk_stats[team_name]
+            for team_name in team_lookup
+        }
+    
+    state.update({
+        'season_data': new_season_data,
+        'played_by': played_by,
+        'basic_strengths': basic_strengths,
+        'strength_solve': None,
+        'qualities': qualities,
+        'bulk_stats': bulk_stats,
+        'enhanced_rankings': enhanced_rankings
+    })
+    return {
+        'mode': 'incremental',
+        'changed_teams': len(changed),
+        'quality_updates': len(quality_teams),
+        'ranking_updates': len(ranking_teams) if enhanced_rankings is not None else 0,
+        'bulk_updates': len(bulk_teams) if bulk_stats is not None else 0,
+        'elapsed_ms': round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+def get_opponent_quality_state():
+    """Season data, opponent strengths/qualities and ranking tables for the current data revision"""
+    revision = get_season_data_revision()
+    if _opponent_quality_state['revision'] != revision:
+        with _opponent_quality_lock:
+            if _opponent_quality_state['revision'] != revision:
+                update_summary = apply_incremental_ranking_update(_opponent_quality_state, revision)
+                if update_summary is None:
+                    start_time = time.perf_counter()
+                    _opponent_quality_state.update(load_ranking_state_tables())
+                    update_summary = {
+                        'mode': 'full',
+                        'teams': len(_opponent_quality_state['season_data']),
+                        'elapsed_ms': round((time.perf_counter() - start_time) * 1000, 3)
+                    }
+                update_summary['revision'] = revision
+                _opponent_quality_state['last_update'] = update_summary
+                _opponent_quality_state['revision'] = revision
+                for recorded in [step for step in _local_revision_changes if step <= revision]:
+                    _local_revision_changes.pop(recorded, None)
+    return _opponent_quality_state
+
+def get_iterative_strength_solve():
+    """Fixed-point strength solve for the current data revision (computed on first use)"""
+    state = get_opponent_quality_state()
+    if state['strength_solve'] is None:
+        with _opponent_quality_lock:
+            if state['strength_solve'] is None:
+                state['strength_solve'] = solve_iterative_team_strengths(state['season_data'])
+    return state['strength_solve']
+
+def get_enhanced_ranking_table():
+    """{team_name: enhanced ranking result} for the current data revision (computed on first use)"""
+    state = get_opponent_quality_state()
+    if state['enhanced_rankings'] is None:
+        with _opponent_quality_lock:
+            if state['enhanced_rankings'] is None:
+                season_data = state['season_data']
+                qualities = state['qualities']
+                state['enhanced_rankings'] = {
+                    team_name: calculate_enhanced_scientific_ranking(team_name, season_data, qualities)
+                    for team_name in season_data
+                }
+    return state['enhanced_rankings']
+
+def get_bulk_ranking_table():
+    """{team_name: bulk stats} for teams with games, current data revision (computed on first use)"""
+    with ranking_spans.span('bulk_rankings.season_state'):
+        state = get_opponent_quality_state()
+    if state['bulk_stats'] is None:
+        with _opponent_quality_lock:
+            if state['bulk_stats'] is None:
+                team_lookup = get_bulk_team_lookup(state['season_data'])
+                if CFB_VECTOR_RANKING_ENABLED:
+                    comprehensive_stats = calculate_bulk_team_stats_vectorized(team_lookup)
+                else:
+                    with ranking_spans.span('bulk_rankings.components'):
+                        comprehensive_stats = calculate_bulk_team_stats(team_lookup)
+                state['bulk_stats'] = {stats['team']: stats for stats in comprehensive_stats}
+    return state['bulk_stats']
+
+class RankingContext:
+    """
+    One ranking computation shared by every team-level page for a data revision:
+    bulk stats and rank order, enhanced components, opponent qualities and
+    per-game victory values. Use get_ranking_context() to obtain it.
+    """
+    
+    def __init__(self, state, bulk_table, enhanced_table):
+        self.revision = state['revision']
+        self.season_data = state['season_data']
+        self.qualities = state['qualities']
+        self.enhanced_table = enhanced_table
+        # Same order as get_all_team_stats_bulk (stable sort over the bulk table)
+        self.bulk_ranked = sorted(bulk_table.values(), key=lambda x: x['adjusted_total'], reverse=True)
+        self.bulk_ranks = {stats['team']: i + 1 for i, stats in enumerate(self.bulk_ranked)}
+        self._victory_values = {}
+        self._comprehensive_stats = {}
+    
+    @property
+    def total_teams_ranked(self):
+        return len(self.bulk_ranked)
+    
+    def team_stats(self, team_name):
+        """Raw TeamStats dict (or None when the team has no row)"""
+        return self.season_data.get(team_name)
+    
+    def ranked_teams(self):
+        """Bulk stats in rank order - copies, safe to annotate"""
+        return [dict(stats) for stats in self.bulk_ranked]
+    
+    def bulk_stats(self, team_name):
+        rank = self.bulk_ranks.get(team_name)
+        return dict(self.bulk_ranked[rank - 1]) if rank else None
+    
+    def rank(self, team_name):
+        """Position in the bulk rankings, or 'NR' for teams without games"""
+        return self.bulk_ranks.get(team_name, 'NR')
+    
+    def opponent_quality(self, opponent_name):
+        return lookup_opponent_quality(opponent_name, self.qualities)
+    
+    def enhanced_ranking(self, team_name):
+        return self.enhanced_table.get(team_name) or create_default_ranking_result()
+    
+    def victory_values(self, team_name):
+        """calculate_victory_value_with_rivalry for every game (0.0 for losses)"""
+        if team_name not in self._victory_values:
+            stats = self.season_data.get(team_name)
+            games = stats['games'] if stats else []
+            self._victory_values[team_name] = [
+                calculate_victory_value_with_rivalry(game, team_name, self.qualities) for game in games
+            ]
+        return self._victory_values[team_name]
+    
+    def comprehensive_stats(self, team_name):
+        """calculate_comprehensive_stats from memory"""
+        if team_name not in self._comprehensive_stats:
+            self._comprehensive_stats[team_name] = build_comprehensive_stats(
+                team_name, self.season_data, self.enhanced_ranking(team_name)
+            )
+        return dict(self._comprehensive_stats[team_name])
+
+
+_ranking_context = None
+
+def get_ranking_context():
+    """RankingContext for the current data revision (memoized per request and per revision)"""
+    global _ranking_context
+    context = getattr(g, '_ranking_context', None) if has_request_context() else None
+    if context is not None:
+        return context
+    
+    state = get_opponent_quality_state()
+    context = _ranking_context
+    if context is None or context.revision != state['revision']:
+        context = RankingContext(state, get_bulk_ranking_table(), get_enhanced_ranking_table())
+        _ranking_context = context
+    if has_request_context():
+        g._ranking_context = context
+    return context
+
+def verify_incremental_ranking_state():
+    """
+    Compare the (possibly incrementally updated) ranking state with a full recompute.
+    Returns {'consistent': bool, 'mismatches': [...], 'checked': {...}}
+    """
+    state = get_opponent_quality_state()
+    fresh = load_ranking_state_tables()
+    mismatches = []
+    
+    def compare(table_name, current, expected):
+        for team_name in set(current) | set(expected):
+            if current.get(team_name) != expected.get(team_name):
+                mismatches.append({'table': table_name, 'team': team_name})
+    
+    compare('season_data', state['season_data'], fresh['season_data'])
+    compare('basic_strengths', state['basic_strengths'], fresh['basic_strengths'])
+    compare('qualities', state['qualities'], fresh['qualities'])
+    checked = ['season_data', 'basic_strengths', 'qualities']
+    
+    if state['enhanced_rankings'] is not None:
+        compare('enhanced_rankings', state['enhanced_rankings'], {
+            team_name: calculate_enhanced_scientific_ranking(team_name, fresh['season_data'], fresh['qualities'])
+            for team_name in fresh['season_data']
+        })
+        checked.append('enhanced_rankings')
+    if state['bulk_stats'] is not None:
+        compare('bulk_stats', state['bulk_stats'], {
+            stats['team']: stats for stats in calculate_bulk_team_stats(get_bulk_team_lookup(fresh['season_data']))
+        })
+        checked.append('bulk_stats')
+    
+    return {
+        'consistent': not mismatches,
+        'mismatches': mismatches,
+        'checked': checked,
+        'last_update': state['last_update']
+    }
+
+
+# ===============================================
+# MATERIALIZED RANKINGS (cfb_ranking_results)
+# ===============================================
+# The bulk rankings are computed once per data revision - right after the request
+# that changed results - and stored in rank order. Public pages read them back
+# with one indexed query instead of redoing the ranking math.
 
+_ranking_result_table_ready = False
+_derived_table_lock = threading.Lock()
+
+def create_table_if_missing(table):
+    """
+    CREATE TABLE for a table newer than the database. Concurrent first requests (or
+    another worker) may create it between the check and the CREATE - that is fine.
+    """
+    with _derived_table_lock:
+        try:
+            table.create(db.engine, checkfirst=True)
+        except OperationalError:
+            if not sqlalchemy_inspect(db.engine).has_table(table.name):
+                raise
+
+def ensure_ranking_result_table():
+    """Create cfb_ranking_results on first use (existing databases predate the table)"""
+    global _ranking_result_table_ready
+    if not _ranking_result_table_ready:
+        create_table_if_missing(RankingResult.__table__)
+        _ranking_result_table_ready = True
+
+@app.before_request
+def ensure_derived_tables():
+    """
+    Create tables newer than the database before the request opens a transaction -
+    SQLite cannot run the DDL while the session holds its write lock (e.g. mid add_game)
+    """
+    if not (_team_game_table_ready and _ranking_result_table_ready and _season_revision_table_ready):
+        ensure_team_game_table()
+        ensure_ranking_result_table()
+        ensure_season_revision_table()
+
+def get_ranking_revision_key():
+    """Revision the materialized rankings are keyed by - the same in every worker"""
+    return f"r{get_season_data_revision()}"
+
+def load_ranking_results(revision_key=None):
+    """
+    Materialized rankings in rank order for revision_key, or for the most recently
+    completed revision when revision_key is None.
+    Returns (revision_key, computed_at, stats list) or None when nothing is stored.
+    """
+    ensure_ranking_result_table()
+    if revision_key is None:
+        latest = db.session.query(RankingResult.revision).order_by(RankingResult.id.desc()).first()
+        if latest is None:
+            return None
+        revision_key = latest[0]
+    rows = db.session.query(RankingResult.stats_json, RankingResult.computed_at).filter(
+        RankingResult.revision == revision_key
+    ).order_by(RankingResult.rank).all()
+    if not rows:
+        return None
+    return revision_key, rows[0][1], [json.loads(stats_json) for stats_json, _ in rows]
+
+ranking_compute_flight = cfb_cache.SingleFlight(CACHE_COALESCE_TIMEOUT)
+
+def parse_ranking_revision_key(revision_key):
+    """'r42' -> 42 (None for keys not written by get_ranking_revision_key)"""
+    try:
+        return int(revision_key[1:])
+    except (TypeError, ValueError):
+        return None
+
+def compute_ranked_team_stats():
+    """Bulk rankings for the current revision, in rank order - computed in memory, nothing is stored"""
+    bulk_table = get_bulk_ranking_table()
+    return sorted(
+        (dict(stats) for stats in bulk_table.values()), key=lambda x: x['adjusted_total'], reverse=True
+    )
+
+def materialize_ranking_results(revision_key=None):
+    """
+    Compute the bulk rankings for the current revision and store them, pruning older
+    revisions in the same transaction. Only the recompute worker, the post-write hook
+    and admin rebuilds call this - reads never write. A revision older than one already
+    stored (another worker got further) is not written. Returns the ranked stats
+    (same list get_all_team_stats_bulk returns).
+    """
+    ensure_ranking_result_table()
+    revision_key = revision_key or get_ranking_revision_key()
+    revision = parse_ranking_revision_key(revision_key)
+    
+    comprehensive_stats = compute_ranked_team_stats()
+    
+    try:
+        stored = [key for key, in db.session.query(RankingResult.revision).distinct()]
+        older = [key for key in stored if key != revision_key and
+                 (parse_ranking_revision_key(key) is None or parse_ranking_revision_key(key) < revision)]
+        newer = [key for key in stored if key != revision_key and key not in older]
+        if newer:
+            print(f"ℹ️ Ranking results for {revision_key} not written: {', '.join(newer)} already stored")
+            db.session.rollback()
+            return comprehensive_stats
+        if older:
+            RankingResult.query.filter(RankingResult.revision.in_(older)).delete(synchronize_session=False)
+        if revision_key not in stored:
+            db.session.add_all([
+                RankingResult.from_stats(revision_key, rank, stats)
+                for rank, stats in enumerate(comprehensive_stats, 1)
+            ])
+        db.session.commit()
+    except Exception as e:
+        # Another worker materialized the same revision first - its rows are identical
+        db.session.rollback()
+        print(f"⚠️ Ranking results for {revision_key} not written: {e}")
+    
+    return comprehensive_stats
+
+
+# Background recompute: writes only enqueue. One worker thread per process waits
+# for the burst to settle (RANKING_RECOMPUTE_DELAY seconds after the last write,
+# at most RANKING_RECOMPUTE_MAX_DELAY after the first) and materializes once.
+# Until it finishes, pages keep serving the last completed revision.
+RANKING_RECOMPUTE_WORKER_ENABLED = os.environ.get('RANKING_RECOMPUTE_WORKER', 'true').lower() == 'true'
+RANKING_RECOMPUTE_DELAY = float(os.environ.get('RANKING_RECOMPUTE_DELAY', '1.0'))
+RANKING_RECOMPUTE_MAX_DELAY = float(os.environ.get('RANKING_RECOMPUTE_MAX_DELAY', '10.0'))
+
+class RankingRecomputeWorker:
+    """Debounced materialize_ranking_results() on a daemon thread (started on first enqueue)"""
+    
+    def __init__(self, flask_app, delay, max_delay):
+        self.app = flask_app
+        self.delay = delay
+        self.max_delay = max_delay
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pending = 0
+        self._first_enqueued = None
+        self._last_enqueued = None
+        self.running = False
+        self.enqueued = 0
+        self.runs = 0
+        self.errors = 0
+        self.last_error = None
+        self.last_revision = None
+        self.last_duration_ms = None
+        self.last_completed = None
+    
+    @property
+    def queue_depth(self):
+        """Writes waiting for the next recompute"""
+        return self._pending
+    
+    def enqueue(self, refresh=False):
+        """
+        Request a recompute - returns immediately.
+        refresh=True (stale reads) only wakes an idle worker so steady read traffic
+        never pushes out a pending recompute.
+        """
+        with self._condition:
+            if refresh and (self._pending or self.running):
+                return
+            now = time.monotonic()
+            if self._pending == 0:
+                self._first_enqueued = now
+            self._pending += 1
+            self._last_enqueued = now
+            self.enqueued += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='ranking-recompute', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending == 0:
+                    self._condition.wait()
+                # Debounce: every new write pushes the deadline out, up to max_delay
+                while True:
+                    deadline = min(self._last_enqueued + self.delay, self._first_enqueued + self.max_delay)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                self._pending = 0
+                self.running = True
+            self._recompute()
+    
+    def _recompute(self):
+        start_time = time.perf_counter()
+        try:
+            with self.app.app_context():
+                revision_key = get_ranking_revision_key()
+                ranked = materialize_ranking_results(revision_key)
+            self.last_revision = revision_key
+            self.last_duration_ms = round((time.perf_counter() - start_time) * 1000, 1)
+            self.last_completed = datetime.utcnow()
+            print(f"📋 Materialized {len(ranked)} rankings in {self.last_duration_ms}ms (revision {revision_key})")
+            schedule_static_export()
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            print(f"Error materializing rankings: {e}")
+        finally:
+            self.runs += 1
+            self.running = False
+    
+    def status(self):
+        return {
+            'enabled': RANKING_RECOMPUTE_WORKER_ENABLED,
+            'running': self.running,
+            'queue_depth': self.queue_depth,
+            'enqueued': self.enqueued,
+            'runs': self.runs,
+            'coalesced': max(0, self.enqueued - self.runs - self.queue_depth - (1 if self.running else 0)),
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'last_revision': self.last_revision,
+            'last_duration_ms': self.last_duration_ms,
+            'last_completed': self.last_completed.isoformat() if self.last_completed else None,
+            'delay_seconds': self.delay,
+            'max_delay_seconds': self.max_delay
+        }
+
+ranking_recompute_worker = RankingRecomputeWorker(app, RANKING_RECOMPUTE_DELAY, RANKING_RECOMPUTE_MAX_DELAY)
+
+def get_ranking_snapshot():
+    """Revision and age of the rankings this request served (None if it served none)"""
+    snapshot = g.get('_ranking_snapshot') if has_request_context() else None
+    if snapshot is None:
+        return None
+    return dict(snapshot, age_seconds=round((datetime.utcnow() - snapshot['computed_at']).total_seconds(), 1))
+
+@app.after_request
+def materialize_rankings_after_write(response):
+    """Requests that changed results queue a recompute; served rankings are labeled with their revision"""
+    if g.get('_ranking_results_stale') and response.status_code < 500:
+        g._ranking_results_stale = False
+        if RANKING_RECOMPUTE_WORKER_ENABLED:
+            ranking_recompute_worker.enqueue()
+        else:
+            try:
+                materialize_ranking_results()
+                schedule_static_export()
+            except Exception as e:
+                db.session.rollback()
+                print(f"Error materializing rankings: {e}")
+    
+    snapshot = get_ranking_snapshot()
+    if snapshot:
+        response.headers['X-Ranking-Revision'] = snapshot['revision']
+        response.headers['X-Ranking-Age'] = str(snapshot['age_seconds'])
+        if snapshot['stale']:
+            response.headers['X-Ranking-Stale'] = '1'
+    return response
+
+@app.context_processor
+def inject_ranking_snapshot():
+    return dict(ranking_snapshot=get_ranking_snapshot)
+
+# ===============================================
+# CONDITIONAL PUBLIC PAGES
+# ===============================================
+# Public pages that only render season data carry a strong ETag built from the season
+# revision, the weekly snapshots (current week / movement), the page code and templates,
+# the admin flag and the full path with its query string. A matching If-None-Match is
+# answered 304 before the view runs - no ranking work at all. There is no Last-Modified:
+# two writes within one second would share an HTTP date, so If-Modified-Since could
+# confirm a page that changed. Pages showing flash messages, changing the session or
+# serving rankings older than the current revision get no ETag and are never cached.
+# Cache-Control: PAGE_CACHE_MAX_AGE=0 (default) lets a proxy store pages but revalidate
+# every time; N > 0 lets it serve them for N seconds. Admin pages are private.
+# CONDITIONAL_PAGES=false turns it all off.
+
+CONDITIONAL_PAGES_ENABLED = os.environ.get('CONDITIONAL_PAGES', 'true').lower() == 'true'
+PAGE_CACHE_MAX_AGE = int(os.environ.get('PAGE_CACHE_MAX_AGE', '0'))
+
+def compute_page_code_version():
+    """Digest of app.py and the templates - pages change on deploys too"""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(app_dir, 'app.py')]
+    for root, _, files in os.walk(os.path.join(app_dir, 'templates')):
+        paths.extend(os.path.join(root, name) for name in files)
+    digest = hashlib.md5()
+    for path in sorted(paths):
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            continue
+    return digest.hexdigest()[:12]
+
+PAGE_CODE_VERSION = compute_page_code_version()
+
+def get_weekly_snapshot_marker():
+    """(count, latest snapshot_date) of the weekly snapshots - changes when one is added or removed"""
+    return db.session.query(func.count(WeeklySnapshot.id), func.max(WeeklySnapshot.snapshot_date)).one()
+
+def get_page_etag():
+    """ETag for the current request's page - two small queries, no ranking work"""
+    revision = get_season_data_revision()
+    snapshot_count, snapshot_latest = get_weekly_snapshot_marker()
+
+    page = '|'.join([
+        PAGE_CODE_VERSION, f"r{revision}", f"s{snapshot_count}:{snapshot_latest}",
+        'admin' if is_admin() else 'public', request.full_path
+    ])
+    return hashlib.md5(page.encode()).hexdigest()
+
+def set_page_cache_headers(response, etag=None):
+    if etag is None:
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    response.set_etag(etag)
+    if is_admin():
+        response.headers['Cache-Control'] = 'private, no-cache'
+    elif PAGE_CACHE_MAX_AGE > 0:
+        response.headers['Cache-Control'] = f"public, max-age={PAGE_CACHE_MAX_AGE}"
+    else:
+        response.headers['Cache-Control'] = 'public, no-cache'
+    return response
+
+def conditional_page(view):
+    """Answer If-None-Match with 304 from the season revision (see above)"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not CONDITIONAL_PAGES_ENABLED or request.method not in ('GET', 'HEAD'):
+            return view(*args, **kwargs)
+        if '_flashes' in session:
+            # Pending flash messages must be shown, so those requests always render
+            return set_page_cache_headers(app.make_response(view(*args, **kwargs)))
+        try:
+            etag = get_page_etag()
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error reading page ETag: {e}")
+            return view(*args, **kwargs)
+
+        if request.if_none_match.contains(etag):
+            return set_page_cache_headers(app.response_class(status=304), etag)
+
+        response = app.make_response(view(*args, **kwargs))
+        snapshot = get_ranking_snapshot()
+        if response.status_code != 200 or session.modified or (snapshot and snapshot['stale']):
+            # Flashed or stale content - another request at this revision may render differently
+            return set_page_cache_headers(response)
+        return set_page_cache_headers(response, etag)
+    return wrapper
+
+# ===============================================
+# STATIC SITE EXPORT
+# ===============================================
+# With STATIC_EXPORT_DIR set, the public season pages (rankings, every conference view,
+# every team, CFP bracket, bowl projections) and the archived seasons are also written
+# there as static HTML for nginx (see cfb_static_export). After each write - once the
+# rankings are materialized - a background thread runs scripts/export_static.py in a
+# fresh process, which re-renders the pages whose inputs changed on
+# STATIC_EXPORT_WORKERS processes (default: all cores). Requests arriving during an
+# export queue one more run. Season pages depend on the season revision and the weekly
+# snapshots; archived seasons only on their own archive.
+
+STATIC_EXPORT_DIR = os.environ.get('STATIC_EXPORT_DIR')
+STATIC_EXPORT_WORKERS = max(1, int(os.environ.get('STATIC_EXPORT_WORKERS', str(os.cpu_count() or 1))))
+STATIC_EXPORT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts', 'export_static.py')
+
+def get_static_export_pages():
+    """{path: input digest} for every exported page"""
+    snapshot_count, snapshot_latest = get_weekly_snapshot_marker()
+    season_inputs = cfb_static_export.input_digest(
+        PAGE_CODE_VERSION, get_season_data_revision(), snapshot_count, str(snapshot_latest)
+    )
+    archives = db.session.query(ArchivedSeason.id, ArchivedSeason.archived_date).order_by(ArchivedSeason.id).all()
+    
+    with app.test_request_context():
+        paths = [url_for('rankings'), url_for('cfp_bracket'), url_for('bowl_projections')]
+        paths += [url_for('rankings', conference=conference) for conference in sorted(CONFERENCES)]
+        paths += [url_for('public_team_detail', team_name=team_name)
+                  for team_name, in db.session.query(TeamStats.team_name).order_by(TeamStats.team_name)]
+        pages = {path: season_inputs for path in paths}
+        
+        pages[url_for('archived_seasons')] = cfb_static_export.input_digest(
+            PAGE_CODE_VERSION, [(season_id, str(archived_date)) for season_id, archived_date in archives]
+        )
+        for season_id, archived_date in archives:
+            pages[url_for('view_archived_season', filename=str(season_id))] = cfb_static_export.input_digest(
+                PAGE_CODE_VERSION, season_id, str(archived_date)
+            )
+    return pages
+
+def _init_static_export_worker():
+    """Render process initializer: never share the parent's pooled database connections"""
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+def export_static_site(export_dir=None, workers=None, force=False):
+    """Bring the static export up to date - call from a single-threaded process (it forks)"""
+    pages = get_static_export_pages()
+    # Build the ranking state once here, so render workers inherit it instead of each
+    # ranking the season. Outside a request this neither writes nor queues a recompute.
+    get_ranking_context()
+    get_all_team_stats_bulk()
+    db.session.remove()  # Render workers open their own sessions
+    return cfb_static_export.export_pages(
+        app, export_dir or STATIC_EXPORT_DIR, pages,
+        workers=STATIC_EXPORT_WORKERS if workers is None else workers,
+        worker_initializer=_init_static_export_worker, force=force
+    )
+
+class StaticExportRunner:
+    """Runs scripts/export_static.py on a daemon thread (started on first request)"""
+    
+    def __init__(self, export_dir, workers):
+        self.export_dir = export_dir
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._pending = False
+        self._thread = None
+        self.runs = 0
+        self.errors = 0
+        self.last_error = None
+        self.last_result = None
+        self.last_completed = None
+    
+    def request(self):
+        """Ask for an export - returns immediately"""
+        with self._lock:
+            self._pending = True
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='static-export', daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                self._pending = False
+            self._export()
+    
+    def _export(self):
+        import subprocess
+        try:
+            completed = subprocess.run(
+                [sys.executable, STATIC_EXPORT_SCRIPT, '--export-dir', self.export_dir, '--workers', str(self.workers),
+                 '--json'],
+                capture_output=True, text=True, timeout=600
+            )
+            if completed.returncode != 0:
+                raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip()
+                                   else f"exit code {completed.returncode}")
+            self.last_result = json.loads(completed.stdout.strip().splitlines()[-1])
+            self.last_completed = datetime.utcnow()
+            print(f"📄 Static export: {self.last_result['written']} of {self.last_result['pages']} pages written "
+                  f"in {self.last_result['duration_ms']}ms")
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            print(f"❌ Static export failed: {e}")
+        finally:
+            self.runs += 1
+    
+    def status(self):
+        return {
+            'enabled': bool(self.export_dir),
+            'export_dir': self.export_dir,
+            'running': self._thread is not None,
+            'runs': self.runs,
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'last_result': self.last_result,
+            'last_completed': self.last_completed.isoformat() if self.last_completed else None
+        }
+
+static_export_runner = StaticExportRunner(STATIC_EXPORT_DIR, STATIC_EXPORT_WORKERS)
+
+def schedule_static_export():
+    """Post-write step: refresh the static export in the background (no-op without STATIC_EXPORT_DIR)"""
+    if STATIC_EXPORT_DIR:
+        static_export_runner.request()
+
+
+@ranking_spans.timed('bulk_rankings.total')
 def get_all_team_stats_bulk():
     """Load all team stats with PROPER ranking calculations but efficient bulk approach"""
     try:
         start_time = time.time()
         
-        # Get all teams with games
-        teams_with_games = TeamStats.query.filter(
-            (TeamStats.wins + TeamStats.losses) > 0
-        ).all()
-        
-        print(f"⏱️ Database query took {time.time() - start_time:.2f} seconds")
-        
-        # BULK BUILD: Create team lookup for efficient opponent quality calculations
-        cache_start = time.time()
-        team_lookup = {}
-        
-        for team_record in teams_with_games:
-            team_data = team_record.to_dict()
-            team_lookup[team_record.team_name] = team_data
+        # Materialized per revision: one indexed query, ranking math only when missing
+        revision_key = get_ranking_revision_key()
+        stale = False
+        with ranking_spans.span('bulk_rankings.load_materialized'):
+            loaded = load_ranking_results(revision_key)
+            if loaded is None and RANKING_RECOMPUTE_WORKER_ENABLED and has_request_context():
+                # Stale-while-revalidate: serve the last completed ranking, refresh in the background
+                loaded = load_ranking_results()
+                if loaded is not None:
+                    stale = True
+                    ranking_recompute_worker.enqueue(refresh=True)
+        if loaded is None:
+            with ranking_spans.span('bulk_rankings.compute'):
+                # Nothing stored yet: compute in memory (concurrent misses share one
+                # computation) and leave storing it to the recompute worker - reads never write
+                comprehensive_stats, outcome = ranking_compute_flight.do(revision_key, compute_ranked_team_stats)
+                if outcome == 'shared':
+                    # Callers annotate the entries - each request gets its own copies
+                    comprehensive_stats = [dict(stats) for stats in comprehensive_stats]
+                if RANKING_RECOMPUTE_WORKER_ENABLED and has_request_context():
+                    ranking_recompute_worker.enqueue(refresh=True)
+                loaded = (revision_key, datetime.utcnow(), comprehensive_stats)
+        served_revision, computed_at, comprehensive_stats = loaded
+        
+        if has_request_context():
+            g._ranking_snapshot = {'revision': served_revision, 'computed_at': computed_at, 'stale': stale}
+        print(f"⏱️ TOTAL get_all_team_stats_bulk took {time.time() - start_time:.2f} seconds")
         
-        print(f"⏱️ Team lookup built in {time.time() - cache_start:.2f} seconds")
+        return comprehensive_stats
         
-        # Now calculate proper ratings for each team
-        loop_start = time.time()
-        comprehensive_stats = []
+    except Exception as e:
+        print(f"Error in bulk loading: {e}")
+        return []
+
+
+# ===============================================
+# WHAT-IF SIMULATOR
+# ===============================================
+# Hypothetical results for pending ScheduledGame rows are applied to an in-memory
+# copy-on-write overlay of the season: the scenario dict shares every untouched
+# team's stats with the live ranking state and only copies the teams that play.
+# Nothing is written to Game/TeamStats. Bulk rankings are recomputed for the
+# teams that play and everyone who played them; all other rows are reused.
+
+WHATIF_TOP_N = 25
+WHATIF_MAX_SCENARIOS = int(os.environ.get('WHATIF_MAX_SCENARIOS', '50'))  # Per request
+WHATIF_MAX_RESULTS = 80  # A full FBS week
+WHATIF_DEFAULT_SCORE = (31, 24)  # (winner, loser) when a result only names the winner
+
+# /api/whatif is public and CPU-bound: each client address (see TRUSTED_PROXY_COUNT)
+# gets WHATIF_RATE_LIMIT requests per WHATIF_RATE_WINDOW seconds, admins are exempt.
+# Counted per server process, so N workers allow up to N times the limit.
+WHATIF_RATE_LIMIT = int(os.environ.get('WHATIF_RATE_LIMIT', '10'))
+WHATIF_RATE_WINDOW = float(os.environ.get('WHATIF_RATE_WINDOW', '60'))
+
+class ClientRateLimiter:
+    """Sliding-window request limit per client key (in-process)"""
+    
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self._lock = threading.Lock()
+        self._requests = {}
+    
+    def check(self, key):
+        """Record a request for key; returns 0 if allowed, else seconds until the next one is"""
+        now = time.monotonic()
+        with self._lock:
+            cutoff = now - self.window
+            if len(self._requests) > 10000:
+                # Drop idle clients so the table stays bounded
+                self._requests = {k: times for k, times in self._requests.items() if times[-1] > cutoff}
+            times = [t for t in self._requests.get(key, ()) if t > cutoff]
+            if len(times) >= self.limit:
+                self._requests[key] = times
+                return max(1, math.ceil(times[0] + self.window - now))
+            times.append(now)
+            self._requests[key] = times
+            return 0
+
+whatif_rate_limiter = ClientRateLimiter(WHATIF_RATE_LIMIT, WHATIF_RATE_WINDOW)
+
+def apply_hypothetical_game(stats, opponent, team_score, opp_score, is_home, is_neutral_site, is_overtime):
+    """Copy of a team's stats dict with one more game - same bookkeeping as update_team_stats_in_db"""
+    if stats is None:
+        stats = {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0,
+                 'home_wins': 0, 'road_wins': 0, 'margin_of_victory_total': 0, 'games': []}
+    stats = dict(stats)
+    
+    if team_score > opp_score:
+        stats['wins'] += 1
+        stats['margin_of_victory_total'] += (team_score - opp_score)
+        if not is_neutral_site:
+            if is_home:
+                stats['home_wins'] += 1
+            else:
+                stats['road_wins'] += 1
+    else:
+        stats['losses'] += 1
+    stats['points_for'] += team_score
+    stats['points_against'] += opp_score
+    
+    if is_neutral_site:
+        location = 'Neutral'
+    elif is_home:
+        location = 'Home'
+    else:
+        location = 'Away'
+    stats['games'] = stats['games'] + [{
+        'opponent': opponent,
+        'team_score': team_score,
+        'opp_score': opp_score,
+        'result': 'W' if team_score > opp_score else 'L',
+        'home_away': location,
+        'overtime': is_overtime
+    }]
+    return stats
+
+def build_whatif_baseline():
+    """
+    Current season, played-by index and bulk rankings every scenario is compared against.
+    Both the /whatif page and the API rank from this live state (not the possibly stale
+    materialized rankings), so the page's top 25 is the API's "previous rank".
+    """
+    state = get_opponent_quality_state()
+    bulk_table = get_bulk_ranking_table()
+    ranked = sorted(bulk_table.values(), key=lambda x: x['adjusted_total'], reverse=True)
+    return {
+        'revision': state['revision'],
+        'season_data': state['season_data'],
+        'played_by': state['played_by'],
+        'bulk_table': bulk_table,
+        'ranked': ranked,
+        'ranks': {stats['team']: rank for rank, stats in enumerate(ranked, 1)}
+    }
+
+def parse_whatif_results(results, scheduled_games):
+    """
+    Validate one scenario's results against pending ScheduledGame rows ({id: game}).
+    Each result is {'game_id', 'winner'} and/or {'game_id', 'home_score', 'away_score'}
+    (+ optional 'overtime'). Returns a list of hypothetical games; raises ValueError.
+    """
+    if not isinstance(results, list) or not results:
+        raise ValueError('results must be a non-empty list')
+    if len(results) > WHATIF_MAX_RESULTS:
+        raise ValueError(f'at most {WHATIF_MAX_RESULTS} results per scenario')
+    
+    games = []
+    seen = set()
+    for result in results:
+        if not isinstance(result, dict):
+            raise ValueError('each result must be an object')
+        try:
+            game_id = int(result.get('game_id'))
+        except (TypeError, ValueError):
+            raise ValueError('each result needs a numeric game_id')
+        scheduled = scheduled_games.get(game_id)
+        if scheduled is None:
+            raise ValueError(f'game {game_id} is not a pending scheduled game')
+        if game_id in seen:
+            raise ValueError(f'game {game_id} appears twice in one scenario')
+        seen.add(game_id)
+        
+        winner = result.get('winner')
+        if winner is not None and winner not in (scheduled.home_team, scheduled.away_team):
+            raise ValueError(f'winner of game {game_id} must be {scheduled.home_team} or {scheduled.away_team}')
+        
+        if result.get('home_score') is not None or result.get('away_score') is not None:
+            try:
+                home_score = int(result.get('home_score'))
+                away_score = int(result.get('away_score'))
+            except (TypeError, ValueError):
+                raise ValueError(f'game {game_id} needs both home_score and away_score')
+            if home_score < 0 or away_score < 0 or home_score == away_score:
+                raise ValueError(f'game {game_id} needs non-negative, non-tied scores')
+            if winner is not None and (home_score > away_score) != (winner == scheduled.home_team):
+                raise ValueError(f'scores for game {game_id} do not match the winner')
+        elif winner is not None:
+            winning_score, losing_score = WHATIF_DEFAULT_SCORE
+            home_won = winner == scheduled.home_team
+            home_score, away_score = (winning_score, losing_score) if home_won else (losing_score, winning_score)
+        else:
+            raise ValueError(f'game {game_id} needs a winner or scores')
+        
+        games.append({
+            'game_id': game_id,
+            'week': scheduled.week,
+            'home_team': scheduled.home_team,
+            'away_team': scheduled.away_team,
+            'home_score': home_score,
+            'away_score': away_score,
+            'neutral': bool(scheduled.neutral),
+            'overtime': bool(result.get('overtime', False)),
+            'winner': scheduled.home_team if home_score > away_score else scheduled.away_team
+        })
+    return games
+
+def simulate_whatif_scenario(baseline, hypothetical_games, top_n=WHATIF_TOP_N):
+    """Re-rank the season with hypothetical_games applied (nothing is written)"""
+    start_time = time.perf_counter()
+    season_data = dict(baseline['season_data'])  # copy-on-write: team dicts are shared until changed
+    changed = set()
+    for game in hypothetical_games:
+        for team, opponent, team_score, opp_score, is_home in (
+            (game['home_team'], game['away_team'], game['home_score'], game['away_score'], True),
+            (game['away_team'], game['home_team'], game['away_score'], game['home_score'], False)
+        ):
+            if team == 'FCS' or team.upper() == 'FCS':
+                continue
+            season_data[team] = apply_hypothetical_game(
+                season_data.get(team), opponent, team_score, opp_score, is_home, game['neutral'], game['overtime']
+            )
+            changed.add(team)
+    
+    # Bulk stats read opponents' records, so teams that played a changed team move too
+    affected = set(changed)
+    for team in changed:
+        affected |= baseline['played_by'].get(team, frozenset())
+    
+    team_lookup = get_bulk_team_lookup(season_data)
+    recomputed = {
+        stats['team']: stats
+        for stats in calculate_bulk_team_stats(team_lookup, [name for name in team_lookup if name in affected])
+    }
+    bulk_table = baseline['bulk_table']
+    ranked = sorted(
+        (recomputed.get(team_name) or bulk_table[team_name] for team_name in team_lookup),
+        key=lambda x: x['adjusted_total'], reverse=True
+    )
+    ranks = {stats['team']: rank for rank, stats in enumerate(ranked, 1)}
+    previous_ranks = baseline['ranks']
+    
+    def movement(team_name, rank):
+        previous_rank = previous_ranks.get(team_name)
+        return {
+            'rank': rank,
+            'previous_rank': previous_rank or 'NR',
+            'rank_change': (previous_rank - rank) if previous_rank and rank else None
+        }
+    
+    top_teams = []
+    for rank, stats in enumerate(ranked[:top_n], 1):
+        entry = {
+            'team': stats['team'],
+            'conference': stats['conference'],
+            'record': f"{stats['total_wins']}-{stats['total_losses']}",
+            'adjusted_total': stats['adjusted_total'],
+            'strength_of_schedule': stats['strength_of_schedule']
+        }
+        entry.update(movement(stats['team'], rank))
+        top_teams.append(entry)
+    
+    top_names = {entry['team'] for entry in top_teams}
+    return {
+        'results': hypothetical_games,
+        'top_25': top_teams,
+        'teams': {
+            team_name: movement(team_name, ranks.get(team_name))
+            for team_name in sorted(changed)
+        },
+        'dropped_out': [
+            {'team': team_name, 'previous_rank': rank, 'rank': ranks.get(team_name)}
+            for team_name, rank in sorted(previous_ranks.items(), key=lambda item: item[1])
+            if rank <= top_n and team_name not in top_names
+        ],
+        'recomputed_teams': len(recomputed),
+        'elapsed_ms': round((time.perf_counter() - start_time) * 1000, 2)
+    }
+
+def run_whatif_scenarios(scenarios):
+    """
+    Run a batch of scenarios ([{'name': ..., 'results': [...]}, ...]) against one baseline.
+    Invalid scenarios report an 'error' instead of failing the batch.
+    """
+    if not isinstance(scenarios, list) or not scenarios:
+        raise ValueError('scenarios must be a non-empty list')
+    if len(scenarios) > WHATIF_MAX_SCENARIOS:
+        raise ValueError(f'at most {WHATIF_MAX_SCENARIOS} scenarios per request')
+    
+    start_time = time.perf_counter()
+    game_ids = set()
+    for scenario in scenarios:
+        for result in (scenario.get('results') or []) if isinstance(scenario, dict) else []:
+            if isinstance(result, dict) and str(result.get('game_id', '')).isdigit():
+                game_ids.add(int(result['game_id']))
+    scheduled_games = {
+        game.id: game for game in ScheduledGame.query.filter(
+            ScheduledGame.id.in_(game_ids), ScheduledGame.completed == False
+        ).all()
+    } if game_ids else {}
+    
+    baseline = build_whatif_baseline()
+    responses = []
+    for index, scenario in enumerate(scenarios, 1):
+        name = scenario.get('name') if isinstance(scenario, dict) else None
+        name = str(name or f'Scenario {index}')[:100]
+        try:
+            hypothetical_games = parse_whatif_results(
+                scenario.get('results') if isinstance(scenario, dict) else None, scheduled_games
+            )
+        except ValueError as e:
+            responses.append({'name': name, 'error': str(e)})
+            continue
+        response = simulate_whatif_scenario(baseline, hypothetical_games)
+        response['name'] = name
+        responses.append(response)
+    
+    return {
+        'revision': get_ranking_revision_key(),
+        'scenarios': responses,
+        'elapsed_ms': round((time.perf_counter() - start_time) * 1000, 2)
+    }
+
+def whatif_week_sort_key(week):
+    """Numbered weeks in order, then named weeks (e.g. 'Bowls')"""
+    return (0, int(week), '') if str(week).isdigit() else (1, 0, str(week))
+
+@app.route('/whatif')
+def whatif():
+    """What-if simulator: pick hypothetical winners for pending games and see the new top 25"""
+    pending = ScheduledGame.query.filter(ScheduledGame.completed == False).all()
+    weeks = sorted({game.week for game in pending}, key=whatif_week_sort_key)
+    selected_week = request.args.get('week') or (weeks[0] if weeks else None)
+    
+    week_games = sorted(
+        (game for game in pending if game.week == selected_week),
+        key=lambda game: (game.game_date or date.max, game.game_time or '', game.id)
+    )
+    current_top_25 = build_whatif_baseline()['ranked'][:WHATIF_TOP_N]
+    
+    return render_template('whatif.html',
+                         weeks=weeks,
+                         selected_week=selected_week,
+                         week_games=week_games,
+                         current_top_25=current_top_25,
+                         default_score=WHATIF_DEFAULT_SCORE,
+                         max_scenarios=WHATIF_MAX_SCENARIOS)
+
+@app.route('/api/whatif', methods=['POST'])
+def whatif_api():
+    """
+    JSON what-if API.
+    Body: {"results": [...]} for one scenario or {"scenarios": [{"name", "results"}, ...]}
+    Result: {"game_id": 12, "winner": "Alabama"} or {"game_id": 12, "home_score": 27, "away_score": 24}
+    """
+    from flask import jsonify
+    if not is_admin():
+        retry_after = whatif_rate_limiter.check(request.remote_addr)
+        if retry_after:
+            response = jsonify({'error': f'Too many what-if requests - try again in {retry_after} seconds'})
+            response.headers['Retry-After'] = str(retry_after)
+            return response, 429
+    
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({'error': 'expected a JSON object body'}), 400
+    
+    scenarios = payload.get('scenarios')
+    if scenarios is None:
+        scenarios = [{'name': payload.get('name'), 'results': payload.get('results')}]
+    try:
+        return jsonify(run_whatif_scenarios(scenarios))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        print(f"Error running what-if scenarios: {e}")
+        return jsonify({'error': 'what-if simulation failed'}), 500
+
+
+def get_bulk_team_lookup(season_data):
+    """Teams with games - the lookup the bulk ranking math reads opponents from"""
+    return {
+        team_name: stats for team_name, stats in season_data.items()
+        if (stats['wins'] + stats['losses']) > 0
+    }
+
+
+def calculate_bulk_team_stats(team_lookup, team_names=None):
+    """
+    Bulk ranking math for every team in team_lookup ({team_name: stats dict with games}),
+    or just team_names (opponents are still read from the full lookup).
+    Pure Python reference implementation - no database access, unsorted result.
+    """
+    comprehensive_stats = []
+    
+    if team_names is None:
+        team_names = list(team_lookup.keys())
+    
+    for team_name in team_names:
+        team_data = team_lookup[team_name]
+        # CALCULATE PROPER VICTORY VALUE using bulk data
+        total_victory_value = 0
+        total_loss_penalty = 0
         
-        for team_record in teams_with_games:
-            team_name = team_record.team_name
-            team_data = team_record.to_dict()
+        for game in team_data['games']:
+            opponent = game['opponent']
+            team_score = game['team_score']
+            opp_score = game['opp_score']
+            location = game['home_away']
             
-            # CALCULATE PROPER VICTORY VALUE using bulk data
-            total_victory_value = 0
-            total_loss_penalty = 0
+            if game['result'] == 'W':
+                # Calculate victory value properly
+                
+                # 1. Opponent Quality (using bulk data instead of expensive query)
+                if opponent == 'FCS':
+                    opponent_quality = 0.5
+                elif opponent in team_lookup:
+                    opp_data = team_lookup[opponent]
+                    opp_games = opp_data['wins'] + opp_data['losses']
+                    if opp_games > 0:
+                        opp_win_pct = opp_data['wins'] / opp_games
+                        opponent_quality = 2.0 + (opp_win_pct * 6.0)  # 2-8 scale
+
+                        # Base quality using subdivision-aware calculation
+                        opp_conf = get_team_conference(opponent)
+                        if opp_conf in P4_CONFERENCES:
+                            opponent_quality = 4.0 + (opp_win_pct * 4.0)  # P4: 4.0-8.0 range
+                        elif opp_conf in G6_CONFERENCES:
+                            opponent_quality = 2.5 + (opp_win_pct * 4.0)  # G6: 2.5-6.5 range
+                        else:
+                            opponent_quality = 2.0 + (opp_win_pct * 6.0)  # Default/Other: 2.0-8.0 range
+
+                    else:
+                        opponent_quality = 5.0
+                else:
+                    opponent_quality = 5.0  # Unknown opponent
+                
+                # 2. Location Multiplier
+                location_mult = {'Home': 1.0, 'Away': 1.3, 'Neutral': 1.15}.get(game['home_away'], 1.0)
+
+                travel_bonus = calculate_travel_adjustment(team_name, opponent, game['home_away'])
+                
+                # 3. Margin Bonus
+                margin = team_score - opp_score
+                if margin <= 7:
+                    margin_bonus = margin * 0.1
+                elif margin <= 14:
+                    margin_bonus = 0.7 + (margin - 7) * 0.08
+                elif margin <= 21:
+                    margin_bonus = 1.26 + (margin - 14) * 0.04
+                else:
+                    margin_bonus = 1.54 + (margin - 21) * 0.02
+                
+                # 4. Calculate victory value
+                victory_value = (opponent_quality * location_mult) + margin_bonus + travel_bonus
+                
+                # 5. FCS cap
+                if opponent == 'FCS':
+                    victory_value = min(victory_value, 1.0)
+                
+                total_victory_value += victory_value
             
-            for game in team_data['games']:
-                opponent = game['opponent']
-                team_score = game['team_score']
-                opp_score = game['opp_score']
-                location = game['home_away']
+            elif game['result'] == 'L':
+                # Calculate loss penalty
+                margin = opp_score - team_score
                 
-                if game['result'] == 'W':
-                    # Calculate victory value properly
-                    
-                    # 1. Opponent Quality (using bulk data instead of expensive query)
-                    if opponent == 'FCS':
-                        opponent_quality = 0.5
-                    elif opponent in team_lookup:
+                if opponent == 'FCS':
+                    # Catastrophic FCS loss
+                    loss_penalty = 10.0 + (margin * 0.5)
+                else:
+                    # Normal loss penalty
+                    if opponent in team_lookup:
                         opp_data = team_lookup[opponent]
                         opp_games = opp_data['wins'] + opp_data['losses']
                         if opp_games > 0:
                             opp_win_pct = opp_data['wins'] / opp_games
-                            opponent_quality = 2.0 + (opp_win_pct * 6.0)  # 2-8 scale
-
-                            # Base quality using subdivision-aware calculation
-                            opp_conf = get_team_conference(opponent)
-                            if opp_conf in P4_CONFERENCES:
-                                opponent_quality = 4.0 + (opp_win_pct * 4.0)  # P4: 4.0-8.0 range
-                            elif opp_conf in G6_CONFERENCES:
-                                opponent_quality = 2.5 + (opp_win_pct * 4.0)  # G6: 2.5-6.5 range
-                            else:
-                                opponent_quality = 2.0 + (opp_win_pct * 6.0)  # Default/Other: 2.0-8.0 range
-
+                            opponent_quality = 2.0 + (opp_win_pct * 6.0)
                         else:
                             opponent_quality = 5.0
                     else:
-                        opponent_quality = 5.0  # Unknown opponent
+                        opponent_quality = 5.0
                     
-                    # 2. Location Multiplier
-                    location_mult = {'Home': 1.0, 'Away': 1.3, 'Neutral': 1.15}.get(game['home_away'], 1.0)
-
-                    travel_bonus = calculate_travel_adjustment(team_name, opponent, game['home_away'])
+                    # Base loss penalty
+                    base_penalty = 3.0
                     
-                    # 3. Margin Bonus
-                    margin = team_score - opp_score
-                    if margin <= 7:
-                        margin_bonus = margin * 0.1
-                    elif margin <= 14:
-                        margin_bonus = 0.7 + (margin - 7) * 0.08
-                    elif margin <= 21:
-                        margin_bonus = 1.26 + (margin - 14) * 0.04
+                    # Opponent quality adjustment
+                    if opponent_quality >= 7.0:
+                        quality_adj = -1.5  # Good opponent
+                    elif opponent_quality >= 5.5:
+                        quality_adj = -0.5
+                    elif opponent_quality >= 4.0:
+                        quality_adj = 0.5
                     else:
-                        margin_bonus = 1.54 + (margin - 21) * 0.02
+                        quality_adj = 2.0  # Bad opponent
                     
-                    # 4. Calculate victory value
-                    victory_value = (opponent_quality * location_mult) + margin_bonus + travel_bonus
-                    
-                    # 5. FCS cap
-                    if opponent == 'FCS':
-                        victory_value = min(victory_value, 1.0)
-                    
-                    total_victory_value += victory_value
-                
-                elif game['result'] == 'L':
-                    # Calculate loss penalty
-                    margin = opp_score - team_score
-                    
-                    if opponent == 'FCS':
-                        # Catastrophic FCS loss
-                        loss_penalty = 10.0 + (margin * 0.5)
+                    # Margin penalty
+                    if margin <= 3:
+                        margin_penalty = 0
+                    elif margin <= 7:
+                        margin_penalty = 0.5
+                    elif margin <= 14:
+                        margin_penalty = 1.0
                     else:
-                        # Normal loss penalty
-                        if opponent in team_lookup:
-                            opp_data = team_lookup[opponent]
-                            opp_games = opp_data['wins'] + opp_data['losses']
-                            if opp_games > 0:
-                                opp_win_pct = opp_data['wins'] / opp_games
-                                opponent_quality = 2.0 + (opp_win_pct * 6.0)
-                            else:
-                                opponent_quality = 5.0
-                        else:
-                            opponent_quality = 5.0
-                        
-                        # Base loss penalty
-                        base_penalty = 3.0
-                        
-                        # Opponent quality adjustment
-                        if opponent_quality >= 7.0:
-                            quality_adj = -1.5  # Good opponent
-                        elif opponent_quality >= 5.5:
-                            quality_adj = -0.5
-                        elif opponent_quality >= 4.0:
-                            quality_adj = 0.5
-                        else:
-                            quality_adj = 2.0  # Bad opponent
-                        
-                        # Margin penalty
-                        if margin <= 3:
-                            margin_penalty = 0
-                        elif margin <= 7:
-                            margin_penalty = 0.5
-                        elif margin <= 14:
-                            margin_penalty = 1.0
-                        else:
-                            margin_penalty = 2.0
-                        
-                        loss_penalty = base_penalty + quality_adj + margin_penalty
+                        margin_penalty = 2.0
                     
-                    total_loss_penalty += loss_penalty
-            
-            # CALCULATE STRENGTH OF SCHEDULE using bulk data
-            opponent_total_wins = 0
-            opponent_total_losses = 0
-            opponent_total_games = 0
-            
-            for game in team_data['games']:
-                opponent = game['opponent']
-                if opponent in team_lookup and opponent != 'FCS':
-                    opp_data = team_lookup[opponent]
-                    opponent_total_wins += opp_data['wins']
-                    opponent_total_losses += opp_data['losses']
-                    opponent_total_games += (opp_data['wins'] + opp_data['losses'])
-            
-            strength_of_schedule = opponent_total_wins / opponent_total_games if opponent_total_games > 0 else 0.500
-            
-            # Apply conference multiplier
-            team_conf = get_team_conference(team_name)
-            if team_conf in ['American', 'Conference USA', 'MAC', 'Mountain West', 'Sun Belt'] or team_name == 'Connecticut':
-                conference_multiplier = 0.85
-            else:
-                conference_multiplier = 1.0
-            
-            adjusted_victory_value = total_victory_value * conference_multiplier
-            
-            # Final calculation
-            games_bonus = min(2.5, len(team_data['games']) * 0.18)
-            adjusted_total = adjusted_victory_value - total_loss_penalty + games_bonus
-            
-            # Build the stats object
-            stats = {
-                'team': team_name,
-                'conference': get_team_conference(team_name),
-                'adjusted_total': round(adjusted_total, 3),
-                'total_wins': team_data['wins'],
-                'total_losses': team_data['losses'],
-                'points_fielded': team_data['points_for'],
-                'points_allowed': team_data['points_against'],
-                'margin_of_victory': team_data['margin_of_victory_total'],
-                'point_differential': team_data['points_for'] - team_data['points_against'],
-                'home_wins': team_data['home_wins'],
-                'road_wins': team_data['road_wins'],
-                'strength_of_schedule': round(strength_of_schedule, 3),  # NOW CALCULATED PROPERLY
-                'totals': round(adjusted_total, 3),
-                'scientific_breakdown': {'total_score': adjusted_total},
-                'opp_w': opponent_total_wins, 
-                'opp_l': opponent_total_losses, 
-                'opp_wl_differential': opponent_total_wins - opponent_total_losses, 
-                'strength_of_record': round(strength_of_schedule * (team_data['wins'] / max(1, team_data['wins'] + team_data['losses'])), 3)
-            }
-            
-            comprehensive_stats.append(stats)
+                    loss_penalty = base_penalty + quality_adj + margin_penalty
+                
+                total_loss_penalty += loss_penalty
         
-        print(f"⏱️ All teams calculations took {time.time() - loop_start:.2f} seconds")
+        # CALCULATE STRENGTH OF SCHEDULE using bulk data
+        opponent_total_wins = 0
+        opponent_total_losses = 0
+        opponent_total_games = 0
         
-        # Sort by ranking
-        comprehensive_stats.sort(key=lambda x: x['adjusted_total'], reverse=True)
-        print(f"⏱️ TOTAL get_all_team_stats_bulk took {time.time() - start_time:.2f} seconds")
+        for game in team_data['games']:
+            opponent = game['opponent']
+            if opponent in team_lookup and opponent != 'FCS':
+                opp_data = team_lookup[opponent]
+                opponent_total_wins += opp_data['wins']
+                opponent_total_losses += opp_data['losses']
+                opponent_total_games += (opp_data['wins'] + opp_data['losses'])
         
-        return comprehensive_stats
+        strength_of_schedule = opponent_total_wins / opponent_total_games if opponent_total_games > 0 else 0.500
         
-    except Exception as e:
-        print(f"Error in bulk loading: {e}")
-        return []
+        # Apply conference multiplier
+        conference_multiplier = get_bulk_conference_multiplier(team_name)
+        
+        adjusted_victory_value = total_victory_value * conference_multiplier
+        
+        # Final calculation
+        games_bonus = min(2.5, len(team_data['games']) * 0.18)
+        adjusted_total = adjusted_victory_value - total_loss_penalty + games_bonus
+        
+        # Build the stats object
+        stats = {
+            'team': team_name,
+            'conference': get_team_conference(team_name),
+            'adjusted_total': round(adjusted_total, 3),
+            'total_wins': team_data['wins'],
+            'total_losses': team_data['losses'],
+            'points_fielded': team_data['points_for'],
+            'points_allowed': team_data['points_against'],
+            'margin_of_victory': team_data['margin_of_victory_total'],
+            'point_differential': team_data['points_for'] - team_data['points_against'],
+            'home_wins': team_data['home_wins'],
+            'road_wins': team_data['road_wins'],
+            'strength_of_schedule': round(strength_of_schedule, 3),  # NOW CALCULATED PROPERLY
+            'totals': round(adjusted_total, 3),
+            'scientific_breakdown': {'total_score': adjusted_total},
+            'opp_w': opponent_total_wins, 
+            'opp_l': opponent_total_losses, 
+            'opp_wl_differential': opponent_total_wins - opponent_total_losses, 
+            'strength_of_record': round(strength_of_schedule * (team_data['wins'] / max(1, team_data['wins'] + team_data['losses'])), 3)
+        }
+        
+        comprehensive_stats.append(stats)
+
+    return comprehensive_stats
+
+
+def get_bulk_conference_multiplier(team_name):
+    """Victory value multiplier used by the bulk rankings (G6 discount)"""
+    team_conf = get_team_conference(team_name)
+    if team_conf in ['American', 'Conference USA', 'MAC', 'Mountain West', 'Sun Belt'] or team_name == 'Connecticut':
+        return 0.85
+    return 1.0
+
+
+def get_bulk_opponent_tier(team_name):
+    """Subdivision tier code used by the vectorized bulk victory value"""
+    team_conf = get_team_conference(team_name)
+    if team_conf in P4_CONFERENCES:
+        return cfb_vector_ranking.TIER_P4
+    elif team_conf in G6_CONFERENCES:
+        return cfb_vector_ranking.TIER_G6
+    return cfb_vector_ranking.TIER_OTHER
+
+
+def encode_bulk_season(team_lookup):
+    """Encode team_lookup as parallel game arrays for cfb_vector_ranking"""
+    return cfb_vector_ranking.encode_season(
+        team_lookup,
+        tier_of=get_bulk_opponent_tier,
+        zone_of=TEAM_DIRECTORY.zone_order,
+        multiplier_of=get_bulk_conference_multiplier,
+        week_weight_of=get_temporal_weight_by_week
+    )
+
+
+def calculate_bulk_team_stats_vectorized(team_lookup):
+    """
+    Same output as calculate_bulk_team_stats, computed with NumPy array kernels.
+    The season is encoded once and every team is scored in a single pass.
+    """
+    with ranking_spans.span('bulk_rankings.encode_season'):
+        season = encode_bulk_season(team_lookup)
+    with ranking_spans.span('bulk_rankings.components'):
+        components = cfb_vector_ranking.compute_bulk_components(season)
+    
+    adjusted_totals = components['adjusted_total'].tolist()
+    sos_values = components['strength_of_schedule'].tolist()
+    opp_wins = components['opp_w'].tolist()
+    opp_losses = components['opp_l'].tolist()
+    
+    comprehensive_stats = []
+    for i, team_name in enumerate(season.team_names[:season.num_ranked]):
+        team_data = team_lookup[team_name]
+        adjusted_total = adjusted_totals[i]
+        strength_of_schedule = sos_values[i]
+        opponent_total_wins = int(opp_wins[i])
+        opponent_total_losses = int(opp_losses[i])
+        
+        comprehensive_stats.append({
+            'team': team_name,
+            'conference': get_team_conference(team_name),
+            'adjusted_total': round(adjusted_total, 3),
+            'total_wins': team_data['wins'],
+            'total_losses': team_data['losses'],
+            'points_fielded': team_data['points_for'],
+            'points_allowed': team_data['points_against'],
+            'margin_of_victory': team_data['margin_of_victory_total'],
+            'point_differential': team_data['points_for'] - team_data['points_against'],
+            'home_wins': team_data['home_wins'],
+            'road_wins': team_data['road_wins'],
+            'strength_of_schedule': round(strength_of_schedule, 3),
+            'totals': round(adjusted_total, 3),
+            'scientific_breakdown': {'total_score': adjusted_total},
+            'opp_w': opponent_total_wins,
+            'opp_l': opponent_total_losses,
+            'opp_wl_differential': opponent_total_wins - opponent_total_losses,
+            'strength_of_record': round(strength_of_schedule * (team_data['wins'] / max(1, team_data['wins'] + team_data['losses'])), 3)
+        })
+    
+    return comprehensive_stats
 
 
 def calculate_fast_stats(team_name, team_data, opponent_quality_cache):
@@ -3110,10 +5010,9 @@ def calculate_comprehensive_stats(team_name):
     """
     Calculate comprehensive stats - UPDATED to use database
     """
-    # Get team stats from database instead of global variable
-    team_stats_record = TeamStats.query.filter_by(team_name=team_name).first()
-    
-    if not team_stats_record:
+    # Shared ranking state: one season load per data revision instead of a query per opponent
+    state = get_opponent_quality_state()
+    if team_name not in state['season_data']:
         # Return default stats for teams with no games
         return {
             'adjusted_total': 0.0,
@@ -3130,11 +5029,12 @@ def calculate_comprehensive_stats(team_name):
             'scientific_breakdown': {'total_score': 0.0, 'components': {}}
         }
     
-    # Convert database record to the format your existing code expects
-    team_stats = team_stats_record.to_dict()
-    
-    # Continue with your existing calculation logic...
     scientific_result = calculate_enhanced_scientific_ranking(team_name)
+    return build_comprehensive_stats(team_name, state['season_data'], scientific_result)
+
+def build_comprehensive_stats(team_name, season_data, scientific_result):
+    """Comprehensive stats dict from loaded season data and the team's enhanced ranking"""
+    team_stats = season_data[team_name]
     
     # Calculate some legacy fields that other parts of code might expect
     total_games = team_stats['wins'] + team_stats['losses']
@@ -3145,10 +5045,8 @@ def calculate_comprehensive_stats(team_name):
     opponent_total_games = 0
     
     for game in team_stats['games']:
-        opponent = game['opponent']
-        opp_stats_record = TeamStats.query.filter_by(team_name=opponent).first()
-        if opp_stats_record:
-            opp_stats = opp_stats_record.to_dict()
+        opp_stats = season_data.get(game['opponent'])
+        if opp_stats:
             opponent_total_wins += opp_stats['wins']
             opponent_total_losses += opp_stats['losses']
             opponent_total_games += (opp_stats['wins'] + opp_stats['losses'])
@@ -3231,47 +5129,19 @@ def get_game_context_penalty(week, opponent):
     
     return penalty
 
+def get_team_time_zone(team):
+    """Time zone used for travel adjustments (Central when unknown)"""
+    return TEAM_DIRECTORY.time_zone(team)
+
 def calculate_travel_adjustment(team_name, opponent_name, location, is_loss=False):
     """Calculate adjustment for cross-country travel"""
     
-    # Time zone mappings
-    PACIFIC_TEAMS = ['Stanford', 'California', 'UCLA', 'USC', 'Oregon', 'Oregon State', 
-                     'Washington', 'Washington State', 'San Diego State', 'San Jose State',
-                     'Fresno State', 'Hawaii', 'Nevada', 'UNLV']
-    
-    MOUNTAIN_TEAMS = ['Colorado', 'Utah', 'Arizona', 'Arizona State', 'Boise State',
-                      'Colorado State', 'New Mexico', 'Utah State', 'Wyoming', 'Air Force']
-    
-    CENTRAL_TEAMS = ['Texas', 'Oklahoma', 'Texas A&M', 'LSU', 'Arkansas', 'Missouri',
-                     'Texas Tech', 'Oklahoma State', 'TCU', 'Baylor', 'Houston',
-                     'Kansas', 'Kansas State', 'Iowa State', 'Nebraska', 'Iowa',
-                     'Minnesota', 'Wisconsin', 'Illinois', 'Northwestern']
-    
-    EASTERN_TEAMS = ['Florida', 'Georgia', 'Alabama', 'Auburn', 'Tennessee', 'Kentucky',
-                     'South Carolina', 'Vanderbilt', 'Mississippi State', 'Ole Miss',
-                     'Clemson', 'Florida State', 'Miami', 'North Carolina', 'NC State',
-                     'Duke', 'Wake Forest', 'Virginia', 'Virginia Tech', 'Pittsburgh',
-                     'Syracuse', 'Boston College', 'Louisville', 'Georgia Tech',
-                     'Ohio State', 'Michigan', 'Penn State', 'Michigan State',
-                     'Indiana', 'Purdue', 'Maryland', 'Rutgers']
-    
-    def get_time_zone(team):
-        if team in PACIFIC_TEAMS: return 'Pacific'
-        elif team in MOUNTAIN_TEAMS: return 'Mountain'
-        elif team in CENTRAL_TEAMS: return 'Central'
-        elif team in EASTERN_TEAMS: return 'Eastern'
-        else: return 'Central'  # Default
-    
     # Only apply to away games
     if location != 'Away':
         return 0.0
     
-    team_zone = get_time_zone(team_name)
-    opp_zone = get_time_zone(opponent_name)
-    
     # Calculate time zone difference
-    zone_order = {'Pacific': 0, 'Mountain': 1, 'Central': 2, 'Eastern': 3}
-    zone_diff = abs(zone_order.get(team_zone, 2) - zone_order.get(opp_zone, 2))
+    zone_diff = abs(TEAM_DIRECTORY.zone_order(team_name) - TEAM_DIRECTORY.zone_order(opponent_name))
     
     if zone_diff >= 3:  # Cross-country travel (3+ time zones)
         if is_loss:
@@ -3306,13 +5176,14 @@ def is_conference_opponent(opponent_name):
 # MODULE 8: SCHEDULE QUALITY ASSESSOR
 # ===============================================
 
-def calculate_schedule_quality_penalty(team_name):
+def calculate_schedule_quality_penalty(team_name, games=None):
     """Penalize teams for playing too many weak opponents"""
-    team_record = TeamStats.query.filter_by(team_name=team_name).first()
-    if not team_record:
-        return 0.0
-    
-    games = team_record.to_dict()['games']
+    if games is None:
+        team_record = TeamStats.query.filter_by(team_name=team_name).first()
+        if not team_record:
+            return 0.0
+        
+        games = team_record.to_dict()['games']
     
     if len(games) < 8:  # Not enough games to assess
         return 0.0
@@ -3382,13 +5253,14 @@ def calculate_schedule_quality_penalty(team_name):
     
     return max(0.0, penalty)
 
-def calculate_strength_of_schedule_rating(team_name):
+def calculate_strength_of_schedule_rating(team_name, games=None):
     """Calculate a comprehensive strength of schedule rating"""
-    team_record = TeamStats.query.filter_by(team_name=team_name).first()
-    if not team_record:
-        return 5.0  # Neutral rating
-    
-    games = team_record.to_dict()['games']
+    if games is None:
+        team_record = TeamStats.query.filter_by(team_name=team_name).first()
+        if not team_record:
+            return 5.0  # Neutral rating
+        
+        games = team_record.to_dict()['games']
     
     if not games:
         return 5.0
@@ -3414,13 +5286,14 @@ def calculate_strength_of_schedule_rating(team_name):
     
     return round(avg_opp_quality, 2)
 
-def detect_schedule_manipulation(team_name):
+def detect_schedule_manipulation(team_name, games=None):
     """Detect potential schedule manipulation tactics"""
-    team_record = TeamStats.query.filter_by(team_name=team_name).first()
-    if not team_record:
-        return []
-    
-    games = team_record.to_dict()['games']
+    if games is None:
+        team_record = TeamStats.query.filter_by(team_name=team_name).first()
+        if not team_record:
+            return []
+        
+        games = team_record.to_dict()['games']
     issues = []
     
     # Check for late-season cupcakes
@@ -3667,6 +5540,83 @@ def test_core_functions():
         return f"<h2>❌ Error in core functions:</h2><p>{e}</p>"
 
 
+@app.route('/admin/strength_solver')
+@login_required
+def admin_strength_solver():
+    """Run the iterative strength solver and compare it with the basic strengths"""
+    from flask import jsonify
+    try:
+        season_data = load_season_team_data()
+        solve = solve_iterative_team_strengths(season_data)
+        basic_strengths = calculate_all_basic_team_strengths(season_data)
+        
+        top_teams = sorted(solve['strengths'].items(), key=lambda item: item[1], reverse=True)[:25]
+        return jsonify({
+            'model': OPPONENT_STRENGTH_MODEL,
+            'teams': len(season_data),
+            'iterations': solve['iterations'],
+            'converged': solve['converged'],
+            'residual': solve['residual'],
+            'elapsed_ms': solve['elapsed_ms'],
+            'top_teams': [
+                {
+                    'team': team_name,
+                    'iterative_strength': round(strength, 3),
+                    'basic_strength': round(basic_strengths.get(team_name, 5.0), 3)
+                }
+                for team_name, strength in top_teams
+            ]
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/admin/rankings/verify_incremental')
+@login_required
+def admin_verify_incremental_rankings():
+    """Check the incrementally maintained ranking state against a full recompute"""
+    from flask import jsonify
+    try:
+        result = verify_incremental_ranking_state()
+        result['mismatch_count'] = len(result['mismatches'])
+        result['mismatches'] = result['mismatches'][:50]
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/admin/rankings/materialized')
+@login_required
+def admin_materialized_rankings():
+    """Materialized ranking revision status - ?rebuild=1 recomputes the current revision"""
+    from flask import jsonify
+    try:
+        revision_key = get_ranking_revision_key()
+        if request.args.get('rebuild'):
+            ensure_ranking_result_table()
+            RankingResult.query.filter(RankingResult.revision == revision_key).delete(synchronize_session=False)
+            db.session.commit()
+            materialize_ranking_results(revision_key)
+        else:
+            ensure_ranking_result_table()
+
+        revisions = db.session.query(
+            RankingResult.revision, func.count(RankingResult.id), func.max(RankingResult.computed_at)
+        ).group_by(RankingResult.revision).all()
+        return jsonify({
+            'current_revision': revision_key,
+            'materialized': any(revision == revision_key for revision, _, _ in revisions),
+            'worker': ranking_recompute_worker.status(),
+            'static_export': static_export_runner.status(),
+            'revisions': [
+                {'revision': revision, 'teams': count, 'computed_at': str(computed_at)}
+                for revision, count, computed_at in revisions
+            ]
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/admin/ml/predict_week/<int:week>')
 @login_required
 def auto_predict_week(week):
@@ -4231,7 +6181,8 @@ def ai_explain_ranking(team_name):
         decoded_team_name = unquote(team_name)
         
         # Get team's current ranking data
-        all_teams_stats = get_all_team_stats_bulk()
+        ranking_context = get_ranking_context()
+        all_teams_stats = ranking_context.ranked_teams()
         team_ranking_data = None
         current_rank = 'NR'
         
@@ -4246,8 +6197,7 @@ def ai_explain_ranking(team_name):
             return redirect(url_for('rankings'))
         
         # Get detailed team stats
-        team_stats_record = TeamStats.query.filter_by(team_name=decoded_team_name).first()
-        team_stats = team_stats_record.to_dict() if team_stats_record else {}
+        team_stats = dict(ranking_context.team_stats(decoded_team_name) or {})
         
         # Get comparison teams (teams ranked similarly)
         comparison_teams = []
@@ -4609,24 +6559,8 @@ def update_team_stats_simplified(team, opponent, team_score, opp_score, is_home,
 
 def analyze_common_opponents(team1_name, team2_name):
     """Analyze how both teams performed against common opponents"""
-    team1_record = TeamStats.query.filter_by(team_name=team1_name).first()  # 
-    team2_record = TeamStats.query.filter_by(team_name=team2_name).first()  # 
-    
-    if not team1_record or not team2_record:  # 
-        return {  # 
-            'has_common': False,  # 
-            'comparison': [],  # 
-            'advantage': 0,  # 
-            'summary': "No common opponents"  # 
-        }  # 
-    
-    team1_games = team1_record.to_dict()['games']  # 
-    team2_games = team2_record.to_dict()['games']  # 
-    
-    # Find common opponents
-    team1_opponents = {game['opponent'] for game in team1_games}
-    team2_opponents = {game['opponent'] for game in team2_games}
-    common_opponents = team1_opponents.intersection(team2_opponents)
+    # Indexed query: only games against opponents both teams played
+    common_opponents = get_common_opponent_games(team1_name, team2_name)
     
     if not common_opponents:
         return {
@@ -4639,10 +6573,10 @@ def analyze_common_opponents(team1_name, team2_name):
     comparisons = []
     total_advantage = 0
     
-    for opponent in common_opponents:
-        # Find team1's game against this opponent
-        team1_game = next((g for g in team1_games if g['opponent'] == opponent), None)
-        team2_game = next((g for g in team2_games if g['opponent'] == opponent), None)
+    for opponent, (team1_games_vs, team2_games_vs) in common_opponents.items():
+        # First game each team played against this opponent
+        team1_game = team1_games_vs[0] if team1_games_vs else None
+        team2_game = team2_games_vs[0] if team2_games_vs else None
         
         if team1_game and team2_game:
             # Calculate point differential for each team
@@ -4672,16 +6606,8 @@ def analyze_common_opponents(team1_name, team2_name):
 
 def calculate_recent_form(team_name, games_back=4):
     """Calculate recent form over last N games"""
-    team_record = TeamStats.query.filter_by(team_name=team_name).first()  # 
-    if not team_record:  # 
-        return {  # 
-            'record': '0-0',  # 
-            'avg_margin': 0,  # 
-            'trending': 'neutral',  # 
-            'last_games': []  # 
-        }  # 
-    
-    games = team_record.to_dict()['games']  # 
+    # Indexed query for just the last N games
+    games = get_team_games(team_name, last_n=games_back)
     if len(games) < games_back:
         games_back = len(games)
     
@@ -4774,17 +6700,8 @@ def analyze_style_matchup(team1_name, team2_name):
 
 def head_to_head_history(team1_name, team2_name):
     """Check if teams have played each other recently"""
-    team1_record = TeamStats.query.filter_by(team_name=team1_name).first()  # 
-    if not team1_record:  # 
-        return {  # 
-            'has_history': False,  # 
-            'summary': "Teams have not played each other"  # 
-        }  # 
-    
-    team1_games = team1_record.to_dict()['games']  # 
-    
-    # Look for games against each other
-    h2h_games = [g for g in team1_games if g['opponent'] == team2_name]
+    # Look for games against each other (indexed on team + opponent)
+    h2h_games = get_team_games(team1_name, opponent=team2_name)
     
     if not h2h_games:
         return {
@@ -4902,6 +6819,7 @@ def predict_matchup_enhanced(team1_name, team2_name, location='neutral'):
     }
 
 @track_prediction('ultra_enhanced_matchup')
+@ranking_spans.timed('prediction.total')
 def predict_matchup_ultra_enhanced(team1_name, team2_name, location='neutral'):
     """
     ULTRA-ENHANCED matchup prediction using all 8 analytical modules
@@ -4944,8 +6862,9 @@ def predict_matchup_ultra_enhanced(team1_name, team2_name, location='neutral'):
             }
 
         # Get enhanced scientific rankings
-        team1_enhanced = calculate_enhanced_scientific_ranking(team1_name)
-        team2_enhanced = calculate_enhanced_scientific_ranking(team2_name)
+        with ranking_spans.span('prediction.team_rankings'):
+            team1_enhanced = calculate_enhanced_scientific_ranking(team1_name)
+            team2_enhanced = calculate_enhanced_scientific_ranking(team2_name)
         
         # ✅ FIXED: Much smaller base multiplier
         strength_diff = team1_enhanced['total_score'] - team2_enhanced['total_score']
@@ -4959,8 +6878,9 @@ def predict_matchup_ultra_enhanced(team1_name, team2_name, location='neutral'):
         
         # Module 1: Schedule strength (keep existing)
         try:
-            team1_schedule_strength = calculate_strength_of_schedule_rating(team1_name)
-            team2_schedule_strength = calculate_strength_of_schedule_rating(team2_name)
+            with ranking_spans.span('prediction.sos'):
+                team1_schedule_strength = calculate_strength_of_schedule_rating(team1_name)
+                team2_schedule_strength = calculate_strength_of_schedule_rating(team2_name)
             schedule_diff = (team1_schedule_strength - team2_schedule_strength) * 0.6  # Reduced from 0.8
             if abs(schedule_diff) > 0.5:
                 adjustments['Enhanced Schedule Strength'] = round(schedule_diff, 1)
@@ -4991,19 +6911,22 @@ def predict_matchup_ultra_enhanced(team1_name, team2_name, location='neutral'):
             adjustments['Consistency Advantage'] = round(consistency_diff, 1)
         
         # Enhanced location advantage (cap at reasonable values)
-        location_adj = calculate_enhanced_location_advantage(team1_name, team2_name, location)
+        with ranking_spans.span('prediction.location_advantage'):
+            location_adj = calculate_enhanced_location_advantage(team1_name, team2_name, location)
         location_adj = max(-4.5, min(4.5, location_adj))  # Cap home field at ±4.5
         if location_adj != 0:
             adjustments['Enhanced Home Field'] = round(location_adj, 1)
         
         # Enhanced common opponents
         try:
-            common_analysis = analyze_common_opponents_enhanced(team1_name, team2_name)
+            with ranking_spans.span('prediction.common_opponents'):
+                common_analysis = analyze_common_opponents_enhanced(team1_name, team2_name)
             if common_analysis['has_common'] and common_analysis['games_count'] >= 2:
                 common_adj = common_analysis['advantage'] * min(0.4, common_analysis['games_count'] * 0.15)  # Reduced from 0.5
                 adjustments['Enhanced Common Opponents'] = round(common_adj, 1)
         except:
-            common_analysis = analyze_common_opponents(team1_name, team2_name)
+            with ranking_spans.span('prediction.common_opponents'):
+                common_analysis = analyze_common_opponents(team1_name, team2_name)
             if common_analysis['has_common']:
                 adjustments['Common Opponents'] = round(common_analysis['advantage'] * 0.25, 1)  # Reduced from 0.3
         
@@ -5197,19 +7120,8 @@ def predict_matchup_basic_fallback(team1_name, team2_name, location):
 
 def analyze_common_opponents_enhanced(team1_name, team2_name):
     """Enhanced common opponent analysis with recency weighting"""
-    team1_record = TeamStats.query.filter_by(team_name=team1_name).first()  # 
-    team2_record = TeamStats.query.filter_by(team_name=team2_name).first()  # 
-    
-    if not team1_record or not team2_record:  # 
-        return {'has_common': False, 'advantage': 0, 'games_count': 0}  # 
-    
-    team1_games = team1_record.to_dict()['games']  # 
-    team2_games = team2_record.to_dict()['games']  # 
-    
-    # Find common opponents
-    team1_opponents = {game['opponent'] for game in team1_games}
-    team2_opponents = {game['opponent'] for game in team2_games}
-    common_opponents = team1_opponents.intersection(team2_opponents)
+    # Indexed query: only games against opponents both teams played
+    common_opponents = get_common_opponent_games(team1_name, team2_name)
     
     if not common_opponents:
         return {'has_common': False, 'advantage': 0, 'games_count': 0}
@@ -5219,11 +7131,8 @@ def analyze_common_opponents_enhanced(team1_name, team2_name):
     weighted_advantage = 0
     total_weight = 0
     
-    for opponent in common_opponents:
-        # Find most recent games against this opponent
-        team1_games_vs = [g for g in team1_games if g['opponent'] == opponent]
-        team2_games_vs = [g for g in team2_games if g['opponent'] == opponent]
-        
+    for opponent, (team1_games_vs, team2_games_vs) in common_opponents.items():
+        # Most recent games against this opponent
         if team1_games_vs and team2_games_vs:
             team1_game = team1_games_vs[-1]  # Most recent
             team2_game = team2_games_vs[-1]  # Most recent
@@ -5296,11 +7205,8 @@ def analyze_victory_quality_differential(team1_name, team2_name):
 
 def calculate_enhanced_recent_form(team_name, games_back=4):
     """Calculate enhanced recent form with momentum scoring"""
-    team_record = TeamStats.query.filter_by(team_name=team_name).first()  # 
-    if not team_record:  # 
-        return {'momentum_score': 0, 'trend': 'insufficient_data'}  # 
-    
-    games = team_record.to_dict()['games']  # 
+    # Indexed query for just the recent games (at least 2 to judge a trend)
+    games = get_team_games(team_name, last_n=max(games_back, 2))
     if len(games) < 2:
         return {'momentum_score': 0, 'trend': 'insufficient_data'}
     
@@ -5922,7 +7828,182 @@ def find_matching_scheduled_game(home_team, away_team, week):
     
     return None
 
-def update_team_stats_in_db(team, opponent, team_score, opp_score, is_home, is_neutral_site, is_overtime):
+# ===============================================
+# TEAM GAME LOG (cfb_team_games)
+# ===============================================
+# TeamStats.games_json is the legacy log; a team whose games_json is NULL keeps
+# its games as TeamGame rows. Teams move over on their next write or via the
+# /admin/migrate_team_games backfill.
+
+_team_game_table_ready = False
+
+def ensure_team_game_table():
+    """Create cfb_team_games on first use (existing databases predate the table)"""
+    global _team_game_table_ready
+    if _team_game_table_ready:
+        return
+    if db.session().in_transaction():
+        if sqlalchemy_inspect(db.engine).has_table(TeamGame.__tablename__):
+            # Already committed (another connection sees it) - nothing to create
+            _team_game_table_ready = True
+            return
+        # Mid-write (e.g. add_game outside a request): SQLite cannot run the DDL on another
+        # connection while this session holds the write lock - create it in the caller's
+        # transaction instead. Not marked ready, since the caller may still roll back.
+        TeamGame.__table__.create(db.session.connection(), checkfirst=True)
+        return
+    create_table_if_missing(TeamGame.__table__)
+    _team_game_table_ready = True
+
+def build_game_week_index(games):
+    """{(team, opponent, team_score, opp_score): [Game, ...]} from both teams' points of view"""
+    index = defaultdict(list)
+    for game in games:
+        index[(game.home_team, game.away_team, game.home_score, game.away_score)].append(game)
+        index[(game.away_team, game.home_team, game.away_score, game.home_score)].append(game)
+    return index
+
+def migrate_team_game_log(team_stats, game_index=None):
+    """
+    Move one team's games_json entries into TeamGame rows (same order) and mark it migrated.
+    Week and game_id come from the matching cfb_games row when one exists. Caller commits.
+    Returns the number of rows written.
+    """
+    if team_stats.games_migrated:
+        return 0
+    ensure_team_game_table()
+    
+    if game_index is None:
+        game_index = build_game_week_index(Game.query.filter(
+            or_(Game.home_team == team_stats.team_name, Game.away_team == team_stats.team_name)
+        ).order_by(Game.date_added, Game.id).all())
+    
+    legacy_games = team_stats.games
+    for sequence, game in enumerate(legacy_games):
+        matches = game_index.get((team_stats.team_name, game['opponent'], game['team_score'], game['opp_score']))
+        matched_game = matches.pop(0) if matches else None
+        db.session.add(TeamGame(
+            team_name=team_stats.team_name,
+            opponent=game['opponent'],
+            week=game.get('week') or (matched_game.week if matched_game else None),
+            result=game['result'],
+            team_score=game['team_score'],
+            opp_score=game['opp_score'],
+            home_away=game['home_away'],
+            overtime=bool(game.get('overtime', False)),
+            sequence=sequence,
+            game_id=matched_game.id if matched_game else None
+        ))
+    team_stats.games_json = None
+    return len(legacy_games)
+
+def get_team_games(team_name, opponent=None, last_n=None):
+    """
+    A team's games (games_json dict shape, oldest first) - indexed cfb_team_games query.
+    Filter to one opponent and/or keep only the last_n games. Un-migrated teams read games_json.
+    """
+    ensure_team_game_table()
+    query = TeamGame.query.filter_by(team_name=team_name)
+    if opponent is not None:
+        query = query.filter_by(opponent=opponent)
+    if last_n is not None:
+        rows = query.order_by(TeamGame.sequence.desc()).limit(last_n).all()[::-1]
+    else:
+        rows = query.order_by(TeamGame.sequence).all()
+    if rows:
+        return [row.to_dict() for row in rows]
+    
+    # No rows: either no games yet, or a legacy team still on games_json
+    team_record = TeamStats.query.filter_by(team_name=team_name).first()
+    if not team_record or team_record.games_migrated:
+        return []
+    games = team_record.games
+    if opponent is not None:
+        games = [game for game in games if game['opponent'] == opponent]
+    if last_n is not None:
+        games = games[-last_n:] if last_n > 0 else []
+    return games
+
+def get_common_opponent_games(team1_name, team2_name):
+    """
+    {opponent: (team1 games vs opponent, team2 games vs opponent)} for every common opponent,
+    in team1's schedule order. One indexed query once both teams are migrated.
+    """
+    ensure_team_game_table()
+    legacy_teams = TeamStats.query.filter(
+        TeamStats.team_name.in_([team1_name, team2_name]),
+        TeamStats.games_json.isnot(None)
+    ).count()
+    
+    if legacy_teams:
+        team1_games = get_team_games(team1_name)
+        team2_games = get_team_games(team2_name)
+    else:
+        team1_opponents = db.session.query(TeamGame.opponent).filter(TeamGame.team_name == team1_name)
+        team2_opponents = db.session.query(TeamGame.opponent).filter(TeamGame.team_name == team2_name)
+        rows = TeamGame.query.filter(
+            TeamGame.team_name.in_([team1_name, team2_name]),
+            TeamGame.opponent.in_(team1_opponents),
+            TeamGame.opponent.in_(team2_opponents)
+        ).order_by(TeamGame.sequence).all()
+        team1_games = [row.to_dict() for row in rows if row.team_name == team1_name]
+        team2_games = [row.to_dict() for row in rows if row.team_name == team2_name]
+    
+    team2_opponent_names = {game['opponent'] for game in team2_games}
+    common = {}
+    for game in team1_games:
+        if game['opponent'] in team2_opponent_names:
+            common.setdefault(game['opponent'], ([], []))[0].append(game)
+    for game in team2_games:
+        if game['opponent'] in common:
+            common[game['opponent']][1].append(game)
+    return common
+
+@app.route('/admin/migrate_team_games')
+@login_required
+def migrate_team_games():
+    """Backfill cfb_team_games from TeamStats.games_json (?dry_run=1 only counts)"""
+    try:
+        ensure_team_game_table()
+        
+        legacy_records = TeamStats.query.filter(TeamStats.games_json.isnot(None)).all()
+        legacy_games = sum(len(record.games) for record in legacy_records)
+        
+        if request.args.get('dry_run'):
+            return f"""
+            <h2>Team Game Log Migration (dry run)</h2>
+            <p>{len(legacy_records)} teams still on games_json, {legacy_games} team-games to move.</p>
+            <p><a href="/admin/migrate_team_games">Run migration</a> | <a href="/admin">Back to Admin</a></p>
+            """
+        
+        # One pass over cfb_games to recover each game's week
+        game_index = build_game_week_index(Game.query.order_by(Game.date_added, Game.id).all())
+        
+        rows_written = 0
+        for record in legacy_records:
+            rows_written += migrate_team_game_log(record, game_index)
+        db.session.flush()
+        weeks_matched = TeamGame.query.filter(TeamGame.game_id.isnot(None)).count()
+        db.session.commit()
+        bump_season_data_revision()
+        
+        return f"""
+        <h2>✅ Team Game Log Migration Complete</h2>
+        <ul>
+            <li>Teams migrated: {len(legacy_records)}</li>
+            <li>Team-games written: {rows_written}</li>
+            <li>Rows matched to a cfb_games week: {weeks_matched} of {TeamGame.query.count()}</li>
+        </ul>
+        <p><a href="/admin">Back to Admin</a></p>
+        """
+        
+    except Exception as e:
+        db.session.rollback()
+        return f"<h2>❌ Migration failed:</h2><p>{e}</p>"
+
+
+def update_team_stats_in_db(team, opponent, team_score, opp_score, is_home, is_neutral_site, is_overtime,
+                            week=None, game_id=None):
     """Update team statistics in database after a game"""
     
     # Special case: Don't update stats for FCS placeholder team
@@ -5953,8 +8034,9 @@ def update_team_stats_in_db(team, opponent, team_score, opp_score, is_home, is_n
             team_stats.road_wins = 0
         if team_stats.margin_of_victory_total is None:
             team_stats.margin_of_victory_total = 0
-        if team_stats.games_json is None:
-            team_stats.games_json = '[]'
+        
+        # Legacy JSON game log moves to cfb_team_games on the first write
+        migrate_team_game_log(team_stats)
         
         # Determine win/loss and update stats
         if team_score > opp_score:
@@ -5983,20 +8065,24 @@ def update_team_stats_in_db(team, opponent, team_score, opp_score, is_home, is_n
         else:
             location = 'Away'
         
-        # Add game to history
-        games_list = team_stats.games  # This uses the @property from models.py
-        games_list.append({
-            'opponent': opponent,
-            'team_score': team_score,
-            'opp_score': opp_score,
-            'result': 'W' if team_score > opp_score else 'L',
-            'home_away': location,
-            'overtime': is_overtime
-        })
-        team_stats.games = games_list  # This triggers the JSON serialization
+        # Add game to history - one appended row, no re-serialization of the season
+        last_sequence = db.session.query(func.max(TeamGame.sequence)).filter(TeamGame.team_name == team).scalar()
+        db.session.add(TeamGame(
+            team_name=team,
+            opponent=opponent,
+            week=week,
+            result='W' if team_score > opp_score else 'L',
+            team_score=team_score,
+            opp_score=opp_score,
+            home_away=location,
+            overtime=is_overtime,
+            sequence=(last_sequence + 1) if last_sequence is not None else 0,
+            game_id=game_id
+        ))
         
         # Save to database
         db.session.commit()
+        record_team_results_changed(team, opponent)
         
     except Exception as e:
         db.session.rollback()
@@ -6103,6 +8189,7 @@ def complete_schedule_import_db(games, week):
         
         # Save to database
         db.session.commit()
+        bump_season_data_revision(())
         
         total_scheduled = ScheduledGame.query.filter_by(week=week, completed=False).count()
         flash(f'✅ Successfully imported {games_added} games for Week {week}! (Total scheduled: {total_scheduled})', 'success')
@@ -6242,20 +8329,23 @@ def compare_teams():
             flash('Please select two different teams!', 'error')
             return redirect(url_for('team_compare'))
         
+        # Shared ranking computation for both teams
+        ranking_context = get_ranking_context()
+        
         # Check if teams exist
-        team1_record = TeamStats.query.filter_by(team_name=team1).first()  # 
-        if not team1_record:  # 
+        team1_record = ranking_context.team_stats(team1)
+        if not team1_record:
             flash(f'{team1} not found in database!', 'error')
             return redirect(url_for('team_compare'))
         
-        team2_record = TeamStats.query.filter_by(team_name=team2).first()  # 
-        if not team2_record:  # 
+        team2_record = ranking_context.team_stats(team2)
+        if not team2_record:
             flash(f'{team2} not found in database!', 'error') 
             return redirect(url_for('team_compare'))
         
         # Check if teams have played games
-        team1_games = len(team1_record.to_dict()['games'])  # 
-        team2_games = len(team2_record.to_dict()['games'])  # 
+        team1_games = len(team1_record['games'])
+        team2_games = len(team2_record['games'])
         
         
         if team1_games == 0:
@@ -6268,12 +8358,12 @@ def compare_teams():
         
         # Get basic stats (using your existing functions)
         
-        team1_stats = calculate_comprehensive_stats(team1)
-        team2_stats = calculate_comprehensive_stats(team2)
+        team1_stats = ranking_context.comprehensive_stats(team1)
+        team2_stats = ranking_context.comprehensive_stats(team2)
         
         
-        team1_scientific = calculate_enhanced_scientific_ranking(team1) 
-        team2_scientific = calculate_enhanced_scientific_ranking(team2)  
+        team1_scientific = ranking_context.enhanced_ranking(team1)
+        team2_scientific = ranking_context.enhanced_ranking(team2)
         
         
         # Use your ORIGINAL prediction function for now
@@ -6320,17 +8410,16 @@ def compare_teams():
 def team_preview(team_name):
     """Simple team preview for comparison page"""
     try:
-        team_record = TeamStats.query.filter_by(team_name=team_name).first()
-        if not team_record:
+        ranking_context = get_ranking_context()
+        basic_stats = ranking_context.team_stats(team_name)
+        if not basic_stats:
             return {'error': 'Team not found'}, 404
         
-        basic_stats = team_record.to_dict()
-        
         # Check if team has played games
         if basic_stats['wins'] + basic_stats['losses'] == 0:
             return {'error': 'No games played'}, 404
         
-        stats = calculate_comprehensive_stats(team_name)
+        stats = ranking_context.comprehensive_stats(team_name)
         
         # Get enhanced recent form
         enhanced_form = calculate_enhanced_recent_form(team_name)
@@ -6353,8 +8442,8 @@ def team_preview(team_name):
         recent_wins = sum(1 for g in recent_games if g['result'] == 'W')
         recent_record = f"{recent_wins}-{len(recent_games) - recent_wins}"
         
-        # Get current rank (simplified)
-        current_rank = "NR"  # You can enhance this later
+        # Current rank - same order as the rankings page
+        current_rank = ranking_context.rank(team_name)
         
         preview_data = {
             'team': team_name,
@@ -6657,6 +8746,7 @@ def create_snapshot():
         
         db.session.add(snapshot)
         db.session.commit()
+        schedule_static_export()
         
         flash(f'✅ Weekly snapshot "{week_name}" created successfully! ({len(rankings_data)} teams saved)', 'success')
         
@@ -6667,6 +8757,7 @@ def create_snapshot():
     return redirect(url_for('admin'))
 
 @app.route('/weekly_movement')
+@conditional_page
 def weekly_movement():
     """Show week-to-week ranking movements"""
     try:
@@ -6745,6 +8836,7 @@ def delete_snapshot(snapshot_id):
         
         db.session.delete(snapshot)
         db.session.commit()
+        schedule_static_export()
         
         flash(f'✅ Deleted snapshot "{week_name}"', 'success')
         
@@ -6829,7 +8921,9 @@ def admin():
                          games_data=all_games,
                          historical_rankings=[],
                          get_current_week_info=get_current_week_info,
-                         snapshots=snapshots)
+                         snapshots=snapshots,
+                         ranking_worker=ranking_recompute_worker.status(),
+                         static_export=static_export_runner.status())
 
 
 
@@ -6843,7 +8937,7 @@ def clear_cache_route():
     except Exception as e:
         flash(f'Error clearing cache: {e}', 'error')
     
-    return redirect(url_for('cache_management'))
+    return redirect(url_for('admin_perf'))
 
 @app.route('/admin/save-snapshot', methods=['POST'])
 def handle_save_snapshot():
@@ -6863,22 +8957,14 @@ def handle_save_snapshot():
 
 
 @app.route('/cfp_bracket')
+@conditional_page
 def cfp_bracket():
     """CFP bracket with correct automatic qualifiers"""
-    cache_key = 'cfp_bracket_correct_data'
-    
-    # Check cache first (3 minute cache)
-    if cache_key in performance_cache:
-        cached_bracket, timestamp = performance_cache[cache_key]
-        if time.time() - timestamp < 180:
-            return render_template('cfp_bracket.html', bracket=cached_bracket)
+    cache_key = f'cfp_bracket_correct_data@{get_season_data_revision()}'
     
     try:
-        # Use the corrected CFP bracket generation
-        bracket = generate_correct_cfp_bracket()  # ← Use new function
-        
-        # Cache the result
-        performance_cache[cache_key] = (bracket, time.time())
+        # Cached until the next write; concurrent misses generate the bracket once
+        bracket = get_or_compute_from_rankings(cache_key, generate_correct_cfp_bracket, namespace='cfp_bracket')
         
         return render_template('cfp_bracket.html', bracket=bracket)
         
@@ -6892,6 +8978,9 @@ def cfp_bracket():
         """
 
 
+# Conferences whose champions compete for the CFP automatic bids
+CFP_CHAMPION_CONFERENCES = ['SEC', 'Big Ten', 'ACC', 'Big XII', 'American', 'Conference USA', 'MAC', 'Mountain West', 'Sun Belt']
+
 def generate_correct_cfp_bracket():
     """Generate 12-team CFP bracket with correct automatic qualifier logic"""
     try:
@@ -6900,9 +8989,8 @@ def generate_correct_cfp_bracket():
         
         # Step 1: Find the champion of each conference
         conference_champions = {}
-        conferences_to_check = ['SEC', 'Big Ten', 'ACC', 'Big XII', 'American', 'Conference USA', 'MAC', 'Mountain West', 'Sun Belt']
         
-        for conf_name in conferences_to_check:
+        for conf_name in CFP_CHAMPION_CONFERENCES:
             # Find highest-ranked team from this conference
             conf_teams = [team for team in all_teams_stats if team['conference'] == conf_name]
             if conf_teams:
@@ -7012,6 +9100,177 @@ def generate_fast_cfp_bracket(all_teams_stats):
         }   
 
 
+# ===============================================
+# SEASON SIMULATOR (Monte Carlo CFP / bowl odds)
+# ===============================================
+# Plays out every pending ScheduledGame thousands of times with win probabilities
+# from predict_matchup_ultra_enhanced, re-ranks each simulated season with the
+# bulk ranking kernel and applies the generate_correct_cfp_bracket selection rules.
+# The array work lives in cfb_season_simulator; batches run on RANKING_WORKERS processes.
+
+SEASON_SIMULATOR_DEFAULT_SEASONS = 10000
+SEASON_SIMULATOR_MAX_SEASONS = 100000
+
+def matchup_team1_win_probability(prediction, team1_name):
+    """
+    Team 1's win probability (0-1) from a predict_matchup_* result.
+    win_probability is team 1's chance, except the FCS shortcuts which give the winner's.
+    """
+    probability = prediction['win_probability'] / 100.0
+    if prediction.get('prediction_methodology', '').startswith('FCS'):
+        return probability if prediction['winner'] == team1_name else 1.0 - probability
+    return probability
+
+def build_season_simulation_problem(pending_games=None):
+    """
+    Encode the current season plus every pending game (default: all incomplete
+    ScheduledGame rows) as a cfb_season_simulator.SimulationProblem.
+    Each pending game gets a placeholder row per FBS side; the simulator fills in results.
+    """
+    season_data = get_opponent_quality_state()['season_data']
+    if pending_games is None:
+        pending_games = ScheduledGame.query.filter(ScheduledGame.completed == False).order_by(ScheduledGame.id).all()
+    
+    team_lookup = {team_name: dict(stats, games=list(stats['games'])) for team_name, stats in season_data.items()}
+    # Undecorated predictor - simulation odds are not tracked predictions
+    predict = getattr(predict_matchup_ultra_enhanced, '__wrapped__', predict_matchup_ultra_enhanced)
+    predictions = {}
+    home_win_prob = []
+    home_spread = []
+    vs_fcs = []
+    
+    for index, game in enumerate(pending_games):
+        home_team, away_team, neutral = game.home_team, game.away_team, bool(game.neutral)
+        key = (home_team, away_team, neutral)
+        if key not in predictions:
+            prediction = predict(home_team, away_team, 'neutral' if neutral else 'team1_home')
+            favorite_margin = abs(prediction['final_margin'])
+            predictions[key] = (
+                matchup_team1_win_probability(prediction, home_team),
+                favorite_margin if prediction['winner'] == home_team else -favorite_margin
+            )
+        home_win_prob.append(predictions[key][0])
+        home_spread.append(predictions[key][1])
+        vs_fcs.append(is_fcs_opponent(home_team) or is_fcs_opponent(away_team))
+        
+        for team, opponent, side in ((home_team, away_team, 'home'), (away_team, home_team, 'away')):
+            if is_fcs_opponent(team):
+                continue  # FCS placeholder teams have no stats row
+            if team not in team_lookup:
+                team_lookup[team] = {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0,
+                                     'home_wins': 0, 'road_wins': 0, 'margin_of_victory_total': 0, 'games': []}
+            team_lookup[team]['games'].append({
+                'opponent': opponent,
+                'team_score': 0,
+                'opp_score': 0,
+                'result': 'L',
+                'home_away': 'Neutral' if neutral else ('Home' if side == 'home' else 'Away'),
+                'overtime': False,
+                'pending_game': index,
+                'pending_side': side
+            })
+    
+    # Teams with completed or pending games, in the bulk ranking order
+    team_lookup = {team_name: stats for team_name, stats in team_lookup.items() if stats['games']}
+    season = encode_bulk_season(team_lookup)
+    
+    # Row of each pending side - encode_season lays rows out team by team, game by game
+    num_pending = len(pending_games)
+    home_row = [-1] * num_pending
+    away_row = [-1] * num_pending
+    real_wins = [0] * season.num_teams
+    row = 0
+    for team_name, stats in team_lookup.items():
+        for game in stats['games']:
+            if 'pending_game' in game:
+                (home_row if game['pending_side'] == 'home' else away_row)[game['pending_game']] = row
+            elif game['result'] == 'W' and not is_fcs_opponent(game['opponent']):
+                real_wins[season.team_index[team_name]] += 1
+            row += 1
+    
+    def side_team(team):
+        return -1 if is_fcs_opponent(team) else season.team_index[team]
+    
+    return cfb_season_simulator.SimulationProblem(
+        season=season,
+        home_row=home_row,
+        away_row=away_row,
+        home_team=[side_team(game.home_team) for game in pending_games],
+        away_team=[side_team(game.away_team) for game in pending_games],
+        home_win_prob=home_win_prob,
+        home_spread=home_spread,
+        vs_fcs=vs_fcs,
+        real_wins=real_wins,
+        conference_code=[
+            CFP_CHAMPION_CONFERENCES.index(conference) if conference in CFP_CHAMPION_CONFERENCES else -1
+            for conference in (get_team_conference(team_name) for team_name in season.team_names[:season.num_ranked])
+        ],
+        champion_conferences=CFP_CHAMPION_CONFERENCES
+    )
+
+def simulate_remaining_season(num_seasons=SEASON_SIMULATOR_DEFAULT_SEASONS, seed=None, workers=None):
+    """
+    Monte Carlo odds for every team: CFP berth, first-round bye, conference title
+    (highest-ranked team in a CFP_CHAMPION_CONFERENCES conference) and bowl eligibility.
+    Pass seed for reproducible odds; the seed used is always returned.
+    """
+    if not CFB_SEASON_SIMULATOR_ENABLED:
+        raise RuntimeError('cfb_season_simulator is not available (NumPy required)')
+    
+    start_time = time.perf_counter()
+    problem = build_season_simulation_problem()
+    if problem.num_ranked == 0:
+        raise ValueError('No teams with games to simulate')
+    setup_ms = (time.perf_counter() - start_time) * 1000
+    
+    workers = RANKING_WORKERS if workers is None else max(1, workers)
+    start_time = time.perf_counter()
+    totals = cfb_season_simulator.run_simulation(problem, num_seasons, seed=seed, workers=workers)
+    simulation_ms = (time.perf_counter() - start_time) * 1000
+    
+    current_ranks = {stats['team']: rank for rank, stats in enumerate(get_all_team_stats_bulk(), 1)}
+    teams = []
+    for i, team_name in enumerate(problem.season.team_names[:problem.num_ranked]):
+        teams.append({
+            'team': team_name,
+            'conference': get_team_conference(team_name),
+            'current_rank': current_ranks.get(team_name, 'NR'),
+            'playoff_odds': round(float(totals['playoff'][i]) * 100 / num_seasons, 2),
+            'bye_odds': round(float(totals['bye'][i]) * 100 / num_seasons, 2),
+            'conference_title_odds': round(float(totals['conference_title'][i]) * 100 / num_seasons, 2),
+            'bowl_eligible_odds': round(float(totals['bowl_eligible'][i]) * 100 / num_seasons, 2),
+            'average_rank': round(float(totals['rank_total'][i]) / num_seasons, 2),
+            'average_wins': round(float(totals['win_total'][i]) / num_seasons, 2)
+        })
+    teams.sort(key=lambda x: (-x['playoff_odds'], x['average_rank']))
+    
+    return {
+        'seasons': num_seasons,
+        'seed': totals['seed'],
+        'workers': workers,
+        'pending_games': problem.num_pending,
+        'setup_ms': round(setup_ms, 1),
+        'simulation_ms': round(simulation_ms, 1),
+        'teams': teams
+    }
+
+@app.route('/admin/season_simulator')
+@login_required
+def admin_season_simulator():
+    """Monte Carlo CFP/bowl odds - ?seasons=10000&seed=42&workers=8"""
+    from flask import jsonify
+    try:
+        num_seasons = min(SEASON_SIMULATOR_MAX_SEASONS,
+                          max(1, request.args.get('seasons', SEASON_SIMULATOR_DEFAULT_SEASONS, type=int)))
+        return jsonify(simulate_remaining_season(
+            num_seasons,
+            seed=request.args.get('seed', type=int),
+            workers=request.args.get('workers', type=int)
+        ))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 def calculate_p4_G6_records(team_name, games):
     """Calculate P4/G6 records from games data"""
     p4_wins = 0
@@ -7065,6 +9324,7 @@ def team_detail(team_name):
     return redirect(url_for('public_team_detail', team_name=team_name))
 
 @app.route('/team/<team_name>')
+@conditional_page
 @time_route 
 def public_team_detail(team_name):
     """Team detail page - works even for teams with no games"""
@@ -7079,35 +9339,30 @@ def public_team_detail(team_name):
         flash(f'Team "{decoded_team_name}" is not a valid FBS team!', 'error')
         return redirect(url_for('public_rankings'))
     
-    # Get team stats from database (might not exist)
-    team_stats_record = TeamStats.query.filter_by(team_name=decoded_team_name).first()
+    # One ranking computation for the whole page (bulk rank, components, qualities, victory values)
+    ranking_context = get_ranking_context()
+    
+    # Get team stats (might not exist)
+    team_stats_record = ranking_context.team_stats(decoded_team_name)
     
     if team_stats_record:
         # Team has games - use bulk data (same as rankings page)
-        basic_stats = team_stats_record.to_dict()
+        basic_stats = dict(team_stats_record)
         has_games = (basic_stats['wins'] + basic_stats['losses']) > 0
         
         if has_games:
             try:
                 # Use the SAME data source as the rankings page
-                all_teams_stats = get_all_team_stats_bulk()
-                
-                # Find this team in the bulk data
-                team_data = None
-                current_rank = 'NR'
-                for i, team in enumerate(all_teams_stats):
-                    if team['team'] == decoded_team_name:
-                        team_data = team
-                        current_rank = i + 1
-                        break
+                team_data = ranking_context.bulk_stats(decoded_team_name)
+                current_rank = ranking_context.rank(decoded_team_name)
                 
                 if team_data:
                     adjusted_total = team_data['adjusted_total']
-                    total_teams_ranked = len(all_teams_stats)
+                    total_teams_ranked = ranking_context.total_teams_ranked
                     
                     # Get detailed breakdown for components
                     try:
-                        enhanced_scientific = calculate_enhanced_scientific_ranking(decoded_team_name)
+                        enhanced_scientific = ranking_context.enhanced_ranking(decoded_team_name)
                         components = enhanced_scientific.get('components', {})
                     except Exception as e:
                         components = {}
@@ -7123,7 +9378,7 @@ def public_team_detail(team_name):
                     }
                 else:
                     # Fallback if not found in bulk data
-                    comprehensive_stats = calculate_comprehensive_stats(decoded_team_name)
+                    comprehensive_stats = ranking_context.comprehensive_stats(decoded_team_name)
                     adjusted_total = comprehensive_stats['adjusted_total']
                     current_rank = 'NR'
                     total_teams_ranked = 0
@@ -7190,18 +9445,19 @@ def public_team_detail(team_name):
         win_opponents = []
         win_margins = []
         
-        for game in basic_stats['games']:
+        try:
+            game_victory_values = ranking_context.victory_values(decoded_team_name)
+        except Exception:
+            game_victory_values = [1.0] * len(basic_stats['games'])  # Fallback values
+        
+        for game, value in zip(basic_stats['games'], game_victory_values):
             # Victory values (only for wins)
             if game['result'] == 'W':
                 week = game.get('week', 'Unknown')
                 game_weeks.append(f"Week {week}")
                 
-                # Calculate victory value for this win
-                try:
-                    value = calculate_victory_value_with_rivalry(game, decoded_team_name)
-                    victory_values.append(round(value, 2))
-                except:
-                    victory_values.append(1.0)  # Fallback value
+                # Victory value for this win
+                victory_values.append(round(value, 2))
                 
                 # Count wins by location
                 if game['home_away'] == 'Home':
@@ -7217,7 +9473,7 @@ def public_team_detail(team_name):
             
             # Opponent quality distribution (all games)
             try:
-                opponent_quality = get_current_opponent_quality(game['opponent'])
+                opponent_quality = ranking_context.opponent_quality(game['opponent'])
                 if opponent_quality <= 3:
                     quality_buckets[0] += 1  # Weak
                 elif opponent_quality <= 6:
@@ -7260,7 +9516,7 @@ def public_team_detail(team_name):
     opponent_details = []
     for game in basic_stats['games']:
         try:
-            opponent_quality = get_current_opponent_quality(game['opponent'])
+            opponent_quality = ranking_context.opponent_quality(game['opponent'])
             is_rival = is_rivalry_game(decoded_team_name, game['opponent'])
             rivalry_bonus = get_rivalry_bonus(decoded_team_name, game['opponent']) if is_rival else 0
         except:
@@ -7360,6 +9616,7 @@ def public_landing():
 
 @app.route('/rankings')
 @app.route('/rankings/<conference>')
+@conditional_page
 @time_route
 def rankings(conference=None):
     """Main rankings page with comprehensive team statistics and conference filtering"""
@@ -7577,6 +9834,7 @@ def process_clarifications():
 
 @app.route('/scoreboard')
 @app.route('/scoreboard/<week>')
+@conditional_page
 @time_route
 def scoreboard(week=None):
     
@@ -8644,10 +10902,13 @@ def add_game():
                 bowl_game_name=bowl_game_name
             )
             db.session.add(game)
+            db.session.flush()  # Assign game.id for the team game log
             
             # Update team statistics
-            update_team_stats_in_db(home_team, away_team, home_score, away_score, True, is_neutral_site, is_overtime)
-            update_team_stats_in_db(away_team, home_team, away_score, home_score, False, is_neutral_site, is_overtime)
+            update_team_stats_in_db(home_team, away_team, home_score, away_score, True, is_neutral_site, is_overtime,
+                                    week=week, game_id=game.id)
+            update_team_stats_in_db(away_team, home_team, away_score, home_score, False, is_neutral_site, is_overtime,
+                                    week=week, game_id=game.id)
             
             # Commit the game addition first
             db.session.commit()
@@ -8741,6 +11002,9 @@ def add_game():
                 import traceback
                 flash(f'Full error: {traceback.format_exc()}', 'error')
             
+            # The scheduled game's completion is part of the season data too
+            bump_season_data_revision((home_team, away_team))
+            
             # Remember the selected week for next time
             session['last_selected_week'] = week
             
@@ -9142,10 +11406,13 @@ def add_bulk_games():
                 bowl_game_name=bowl_game_name
             )
             db.session.add(game)
+            db.session.flush()  # Assign game.id for the team game log
             
             # Update team stats
-            update_team_stats_in_db(home_team, away_team, home_score, away_score, True, neutral_site, overtime)
-            update_team_stats_in_db(away_team, home_team, away_score, home_score, False, neutral_site, overtime)
+            update_team_stats_in_db(home_team, away_team, home_score, away_score, True, neutral_site, overtime,
+                                    week=week, game_id=game.id)
+            update_team_stats_in_db(away_team, home_team, away_score, home_score, False, neutral_site, overtime,
+                                    week=week, game_id=game.id)
             
             games_added += 1
 
@@ -9182,8 +11449,9 @@ def add_bulk_games():
             except Exception as e:
                 flash(f'Warning: Could not update scheduled game for {home_team} vs {away_team}: {e}', 'warning')
         
-        # Commit all changes at once
+        # Commit all changes at once (each team's results were recorded as they were added)
         db.session.commit()
+        bump_season_data_revision(())
         
         if games_added > 0:
             if scheduled_games_updated > 0:
@@ -9630,6 +11898,7 @@ def remove_game(game_id):
         # Remove the game from games table
         db.session.delete(game)
         db.session.commit()
+        bump_season_data_revision((home_team, away_team))
         
         if scheduled_game:
             flash(f'✅ Removed game and reset to scheduled: {home_team} {home_score}-{away_score} {away_team} (Week {week})', 'success')
@@ -9660,6 +11929,7 @@ def remove_scheduled_game(scheduled_game_id):
         # Remove the scheduled game
         db.session.delete(scheduled_game)
         db.session.commit()
+        bump_season_data_revision(())
         
         # Format the flash message
         date_text = f" on {game_date}" if game_date else ""
@@ -9700,17 +11970,17 @@ def reverse_team_stats_in_db(team, opponent, team_score, opp_score, is_home, is_
     team_stats_record.points_for = max(0, team_stats_record.points_for - team_score)
     team_stats_record.points_against = max(0, team_stats_record.points_against - opp_score)
     
-    # Remove game from history
-    games_list = team_stats_record.games
-    # Remove the specific game (match on opponent and scores)
-    games_list = [g for g in games_list if not (
-        g['opponent'] == opponent and 
-        g['team_score'] == team_score and 
-        g['opp_score'] == opp_score
-    )]
-    team_stats_record.games = games_list
+    # Remove game from history (match on opponent and scores)
+    migrate_team_game_log(team_stats_record)
+    TeamGame.query.filter_by(
+        team_name=team,
+        opponent=opponent,
+        team_score=team_score,
+        opp_score=opp_score
+    ).delete(synchronize_session=False)
     
     db.session.commit()
+    record_team_results_changed(team, opponent)
 
 @app.route('/manage_games')
 @login_required
@@ -10171,79 +12441,16 @@ def analyze_fcs_games():
 
 
 @app.route('/bowl_projections')
+@conditional_page
 def bowl_projections():
     """Bowl projections with proper conference tie-ins"""
-    cache_key = 'bowl_projections_data'
-    
-    # Check cache first (5 minute cache)
-    if cache_key in performance_cache:
-        cached_data, timestamp = performance_cache[cache_key]
-        if time.time() - timestamp < 300:  
-            return render_template('bowl_projections.html', **cached_data)
+    cache_key = f'bowl_projections_data@{get_season_data_revision()}'
     
     try:
-        # Get all teams with proper ranking
-        all_teams_stats = get_all_team_stats_bulk()
-        
-        # Find teams with 4+ wins (early season adjustment)
-        bowl_eligible = []
-        teams_with_games = []
-        
-        for team in all_teams_stats:
-            total_games = team['total_wins'] + team['total_losses']
-            if total_games > 0:
-                teams_with_games.append(team)
-                if team['total_wins'] >= 4:  # Using 4+ for early season
-                    bowl_eligible.append(team)
-        
-        print(f"BOWL DEBUG: Found {len(bowl_eligible)} teams with 4+ wins")
-        
-        # Generate CFP bracket (top 12 teams)
-        cfp_teams = all_teams_stats[:12] if len(all_teams_stats) >= 12 else all_teams_stats
-        for i, team in enumerate(cfp_teams):
-            team['seed'] = i + 1
-        
-        cfp_bracket = {
-            'first_round_byes': cfp_teams[:4],
-            'all_teams': cfp_teams,
-            'automatic_qualifiers': cfp_teams[:5],
-            'first_round_games': create_simple_first_round_games(cfp_teams),
-            'conference_champions': {}
-        }
-        
-        # Remove CFP teams from bowl pool
-        cfp_team_names = {team['team'] for team in cfp_teams}
-        non_cfp_bowl_eligible = [team for team in bowl_eligible if team['team'] not in cfp_team_names]
-        
-        print(f"BOWL DEBUG: After removing CFP teams, {len(non_cfp_bowl_eligible)} teams available for bowls")
-        
-        # Group teams by conference for tie-in assignments
-        teams_by_conference = {}
-        for team in non_cfp_bowl_eligible:
-            conf = team['conference']
-            if conf not in teams_by_conference:
-                teams_by_conference[conf] = []
-            teams_by_conference[conf].append(team)
-        
-        # Sort teams within each conference by ranking
-        for conf in teams_by_conference:
-            teams_by_conference[conf].sort(key=lambda x: x['adjusted_total'], reverse=True)
-        
-        print(f"BOWL DEBUG: Teams by conference:")
-        for conf, teams in teams_by_conference.items():
-            print(f"  {conf}: {len(teams)} teams")
-        
-        # Create bowls with proper tie-ins using your BOWL_GAMES data
-        bowls_by_tier = create_bowls_with_tieins(teams_by_conference, non_cfp_bowl_eligible)
-        
-        template_data = {
-            'cfp_bracket': cfp_bracket,
-            'bowls_by_tier': bowls_by_tier,
-            'total_bowl_teams': len(bowl_eligible)
-        }
-        
-        # Cache the result
-        performance_cache[cache_key] = (template_data, time.time())
+        # Cached until the next write; concurrent misses build the projections once
+        template_data = get_or_compute_from_rankings(
+            cache_key, build_bowl_projections_data, namespace='bowl_projections'
+        )
         
         return render_template('bowl_projections.html', **template_data)
         
@@ -10256,6 +12463,70 @@ def bowl_projections():
                              bowls_by_tier={'NY6': [], 'Major': [], 'Conference': [], 'G6': [], 'Championship': []},
                              total_bowl_teams=0)
 
+def build_bowl_projections_data():
+    """CFP field and tie-in bowl assignments - the /bowl_projections template data"""
+    # Get all teams with proper ranking
+    all_teams_stats = get_all_team_stats_bulk()
+    
+    # Find teams with 4+ wins (early season adjustment)
+    bowl_eligible = []
+    teams_with_games = []
+    
+    for team in all_teams_stats:
+        total_games = team['total_wins'] + team['total_losses']
+        if total_games > 0:
+            teams_with_games.append(team)
+            if team['total_wins'] >= 4:  # Using 4+ for early season
+                bowl_eligible.append(team)
+    
+    print(f"BOWL DEBUG: Found {len(bowl_eligible)} teams with 4+ wins")
+    
+    # Generate CFP bracket (top 12 teams)
+    cfp_teams = all_teams_stats[:12] if len(all_teams_stats) >= 12 else all_teams_stats
+    for i, team in enumerate(cfp_teams):
+        team['seed'] = i + 1
+    
+    cfp_bracket = {
+        'first_round_byes': cfp_teams[:4],
+        'all_teams': cfp_teams,
+        'automatic_qualifiers': cfp_teams[:5],
+        'first_round_games': create_simple_first_round_games(cfp_teams),
+        'conference_champions': {}
+    }
+    
+    # Remove CFP teams from bowl pool
+    cfp_team_names = {team['team'] for team in cfp_teams}
+    non_cfp_bowl_eligible = [team for team in bowl_eligible if team['team'] not in cfp_team_names]
+    
+    print(f"BOWL DEBUG: After removing CFP teams, {len(non_cfp_bowl_eligible)} teams available for bowls")
+    
+    # Group teams by conference for tie-in assignments
+    teams_by_conference = {}
+    for team in non_cfp_bowl_eligible:
+        conf = team['conference']
+        if conf not in teams_by_conference:
+            teams_by_conference[conf] = []
+        teams_by_conference[conf].append(team)
+    
+    # Sort teams within each conference by ranking
+    for conf in teams_by_conference:
+        teams_by_conference[conf].sort(key=lambda x: x['adjusted_total'], reverse=True)
+    
+    print(f"BOWL DEBUG: Teams by conference:")
+    for conf, teams in teams_by_conference.items():
+        print(f"  {conf}: {len(teams)} teams")
+    
+    # Create bowls with proper tie-ins using your BOWL_GAMES data
+    bowls_by_tier = create_bowls_with_tieins(teams_by_conference, non_cfp_bowl_eligible)
+    
+    template_data = {
+        'cfp_bracket': cfp_bracket,
+        'bowls_by_tier': bowls_by_tier,
+        'total_bowl_teams': len(bowl_eligible)
+    }
+
+    return template_data
+
 def create_bowls_with_tieins(teams_by_conference, all_available_teams):
     """Create bowls using proper conference tie-ins from BOWL_GAMES"""
     
@@ -10400,12 +12671,14 @@ def reset_data():
         
         # Clear all team stats from database
         TeamStats.query.delete()
+        TeamGame.query.delete()
         
         # NEW: Clear all scheduled games from database
         ScheduledGame.query.delete()
         
         # Commit the deletions
         db.session.commit()
+        bump_season_data_revision()
         
         flash('All data has been reset!', 'success')
         
@@ -10415,6 +12688,69 @@ def reset_data():
     
     return redirect(url_for('admin'))
 
+# ===============================================
+# PARALLEL RANKING (snapshots and season archive)
+# ===============================================
+# Ranks teams across a process pool. Each worker process decodes one read-only
+# JSON snapshot of the season (team stats + opponent qualities) - no database
+# access - and ranks a contiguous chunk of teams. Results are merged back in the
+# original team order, so the output never depends on which worker finished first.
+# RANKING_WORKERS=1 (default) ranks serially in-process. Inside the threaded server
+# the pool spawns its workers instead of forking (cfb_performance.process_pool_context):
+# each imports this module once per pool, so it pays off for large seasons only.
+RANKING_WORKERS = max(1, int(os.environ.get('RANKING_WORKERS', '1')))
+RANKING_CHUNKS_PER_WORKER = 4
+
+_ranking_worker_snapshot = None
+
+def _init_ranking_worker(snapshot_json):
+    """Process pool initializer: decode the season snapshot once per worker"""
+    global _ranking_worker_snapshot
+    _ranking_worker_snapshot = json.loads(snapshot_json)
+
+def _rank_team_chunk(team_names):
+    """Worker task: enhanced rankings for a chunk of teams from the worker's snapshot"""
+    season_data = _ranking_worker_snapshot['season_data']
+    quality_table = _ranking_worker_snapshot['qualities']
+    return [
+        (team_name, calculate_enhanced_scientific_ranking(team_name, season_data, quality_table))
+        for team_name in team_names
+    ]
+
+def rank_teams_parallel(season_data, quality_table, team_names=None, workers=None):
+    """
+    {team_name: calculate_enhanced_scientific_ranking(...)} for team_names (default
+    every team in season_data), in team_names order. workers defaults to RANKING_WORKERS.
+    """
+    team_names = list(season_data.keys()) if team_names is None else list(team_names)
+    workers = RANKING_WORKERS if workers is None else max(1, workers)
+    workers = min(workers, len(team_names))
+    
+    if workers <= 1:
+        return {
+            team_name: calculate_enhanced_scientific_ranking(team_name, season_data, quality_table)
+            for team_name in team_names
+        }
+    
+    start_time = time.perf_counter()
+    chunk_size = max(1, math.ceil(len(team_names) / (workers * RANKING_CHUNKS_PER_WORKER)))
+    chunks = [team_names[i:i + chunk_size] for i in range(0, len(team_names), chunk_size)]
+    snapshot_json = json.dumps({'season_data': season_data, 'qualities': quality_table})
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=cfb_performance.process_pool_context(),
+                                 initializer=_init_ranking_worker, initargs=(snapshot_json,)) as executor:
+            ranked = {}
+            for chunk_results in executor.map(_rank_team_chunk, chunks):
+                ranked.update(chunk_results)
+    except Exception as e:
+        print(f"⚠️ Parallel ranking failed ({e}) - ranking serially")
+        return rank_teams_parallel(season_data, quality_table, team_names, workers=1)
+    
+    print(f"⚡ Ranked {len(team_names)} teams on {workers} processes in {(time.perf_counter() - start_time) * 1000:.0f}ms")
+    return {team_name: ranked[team_name] for team_name in team_names}
+
+
 def save_weekly_snapshot(week_number):
     """Save current rankings as a weekly snapshot for ML training"""
     try:
@@ -10441,6 +12777,7 @@ def save_weekly_snapshot(week_number):
             db.session.add(snapshot)
         
         db.session.commit()
+        schedule_static_export()
         flash(f'Successfully saved snapshot for {week_name}!', 'success')
         print(f"✅ Successfully saved snapshot for {week_name}")
         return True
@@ -10458,24 +12795,22 @@ def calculate_all_team_rankings():
     Returns list of dicts with team rankings for snapshot saving
     """
     try:
-        all_teams = TeamStats.query.all()
+        state = get_opponent_quality_state()
+        season_data = state['season_data']
+        enhanced_results = state['enhanced_rankings']
+        if enhanced_results is None:
+            enhanced_results = rank_teams_parallel(season_data, state['qualities'])
         rankings = []
         
-        for team in all_teams:
-            try:
-                # Use your enhanced scientific ranking function
-                team_data = calculate_enhanced_scientific_ranking(team.team_name)
-                
-                rankings.append({
-                    'team': team.team_name,
-                    'rating': team_data['total_score'],
-                    'rank': 0,  # Will be set after sorting
-                    'record': f"{team.wins}-{team.losses}",
-                    'components': team_data['components']
-                })
-            except Exception as e:
-                print(f"Error calculating ranking for {team.team_name}: {e}")
-                continue
+        for team_name, stats in season_data.items():
+            team_data = enhanced_results[team_name]
+            rankings.append({
+                'team': team_name,
+                'rating': team_data['total_score'],
+                'rank': 0,  # Will be set after sorting
+                'record': f"{stats['wins']}-{stats['losses']}",
+                'components': team_data['components']
+            })
         
         # Sort by rating (highest first) and assign ranks
         rankings.sort(key=lambda x: x['rating'], reverse=True)
@@ -10547,16 +12882,23 @@ def archive_season():
 def archive_current_season_db(season_name):
     """Archive the current season's data to database - FINAL VERSION"""
     try:
-        # Get current comprehensive stats for final rankings from database
+        # Get current comprehensive stats for final rankings (ranked across RANKING_WORKERS processes)
+        state = get_opponent_quality_state()
+        season_data = state['season_data']
+        archive_teams = [
+            (conf_name, team) for conf_name, teams in CONFERENCES.items() for team in teams
+            if team in season_data and (season_data[team]['wins'] + season_data[team]['losses']) > 0
+        ]
+        scientific_results = rank_teams_parallel(
+            season_data, state['qualities'], list(dict.fromkeys(team for _, team in archive_teams))
+        )
+        
         final_rankings = []
-        for conf_name, teams in CONFERENCES.items():
-            for team in teams:
-                team_record = TeamStats.query.filter_by(team_name=team).first()
-                if team_record and (team_record.wins + team_record.losses) > 0:
-                    stats = calculate_comprehensive_stats(team)
-                    stats['team'] = team
-                    stats['conference'] = conf_name
-                    final_rankings.append(stats)
+        for conf_name, team in archive_teams:
+            stats = build_comprehensive_stats(team, season_data, scientific_results[team])
+            stats['team'] = team
+            stats['conference'] = conf_name
+            final_rankings.append(stats)
         
         # Sort by Adjusted Total (highest first) 
         final_rankings.sort(key=lambda x: x['adjusted_total'], reverse=True)
@@ -10569,10 +12911,7 @@ def archive_current_season_db(season_name):
         games_data_db = get_games_data()
         
         # Get all team stats from database
-        team_stats_dict = {}
-        all_team_stats = TeamStats.query.all()
-        for team_record in all_team_stats:
-            team_stats_dict[team_record.team_name] = team_record.to_dict()
+        team_stats_dict = TeamStats.to_dicts(TeamStats.query.all())
         
         # Get scheduled games from database
         scheduled_games_db = get_scheduled_games_list()
@@ -10602,6 +12941,7 @@ def archive_current_season_db(season_name):
         
         db.session.add(archived_season)
         db.session.commit()
+        schedule_static_export()
         
         print(f"✅ Season '{season_name}' archived to database with:")
         print(f"   - {len(games_data_db)} games")
@@ -10679,12 +13019,14 @@ def safe_reset_season():
         # Clear all database tables
         Game.query.delete()
         TeamStats.query.delete()
+        TeamGame.query.delete()
         ScheduledGame.query.delete()
         
         # If you have other tables to clear, add them here:
         # ArchivedSeason.query.delete()  # Only if you want to delete archives too
         
         db.session.commit()
+        bump_season_data_revision()
         
         # Clear global variables (if still used anywhere)
         global team_mappings, historical_rankings
@@ -10771,6 +13113,7 @@ def delete_archived_season():
         season_name = season.season_name
         db.session.delete(season)
         db.session.commit()
+        schedule_static_export()
         
         flash(f'✅ Archived season "{season_name}" deleted successfully.', 'success')
         
@@ -10805,10 +13148,12 @@ def safe_reset_data():
         # Clear all data from database
         Game.query.delete()
         TeamStats.query.delete()
+        TeamGame.query.delete()
         ScheduledGame.query.delete()
         
         # Commit the deletions
         db.session.commit()
+        bump_season_data_revision()
         
         flash(f'🗑️ Successfully deleted {game_count} games, {team_count} teams, and {scheduled_count} scheduled games from database!', 'success')
         
@@ -10923,6 +13268,7 @@ def import_csv():
         
         db.session.add(archived_season)
         db.session.commit()
+        schedule_static_export()
         
         flash(f'✅ Successfully imported {len(final_rankings)} teams for "{season_name}"!', 'success')
         return redirect(url_for('archived_seasons'))
@@ -0,0 +1,711 @@
+# cfb_cache.py
+"""
+CFB Cache Module
+Bounded caches for the app's derived data, with one interface over three backends:
+
+- memory: LRUCache, per process. LRU eviction under an entry count and byte
+  budget; entry sizes are estimated once when the value is stored.
+- sqlite: SharedCache over SQLiteStore, a local file shared by every worker on
+  the host (WAL mode, LRU eviction under the same budgets).
+- redis: SharedCache over RedisStore, any Redis-protocol server shared by every
+  worker and host. Eviction is left to the server's maxmemory policy
+  (allkeys-lru recommended).
+
+The shared backends store values as compact binary (pickle, zlib-compressed
+when large) under a per-cache key prefix. Only point them at a server the app
+controls - cached values are unpickled. Every cache has an optional TTL per
+entry, hit/miss counters per namespace (the cached function or route) and
+coalesced misses (single-flight): when several threads miss the same key at
+once, one computes the value and the others wait for its result (or its error).
+"""
+
+import hashlib
+import os
+import pickle
+import socket
+import sqlite3
+import ssl
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from urllib.parse import unquote, urlparse
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL = None  # seconds; None keeps entries until evicted (keys carry the data revision)
+
+DEFAULT_WAIT_TIMEOUT = 30.0  # seconds a coalesced caller waits before computing on its own
+
+CACHE_BACKENDS = ('memory', 'sqlite', 'redis')
+DEFAULT_SQLITE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'cfb_cache.sqlite3')
+COMPRESS_MIN_BYTES = 1024
+SQLITE_TOUCH_INTERVAL = 30.0  # seconds between LRU timestamp updates of a hot entry
+REDIS_SOCKET_TIMEOUT = 2.0
+BACKEND_RETRY_SECONDS = 5.0  # after a connection failure the shared backend is skipped this long
+
+MISSING = object()  # get() result for absent or expired keys
+
+NAMESPACE_COUNTERS = ('hits', 'misses', 'coalesced', 'wait_timeouts', 'evictions', 'expirations', 'errors')
+
+
+def make_key(prefix, args=(), kwargs=None):
+    """Cache key for a call - positional and keyword arguments (in any order) both count"""
+    call = repr((args, sorted(kwargs.items()) if kwargs else ()))
+    return f"{prefix}_{hashlib.md5(call.encode()).hexdigest()}"
+
+
+def estimate_size(value, _seen=None):
+    """Approximate deep size in bytes of containers, strings and numbers"""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, '__dict__'):
+        size += estimate_size(vars(value), _seen)
+    return size
+
+
+def dumps(value):
+    """Binary form stored by the shared backends: b'P' + pickle, or b'Z' + zlib(pickle)"""
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(data, 1)
+        if len(compressed) < len(data):
+            return b'Z' + compressed
+    return b'P' + data
+
+
+def loads(data):
+    kind, body = data[:1], data[1:]
+    if kind == b'Z':
+        body = zlib.decompress(body)
+    elif kind != b'P':
+        raise ValueError(f"Unknown cache value encoding {kind!r}")
+    return pickle.loads(body)
+
+
+# ===============================================
+# SINGLE-FLIGHT
+# ===============================================
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers for the key share its outcome"""
+
+    def __init__(self, wait_timeout=DEFAULT_WAIT_TIMEOUT):
+        self.wait_timeout = wait_timeout
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, fn, wait_timeout=None):
+        """
+        fn() for the first caller of key; later callers wait for that run and get its
+        result, or its exception re-raised. Returns (result, outcome): outcome is
+        'computed', 'shared', or 'timeout' when the wait ran out and this caller
+        ran fn() itself.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if leader:
+            try:
+                flight.result = fn()
+                return flight.result, 'computed'
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+        if not flight.done.wait(self.wait_timeout if wait_timeout is None else wait_timeout):
+            return fn(), 'timeout'
+        if flight.error is not None:
+            raise flight.error
+        return flight.result, 'shared'
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._flights)
+
+
+# ===============================================
+# CACHE FRONT ENDS
+# ===============================================
+
+class BaseCache:
+    """
+    Namespace counters and coalesced misses on top of a storage backend.
+    Subclasses implement _load, _store, _discard, _clear, _keys and _usage.
+    """
+
+    backend = None
+
+    def __init__(self, default_ttl=DEFAULT_TTL, wait_timeout=DEFAULT_WAIT_TIMEOUT):
+        self.default_ttl = default_ttl
+        self._stats_lock = threading.Lock()
+        self._namespaces = {}
+        self._flights = SingleFlight(wait_timeout)
+
+    def _count(self, namespace, counter, amount=1):
+        with self._stats_lock:
+            stats = self._namespaces.get(namespace)
+            if stats is None:
+                stats = self._namespaces[namespace] = dict.fromkeys(NAMESPACE_COUNTERS, 0)
+            stats[counter] += amount
+
+    def get(self, key, namespace='default'):
+        """Cached value, or MISSING (counted as a miss) when absent or expired"""
+        value = self._load(key, namespace)
+        self._count(namespace, 'misses' if value is MISSING else 'hits')
+        return value
+
+    def set(self, key, value, ttl=None, namespace='default'):
+        """
+        Store value for ttl seconds (default_ttl when None; no expiry when both are None).
+        Returns False when the value was not cached (too large, or the backend failed).
+        """
+        return self._store(key, value, self.default_ttl if ttl is None else ttl, namespace)
+
+    def get_or_compute(self, key, compute, ttl=None, namespace='default', wait_timeout=None, cacheable=None):
+        """
+        Cached value for key, or compute() stored under it. Concurrent misses for the
+        same key run compute() once; the other callers wait up to wait_timeout seconds
+        for that result (an exception from compute() is raised in every waiting caller).
+        cacheable(value) returning False keeps a computed value out of the cache - the
+        waiting callers still share it.
+        """
+        value = self.get(key, namespace)
+        if value is not MISSING:
+            return value
+
+        def load():
+            # The previous flight for this key may have finished since our lookup
+            value = self._load(key, namespace)
+            if value is MISSING:
+                value = compute()
+                if cacheable is None or cacheable(value):
+                    self.set(key, value, ttl=ttl, namespace=namespace)
+            return value
+
+        value, outcome = self._flights.do(key, load, wait_timeout)
+        if outcome != 'computed':
+            self._count(namespace, 'coalesced' if outcome == 'shared' else 'wait_timeouts')
+        return value
+
+    def delete(self, key):
+        return self._discard(key)
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        self._clear()
+
+    def keys(self):
+        return self._keys()
+
+    def __len__(self):
+        return self._usage()['entries'] or 0
+
+    def stats(self):
+        """Totals plus {namespace: counters}; entries/bytes are None when the backend cannot tell"""
+        usage = self._usage()
+        with self._stats_lock:
+            namespaces = {name: dict(stats) for name, stats in sorted(self._namespaces.items())}
+        sizes = usage.pop('namespaces', None)
+        for name, stats in namespaces.items():
+            stats['entries'], stats['bytes'] = sizes.get(name, (0, 0)) if sizes is not None else (None, None)
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = round(stats['hits'] / lookups * 100, 1) if lookups else None
+        totals = dict(usage, backend=self.backend, in_flight=self._flights.in_flight())
+        for key in NAMESPACE_COUNTERS:
+            totals[key] = sum(stats[key] for stats in namespaces.values())
+        totals['namespaces'] = namespaces
+        return totals
+
+
+class LRUCache(BaseCache):
+    """In-process LRU + TTL cache with entry and byte budgets (thread-safe)"""
+
+    backend = 'memory'
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+                 default_ttl=DEFAULT_TTL, sizeof=estimate_size, wait_timeout=DEFAULT_WAIT_TIMEOUT):
+        super().__init__(default_ttl, wait_timeout)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, expires_at, size, namespace); oldest first
+        self._bytes = 0
+
+    def _remove(self, key):
+        _, _, _, namespace = self._entries.pop(key)
+        return namespace
+
+    def _load(self, key, namespace):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            if entry[1] is None or entry[1] > time.time():
+                self._entries.move_to_end(key)
+                return entry[0]
+            self._bytes -= entry[2]
+            expired_namespace = self._remove(key)
+        self._count(expired_namespace, 'expirations')
+        return MISSING
+
+    def _store(self, key, value, ttl, namespace):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return False
+        expires_at = None if ttl is None else time.time() + ttl
+        evicted = []
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries[key][2]
+                self._remove(key)
+            self._entries[key] = (value, expires_at, size, namespace)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._bytes -= self._entries[oldest][2]
+                evicted.append(self._remove(oldest))
+        for evicted_namespace in evicted:
+            self._count(evicted_namespace, 'evictions')
+        return True
+
+    def _discard(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries[key][2]
+                self._remove(key)
+                return True
+            return False
+
+    def _clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _keys(self):
+        with self._lock:
+            return list(self._entries.keys())
+
+    @property
+    def total_bytes(self):
+        return self._bytes
+
+    def _usage(self):
+        with self._lock:
+            sizes = {}
+            for _, _, size, namespace in self._entries.values():
+                entries, total = sizes.get(namespace, (0, 0))
+                sizes[namespace] = (entries + 1, total + size)
+            return {
+                'entries': len(self._entries), 'bytes': self._bytes,
+                'max_entries': self.max_entries, 'max_bytes': self.max_bytes, 'namespaces': sizes
+            }
+
+
+class SharedCache(BaseCache):
+    """
+    Cache over a byte store shared between worker processes. Backend failures are
+    counted and logged, and behave like a miss - pages never fail because of the cache.
+    """
+
+    def __init__(self, store, default_ttl=DEFAULT_TTL, wait_timeout=DEFAULT_WAIT_TIMEOUT):
+        super().__init__(default_ttl, wait_timeout)
+        self.store = store
+        self.backend = store.backend
+        self._last_error_logged = 0.0
+        self._retry_at = 0.0
+
+    def _available(self):
+        return time.time() >= self._retry_at
+
+    def _failed(self, namespace, action, error):
+        self._count(namespace, 'errors')
+        now = time.time()
+        if isinstance(error, OSError):
+            # Unreachable server - don't make every request wait for the connect timeout
+            self._retry_at = now + BACKEND_RETRY_SECONDS
+        if now - self._last_error_logged > 60:
+            self._last_error_logged = now
+            print(f"⚠️ {self.backend} cache {action} failed: {error}")
+
+    def _load(self, key, namespace):
+        if not self._available():
+            return MISSING
+        try:
+            data, expired = self.store.get(key)
+        except (OSError, sqlite3.Error, RedisError) as e:
+            self._failed(namespace, 'read', e)
+            return MISSING
+        if expired:
+            self._count(namespace, 'expirations')
+        if data is None:
+            return MISSING
+        try:
+            return loads(data)
+        except Exception as e:
+            # Written by an incompatible version of the code - drop it
+            self._failed(namespace, 'decode', e)
+            self._discard(key)
+            return MISSING
+
+    def _store(self, key, value, ttl, namespace):
+        try:
+            data = dumps(value)
+        except Exception as e:
+            self._failed(namespace, 'encode', e)
+            return False
+        if not self._available():
+            return False
+        try:
+            evicted = self.store.set(key, data, ttl, namespace)
+        except (OSError, sqlite3.Error, RedisError) as e:
+            self._failed(namespace, 'write', e)
+            return False
+        for evicted_namespace in evicted:
+            self._count(evicted_namespace, 'evictions')
+        return True
+
+    def _discard(self, key):
+        try:
+            return self.store.delete(key)
+        except (OSError, sqlite3.Error, RedisError) as e:
+            self._failed('default', 'delete', e)
+            return False
+
+    def _clear(self):
+        try:
+            self.store.clear()
+        except (OSError, sqlite3.Error, RedisError) as e:
+            self._failed('default', 'clear', e)
+
+    def _keys(self):
+        try:
+            return self.store.keys()
+        except (OSError, sqlite3.Error, RedisError) as e:
+            self._failed('default', 'scan', e)
+            return []
+
+    def _usage(self):
+        unknown = {'entries': None, 'bytes': None, 'max_entries': None, 'max_bytes': None}
+        if not self._available():
+            return unknown
+        try:
+            return self.store.usage()
+        except (OSError, sqlite3.Error, RedisError) as e:
+            self._failed('default', 'scan', e)
+            return unknown
+
+
+# ===============================================
+# SHARED BYTE STORES
+# ===============================================
+# Store interface: get(key) -> (bytes or None, expired), set(key, data, ttl, namespace)
+# -> namespaces of evicted entries, delete(key), clear(), keys(), usage().
+# Keys are stored under the store's prefix, so several caches can share a file or server.
+
+class SQLiteStore:
+    """Byte store in a local SQLite file (WAL mode) shared by every worker on the host"""
+
+    backend = 'sqlite'
+
+    def __init__(self, path, prefix='cfb:', max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.prefix = prefix
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries (accessed_at)')
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit; writes take the lock explicitly with BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _range(self):
+        """Key bounds of this store's prefix (uses the primary key index)"""
+        return self.prefix, self.prefix + '\U0010ffff'
+
+    def get(self, key):
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?', (self.prefix + key,)
+        ).fetchone()
+        if row is None:
+            return None, False
+        value, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            conn.execute('DELETE FROM cache_entries WHERE key = ? AND expires_at <= ?', (self.prefix + key, now))
+            return None, True
+        if now - accessed_at > SQLITE_TOUCH_INTERVAL:
+            conn.execute('UPDATE cache_entries SET accessed_at = ? WHERE key = ?', (now, self.prefix + key))
+        return value, False
+
+    def set(self, key, data, ttl, namespace):
+        if len(data) > self.max_bytes:
+            return []
+        now = time.time()
+        low, high = self._range()
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO cache_entries (key, namespace, value, size, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (self.prefix + key, namespace, sqlite3.Binary(data), len(data),
+                 None if ttl is None else now + ttl, now)
+            )
+            conn.execute('DELETE FROM cache_entries WHERE key >= ? AND key < ? AND expires_at <= ?', (low, high, now))
+            entries, total = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE key >= ? AND key < ?', (low, high)
+            ).fetchone()
+            evicted = []
+            if entries > self.max_entries or total > self.max_bytes:
+                oldest = conn.execute(
+                    'SELECT key, namespace, size FROM cache_entries WHERE key >= ? AND key < ? AND key != ? '
+                    'ORDER BY accessed_at', (low, high, self.prefix + key)
+                )
+                doomed = []
+                for old_key, old_namespace, size in oldest:
+                    if entries <= self.max_entries and total <= self.max_bytes:
+                        break
+                    doomed.append((old_key,))
+                    evicted.append(old_namespace)
+                    entries -= 1
+                    total -= size
+                conn.executemany('DELETE FROM cache_entries WHERE key = ?', doomed)
+            conn.execute('COMMIT')
+            return evicted
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def delete(self, key):
+        cursor = self._connection().execute('DELETE FROM cache_entries WHERE key = ?', (self.prefix + key,))
+        return cursor.rowcount > 0
+
+    def clear(self):
+        self._connection().execute('DELETE FROM cache_entries WHERE key >= ? AND key < ?', self._range())
+
+    def keys(self):
+        rows = self._connection().execute(
+            'SELECT key FROM cache_entries WHERE key >= ? AND key < ? ORDER BY accessed_at', self._range()
+        )
+        return [key[len(self.prefix):] for key, in rows]
+
+    def usage(self):
+        rows = self._connection().execute(
+            'SELECT namespace, COUNT(*), SUM(size) FROM cache_entries WHERE key >= ? AND key < ? GROUP BY namespace',
+            self._range()
+        ).fetchall()
+        return {
+            'entries': sum(row[1] for row in rows), 'bytes': sum(row[2] for row in rows),
+            'max_entries': self.max_entries, 'max_bytes': self.max_bytes,
+            'namespaces': {namespace: (entries, size) for namespace, entries, size in rows}
+        }
+
+
+class RedisError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+class RedisStore:
+    """
+    Byte store on a Redis-protocol server (Redis, Valkey, KeyDB, ...), spoken directly
+    over RESP - one connection per thread. URL: redis://[user:password@]host:port/db
+    (rediss:// for TLS).
+    """
+
+    backend = 'redis'
+
+    def __init__(self, url, prefix='cfb:', socket_timeout=REDIS_SOCKET_TIMEOUT):
+        parsed = urlparse(url)
+        if parsed.scheme not in ('redis', 'rediss'):
+            raise ValueError(f"Redis URL must start with redis:// or rediss:// (got {url!r})")
+        self.host = parsed.hostname or '127.0.0.1'
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.use_tls = parsed.scheme == 'rediss'
+        self.prefix = prefix
+        self.socket_timeout = socket_timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.socket_timeout)
+        if self.use_tls:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+        reader = sock.makefile('rb')
+        self._local.conn = (sock, reader)
+        if self.password is not None:
+            self._send(*(('AUTH', self.username, self.password) if self.username else ('AUTH', self.password)))
+        if self.db:
+            self._send('SELECT', self.db)
+        return self._local.conn
+
+    def _send(self, *parts):
+        sock, reader = self._local.conn
+        payload = [b'*%d\r\n' % len(parts)]
+        for part in parts:
+            if not isinstance(part, bytes):
+                part = str(part).encode()
+            payload.append(b'$%d\r\n%s\r\n' % (len(part), part))
+        sock.sendall(b''.join(payload))
+        return self._read_reply(reader)
+
+    def _read_reply(self, reader):
+        line = reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError('Redis connection closed')
+        kind, body = line[:1], line[1:-2]
+        if kind == b'+':
+            return body.decode()
+        if kind == b'-':
+            raise RedisError(body.decode())
+        if kind == b':':
+            return int(body)
+        if kind == b'$':
+            length = int(body)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError('Redis connection closed')
+            return data[:-2]
+        if kind == b'*':
+            length = int(body)
+            return None if length < 0 else [self._read_reply(reader) for _ in range(length)]
+        raise RedisError(f"Unexpected reply {line[:20]!r}")
+
+    def command(self, *parts):
+        if getattr(self._local, 'conn', None) is None:
+            self._connect()
+        try:
+            return self._send(*parts)
+        except RedisError:
+            raise
+        except BaseException:
+            # Broken or half-read connection - never reuse it
+            sock, _ = self._local.conn
+            self._local.conn = None
+            sock.close()
+            raise
+
+    def _scan(self):
+        pattern = ''.join('\\' + char if char in '*?[]\\' else char for char in self.prefix) + '*'
+        cursor = b'0'
+        while True:
+            cursor, keys = self.command('SCAN', cursor, 'MATCH', pattern, 'COUNT', 1000)
+            yield from keys
+            if cursor == b'0':
+                return
+
+    def get(self, key):
+        return self.command('GET', self.prefix + key), False
+
+    def set(self, key, data, ttl, namespace):
+        if ttl is None:
+            self.command('SET', self.prefix + key, data)
+        else:
+            self.command('SET', self.prefix + key, data, 'PX', max(1, int(ttl * 1000)))
+        return []  # The server evicts under its own maxmemory policy
+
+    def delete(self, key):
+        return self.command('DEL', self.prefix + key) > 0
+
+    def clear(self):
+        keys = list(self._scan())
+        for start in range(0, len(keys), 500):
+            self.command('DEL', *keys[start:start + 500])
+
+    def keys(self):
+        return [key.decode()[len(self.prefix):] for key in self._scan()]
+
+    def usage(self):
+        return {'entries': sum(1 for _ in self._scan()), 'bytes': None, 'max_entries': None, 'max_bytes': None}
+
+
+# ===============================================
+# CONFIGURATION
+# ===============================================
+
+def create_cache(backend='memory', prefix='cfb:', path=DEFAULT_SQLITE_PATH, url=None,
+                 max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+                 default_ttl=DEFAULT_TTL, wait_timeout=DEFAULT_WAIT_TIMEOUT):
+    if backend == 'memory':
+        return LRUCache(max_entries, max_bytes, default_ttl, wait_timeout=wait_timeout)
+    if backend == 'sqlite':
+        store = SQLiteStore(path, prefix, max_entries, max_bytes)
+    elif backend == 'redis':
+        if not url:
+            raise ValueError('The redis cache backend needs a URL (CACHE_REDIS_URL)')
+        store = RedisStore(url, prefix)
+    else:
+        raise ValueError(f"Unknown cache backend {backend!r} - expected one of {', '.join(CACHE_BACKENDS)}")
+    return SharedCache(store, default_ttl, wait_timeout)
+
+
+def cache_from_env(name, default_ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+                   wait_timeout=DEFAULT_WAIT_TIMEOUT):
+    """
+    Cache for the backend named by CACHE_BACKEND (memory, sqlite or redis), keyed
+    under CACHE_KEY_PREFIX + name. sqlite uses CACHE_SQLITE_PATH, redis CACHE_REDIS_URL.
+    Falls back to memory when the shared backend cannot be set up.
+    """
+    backend = os.environ.get('CACHE_BACKEND', 'memory').lower()
+    try:
+        return create_cache(
+            backend,
+            prefix=f"{os.environ.get('CACHE_KEY_PREFIX', 'cfb:')}{name}:",
+            path=os.environ.get('CACHE_SQLITE_PATH', DEFAULT_SQLITE_PATH),
+            url=os.environ.get('CACHE_REDIS_URL'),
+            max_entries=max_entries, max_bytes=max_bytes, default_ttl=default_ttl, wait_timeout=wait_timeout
+        )
+    except (ValueError, OSError, sqlite3.Error) as e:
+        print(f"❌ {backend} cache backend unavailable for {name} - using per-process memory: {e}")
+        return LRUCache(max_entries, max_bytes, default_ttl, wait_timeout=wait_timeout)
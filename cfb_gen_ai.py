@@ -10,10 +10,17 @@ import os
 import hashlib
 import time
 
+import cfb_cache
 
-# Simple in-memory cache for AI responses
-ai_response_cache = {}
+
+# AI responses are cached for a day on the backend named by CACHE_BACKEND (see cfb_cache),
+# so with sqlite or redis every worker reuses a response instead of paying for the call again
 CACHE_TIMEOUT = 24 * 60 * 60  # 24 hours
+ai_response_cache = cfb_cache.cache_from_env(
+    'ai', default_ttl=CACHE_TIMEOUT,
+    max_entries=int(os.environ.get('AI_CACHE_MAX_ENTRIES', '1024')),
+    max_bytes=int(os.environ.get('AI_CACHE_MAX_MB', '16')) * 1024 * 1024
+)
 
 def get_cache_key(*args, **kwargs):
     """Generate cache key from function arguments"""
@@ -22,28 +29,20 @@ def get_cache_key(*args, **kwargs):
     return hashlib.md5(cache_data.encode()).hexdigest()
 
 def cached_ai_call(cache_key, ai_function, *args, **kwargs):
-    """Cache AI responses to avoid duplicate API calls"""
-    
-    # Check cache first
-    if cache_key in ai_response_cache:
-        cached_response, timestamp = ai_response_cache[cache_key]
-        if time.time() - timestamp < CACHE_TIMEOUT:
-            print(f"🚀 Using cached AI response for {cache_key[:8]}...")
-            return cached_response
-    
-    # Not cached - make API call
-    print(f"🤖 Making new AI API call for {cache_key[:8]}...")
-    start_time = time.time()
-    response = ai_function(*args, **kwargs)
-    end_time = time.time()
-    print(f"⏱️ AI call took {end_time - start_time:.2f} seconds")
+    """Cache AI responses to avoid duplicate API calls (concurrent identical calls share one)"""
     
-    # Store in cache
-    ai_response_cache[cache_key] = (response, time.time())
+    def call():
+        # Not cached - make API call
+        print(f"🤖 Making new AI API call for {cache_key[:8]}...")
+        start_time = time.time()
+        response = ai_function(*args, **kwargs)
+        end_time = time.time()
+        print(f"⏱️ AI call took {end_time - start_time:.2f} seconds")
+        return response
     
-    return response
+    return ai_response_cache.get_or_compute(cache_key, call, namespace='ai_response')
 
-print(f"🔍 AI Cache status: {len(ai_response_cache)} cached responses")
+print(f"🔍 AI Cache status: {len(ai_response_cache)} cached responses ({ai_response_cache.backend})")
 
 # At the top of cfb_gen_ai.py, add model selection
 FAST_MODEL_ID = "arn:aws:bedrock:us-east-1:249154182031:inference-profile/us.anthropic.claude-sonnet-4-20250514-v1:0"
@@ -496,18 +495,20 @@ Remember: 12-team playoff means ranks #1-12 all make playoffs. Be factual, not d
 
 def get_ai_cache_stats():
     """Get cache statistics for monitoring"""
-    total_entries = len(ai_response_cache)
-    total_size = sum(len(str(v)) for v in ai_response_cache.values())
+    stats = ai_response_cache.stats()
+    total_entries = stats['entries'] or 0
     
     return {
+        'backend': stats['backend'],
         'total_entries': total_entries,
-        'total_size_bytes': total_size,
+        'total_size_bytes': stats['bytes'],
+        'hits': stats['hits'],
+        'misses': stats['misses'],
         'cache_hit_potential': f"{total_entries * 2}-{total_entries * 5} seconds saved"
     }
 
 def clear_ai_cache():
     """Clear the AI response cache"""
-    global ai_response_cache
     ai_response_cache.clear()
     return "AI cache cleared"
 
@@ -0,0 +1,615 @@
+# cfb_performance.py
+"""
+CFB Performance Module
+Per-request SQL instrumentation for the admin performance pages, a minimal
+Prometheus metrics registry for /metrics, the on-demand request profiler,
+rolling-window timing spans for the ranking pipeline and the start method for
+CPU-bound process pools.
+
+SQLAlchemy engine events time every statement issued while a request is being
+tracked (start_request_stats ... stop_request_stats on the request's thread).
+Statements from threads that are not tracking a request, such as the ranking
+recompute worker, are ignored. RoutePerformanceTable aggregates the finished
+requests per route so N+1 patterns show up as a high queries-per-request count.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import marshal
+import multiprocessing
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter as StackCounter, deque
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SLOW_STATEMENTS_PER_REQUEST = 5
+SLOW_STATEMENTS_PER_TABLE = 20
+STATEMENT_PREVIEW_LENGTH = 300
+
+_current = threading.local()
+_installed = False
+_install_lock = threading.Lock()
+
+
+def _preview(statement):
+    statement = ' '.join(statement.split())
+    if len(statement) > STATEMENT_PREVIEW_LENGTH:
+        return statement[:STATEMENT_PREVIEW_LENGTH] + '...'
+    return statement
+
+
+def _keep_slowest(slowest, elapsed_ms, item, limit):
+    """slowest: list of (elapsed_ms, ...) sorted descending, at most limit long"""
+    if len(slowest) < limit or elapsed_ms > slowest[-1][0]:
+        slowest.append((elapsed_ms,) + item)
+        slowest.sort(key=lambda entry: entry[0], reverse=True)
+        del slowest[limit:]
+
+
+class RequestQueryStats:
+    """Statements issued by one request: count, total time and the slowest few"""
+
+    __slots__ = ('count', 'total_ms', 'slowest')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest = []  # (elapsed_ms, raw statement) - previewed only if it is kept by the table
+
+    def record(self, statement, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        _keep_slowest(self.slowest, elapsed_ms, (statement,), SLOW_STATEMENTS_PER_REQUEST)
+
+    @property
+    def slowest_ms(self):
+        return self.slowest[0][0] if self.slowest else 0.0
+
+
+def start_request_stats():
+    """Track statements issued on this thread until stop_request_stats()"""
+    _current.stats = RequestQueryStats()
+    return _current.stats
+
+
+def stop_request_stats():
+    """Stop tracking this thread; returns the request's RequestQueryStats (or None)"""
+    stats = getattr(_current, 'stats', None)
+    _current.stats = None
+    return stats
+
+
+def current_request_stats():
+    return getattr(_current, 'stats', None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if getattr(_current, 'stats', None) is not None:
+        conn.info.setdefault('query_start_times', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = getattr(_current, 'stats', None)
+    start_times = conn.info.get('query_start_times')
+    if stats is None or not start_times:
+        return
+    stats.record(statement, (time.perf_counter() - start_times.pop()) * 1000)
+
+
+def process_pool_context():
+    """
+    multiprocessing context for a process pool: fork from a single-threaded process
+    (the scripts), spawn inside the threaded server - a forked child can inherit a lock
+    another thread holds (database pool, logging) and deadlock. Spawned workers import
+    the module that defines the pool's task function.
+    """
+    if threading.active_count() == 1 and 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('spawn')
+
+
+def install_query_tracking():
+    """Listen on every Engine (idempotent) - cheap when no request is tracking"""
+    global _installed
+    with _install_lock:
+        if not _installed:
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+            _installed = True
+
+
+class RoutePerformanceTable:
+    """Finished requests aggregated per route (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._routes = {}
+            self._slowest = []  # (elapsed_ms, route, statement preview)
+            self.since = time.time()
+
+    def record(self, route, request_ms, stats, status_code):
+        with self._lock:
+            entry = self._routes.get(route)
+            if entry is None:
+                entry = self._routes[route] = {
+                    'route': route, 'requests': 0, 'errors': 0,
+                    'queries': 0, 'max_queries': 0, 'db_ms': 0.0, 'max_db_ms': 0.0,
+                    'request_ms': 0.0, 'max_request_ms': 0.0
+                }
+            entry['requests'] += 1
+            entry['errors'] += 1 if status_code >= 500 else 0
+            entry['request_ms'] += request_ms
+            entry['max_request_ms'] = max(entry['max_request_ms'], request_ms)
+            if stats is not None:
+                entry['queries'] += stats.count
+                entry['max_queries'] = max(entry['max_queries'], stats.count)
+                entry['db_ms'] += stats.total_ms
+                entry['max_db_ms'] = max(entry['max_db_ms'], stats.total_ms)
+                for elapsed_ms, statement in stats.slowest:
+                    if len(self._slowest) < SLOW_STATEMENTS_PER_TABLE or elapsed_ms > self._slowest[-1][0]:
+                        _keep_slowest(self._slowest, elapsed_ms, (route, _preview(statement)),
+                                      SLOW_STATEMENTS_PER_TABLE)
+
+    def routes(self):
+        """Per-route rows with averages, most total DB time first"""
+        with self._lock:
+            entries = [dict(entry) for entry in self._routes.values()]
+        for entry in entries:
+            requests = entry['requests']
+            entry['avg_queries'] = round(entry['queries'] / requests, 1)
+            entry['avg_db_ms'] = round(entry['db_ms'] / requests, 2)
+            entry['avg_request_ms'] = round(entry['request_ms'] / requests, 2)
+            entry['db_share'] = round(entry['db_ms'] / entry['request_ms'] * 100, 1) if entry['request_ms'] else 0.0
+            for key in ('db_ms', 'max_db_ms', 'request_ms', 'max_request_ms'):
+                entry[key] = round(entry[key], 2)
+        entries.sort(key=lambda entry: entry['db_ms'], reverse=True)
+        return entries
+
+    def slowest_statements(self):
+        with self._lock:
+            return [
+                {'elapsed_ms': round(elapsed_ms, 2), 'route': route, 'statement': statement}
+                for elapsed_ms, route, statement in self._slowest
+            ]
+
+
+# ===============================================
+# PROMETHEUS METRICS
+# ===============================================
+# Minimal text-format (0.0.4) registry - no client library dependency. Each
+# process keeps its own values; under several workers scrape every worker or
+# aggregate in Prometheus.
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(labels.get(name, '') for name in self.labelnames)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value, **labels):
+        """Mirror a counter kept elsewhere (for collectors)"""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def render(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        self.set_total(value, **labels)
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self):
+        with self._lock:
+            items = sorted((key, (list(entry[0]), entry[1], entry[2])) for key, entry in self._values.items())
+        lines = self.header()
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                le = 'le="%r"' % float(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics plus collector callbacks that refresh gauges/counters at scrape time"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector):
+        """collector() runs before every render - use it to copy external counters in"""
+        self._collectors.append(collector)
+
+    def render(self):
+        for collector in self._collectors:
+            collector()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# ===============================================
+# REQUEST PROFILER
+# ===============================================
+# One request at a time under cProfile (deterministic, saved as pstats) plus a
+# stack sampler on the same thread (saved as collapsed stacks for flamegraph.pl /
+# speedscope). Profiles live in a bounded directory: oldest are pruned first.
+
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+PROFILE_KINDS = {'pstats': '.pstats', 'collapsed': '.collapsed'}
+PROFILE_ID_PATTERN = re.compile(r'^[0-9]{8}-[0-9]{6}-[0-9a-f]{8}$')
+
+
+class StackSampler:
+    """Samples one thread's Python stack on a background thread"""
+
+    def __init__(self, thread_id, interval=PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = StackCounter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-profiler-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    @property
+    def samples(self):
+        return sum(self.stacks.values())
+
+    def collapsed(self):
+        """Brendan Gregg collapsed format: root;...;leaf count"""
+        return ''.join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class RequestProfile:
+    """cProfile + StackSampler around the current thread; finish() returns (pstats bytes, collapsed text)"""
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.sampler = StackSampler(threading.get_ident())
+        self.started = time.perf_counter()
+
+    def start(self):
+        self.profiler.enable()  # Raises ValueError if another profiler owns the interpreter
+        self.sampler.start()
+        return self
+
+    def finish(self):
+        self.profiler.disable()
+        self.sampler.stop()
+        self.elapsed_ms = (time.perf_counter() - self.started) * 1000
+        self.profiler.create_stats()
+        return marshal.dumps(self.profiler.stats), self.sampler.collapsed()
+
+
+class ProfileStore:
+    """Profiles on disk: <id>.json metadata, <id>.pstats, <id>.collapsed - bounded by count and bytes"""
+
+    def __init__(self, directory, max_profiles=50, max_bytes=100 * 1024 * 1024):
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, profile_id, suffix):
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            raise ValueError(f"Invalid profile id: {profile_id}")
+        return os.path.join(self.directory, profile_id + suffix)
+
+    def save(self, metadata, pstats_data, collapsed):
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        metadata = dict(metadata, id=profile_id, created=time.time(),
+                        pstats_bytes=len(pstats_data), collapsed_bytes=len(collapsed.encode()))
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path(profile_id, PROFILE_KINDS['pstats']), 'wb') as f:
+                f.write(pstats_data)
+            with open(self._path(profile_id, PROFILE_KINDS['collapsed']), 'w') as f:
+                f.write(collapsed)
+            with open(self._path(profile_id, '.json'), 'w') as f:
+                json.dump(metadata, f)
+            self._prune()
+        return profile_id
+
+    def _prune(self):
+        profiles = self._list()
+        total = sum(profile['pstats_bytes'] + profile['collapsed_bytes'] for profile in profiles)
+        while profiles and (len(profiles) > self.max_profiles or total > self.max_bytes):
+            oldest = profiles.pop()
+            total -= oldest['pstats_bytes'] + oldest['collapsed_bytes']
+            self._remove(oldest['id'])
+
+    def _remove(self, profile_id):
+        for suffix in list(PROFILE_KINDS.values()) + ['.json']:
+            try:
+                os.remove(self._path(profile_id, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _list(self):
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    with open(os.path.join(self.directory, name)) as f:
+                        profiles.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        profiles.sort(key=lambda profile: profile['created'], reverse=True)
+        return profiles
+
+    def list(self):
+        """Newest first"""
+        with self._lock:
+            return self._list()
+
+    def get(self, profile_id):
+        try:
+            with open(self._path(profile_id, '.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def file_path(self, profile_id, kind):
+        return self._path(profile_id, PROFILE_KINDS[kind])
+
+    def delete(self, profile_id):
+        with self._lock:
+            self._remove(profile_id)
+
+    def top_functions(self, profile_id, sort='cumulative', limit=40):
+        """pstats text report for the profile page"""
+        stats = pstats.Stats(self.file_path(profile_id, 'pstats'), stream=io.StringIO())
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return stats.stream.getvalue()
+
+
+# ===============================================
+# RANKING SPANS
+# ===============================================
+# Named timing spans ('<group>.<component>') aggregated in one-minute buckets over
+# a rolling window, so the page shows which ranking module dominates right now.
+# A disabled recorder hands out a shared no-op span - the only cost left in the
+# ranking code is one method call per span.
+
+SPAN_BUCKET_SECONDS = 60
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('_recorder', '_name', '_start')
+
+    def __init__(self, recorder, name):
+        self._recorder = recorder
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._recorder.record(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class SpanRecorder:
+    """Timing spans aggregated over the last window_seconds (thread-safe)"""
+
+    def __init__(self, enabled=True, window_seconds=900, bucket_seconds=SPAN_BUCKET_SECONDS):
+        self.enabled = enabled
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self._max_buckets = max(1, -(-window_seconds // bucket_seconds))
+        self._lock = threading.Lock()
+        self._buckets = deque()  # (bucket number, {name: [count, total_s, max_s]})
+
+    def span(self, name):
+        """Context manager timing its block as name"""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def timed(self, name):
+        """Decorator timing every call as name"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def record(self, name, seconds):
+        bucket = int(time.time() // self.bucket_seconds)
+        with self._lock:
+            if not self._buckets or self._buckets[-1][0] != bucket:
+                self._buckets.append((bucket, {}))
+                self._prune(bucket)
+            entry = self._buckets[-1][1].get(name)
+            if entry is None:
+                self._buckets[-1][1][name] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    def _prune(self, current_bucket):
+        while self._buckets and self._buckets[0][0] <= current_bucket - self._max_buckets:
+            self._buckets.popleft()
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def summary(self):
+        """
+        {group: rows} for the spans inside the window, most total time first.
+        share is each span's time as a percentage of its group's 'total' span.
+        """
+        with self._lock:
+            self._prune(int(time.time() // self.bucket_seconds))
+            merged = {}
+            for _, spans in self._buckets:
+                for name, (count, total, longest) in spans.items():
+                    entry = merged.setdefault(name, [0, 0.0, 0.0])
+                    entry[0] += count
+                    entry[1] += total
+                    entry[2] = max(entry[2], longest)
+
+        groups = {}
+        for name, (count, total, longest) in merged.items():
+            group, _, component = name.partition('.')
+            groups.setdefault(group, []).append({
+                'span': component or group, 'calls': count, 'total_ms': total * 1000,
+                'avg_ms': total * 1000 / count, 'max_ms': longest * 1000
+            })
+        for rows in groups.values():
+            group_total = next((row['total_ms'] for row in rows if row['span'] == 'total'), None)
+            for row in rows:
+                row['share'] = round(row['total_ms'] / group_total * 100, 1) if group_total else None
+                for key in ('total_ms', 'avg_ms', 'max_ms'):
+                    row[key] = round(row[key], 3)
+            rows.sort(key=lambda row: (row['span'] != 'total', -row['total_ms']))
+        return dict(sorted(groups.items()))
@@ -0,0 +1,214 @@
+# cfb_season_simulator.py
+"""
+CFB Season Simulator Module
+Monte Carlo playout of the remaining schedule for CFP and bowl odds.
+
+The season (completed games plus one placeholder row per team-side of every
+pending game) is encoded once with cfb_vector_ranking. Each batch samples
+outcomes for all pending games across a "simulation" axis, re-ranks every
+simulated season with compute_bulk_components, and applies the CFP selection
+rules of generate_correct_cfp_bracket with array operations. Batches are
+spread over a process pool; each batch draws from its own child of one
+SeedSequence, so a fixed seed gives identical odds for any worker count.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import cfb_performance
+import cfb_vector_ranking
+
+CFP_FIELD_SIZE = 12
+CFP_AUTO_BIDS = 5
+CFP_BYES = 4
+BOWL_ELIGIBLE_WINS = 6
+MARGIN_SD = 13.5  # Spread of the final margin around the predicted margin (points)
+DEFAULT_BATCH_SIZE = 250
+
+
+class SimulationProblem:
+    """
+    Read-only inputs shared by every simulated season - plain arrays, no database objects.
+
+    season: EncodedSeason with completed rows plus pending placeholder rows
+    home_row/away_row: (P,) row index of each pending game's home/away side (-1 for FCS sides)
+    home_team/away_team: (P,) team index of each side (-1 for FCS sides)
+    home_win_prob/home_spread: (P,) home win probability and predicted home margin
+    vs_fcs: (P,) pending game involves an FCS opponent (win does not count for bowls)
+    real_wins: (E,) completed wins over non-FCS opponents
+    conference_code: (R,) index into champion_conferences or -1, for the ranked teams
+    """
+
+    def __init__(self, season, home_row, away_row, home_team, away_team, home_win_prob, home_spread,
+                 vs_fcs, real_wins, conference_code, champion_conferences):
+        self.season = season
+        self.home_row = np.asarray(home_row, dtype=np.int64)
+        self.away_row = np.asarray(away_row, dtype=np.int64)
+        self.home_team = np.asarray(home_team, dtype=np.int64)
+        self.away_team = np.asarray(away_team, dtype=np.int64)
+        self.home_win_prob = np.asarray(home_win_prob, dtype=np.float64)
+        self.home_spread = np.asarray(home_spread, dtype=np.float64)
+        self.vs_fcs = np.asarray(vs_fcs, dtype=bool)
+        self.real_wins = np.asarray(real_wins, dtype=np.float64)
+        self.conference_code = np.asarray(conference_code, dtype=np.int64)
+        self.champion_conferences = list(champion_conferences)
+        self._side_matrices = None
+
+    @property
+    def num_pending(self):
+        return len(self.home_win_prob)
+
+    @property
+    def num_ranked(self):
+        return self.season.num_ranked
+
+    def side_matrices(self):
+        """(P, E) one-hot of the home and away team of every pending game (zero rows for FCS sides)"""
+        if self._side_matrices is None:
+            num_pending = self.num_pending
+            home = np.zeros((num_pending, self.season.num_teams))
+            away = np.zeros((num_pending, self.season.num_teams))
+            games = np.arange(num_pending)
+            home[games[self.home_team >= 0], self.home_team[self.home_team >= 0]] = 1.0
+            away[games[self.away_team >= 0], self.away_team[self.away_team >= 0]] = 1.0
+            self._side_matrices = (home, away)
+        return self._side_matrices
+
+
+def sample_pending_results(problem, rng, num_seasons):
+    """(S, P) home-win flags and home margins for every pending game"""
+    shape = (num_seasons, problem.num_pending)
+    home_win = rng.random(shape) < problem.home_win_prob
+    winner_spread = np.where(home_win, problem.home_spread, -problem.home_spread)
+    winning_margin = np.maximum(1.0, np.rint(np.abs(winner_spread + MARGIN_SD * rng.standard_normal(shape))))
+    return home_win, np.where(home_win, winning_margin, -winning_margin)
+
+
+def team_mask(team_indices, num_teams):
+    """(S, K) team indices (-1 = none) -> (S, num_teams) membership mask"""
+    mask = np.zeros((team_indices.shape[0], num_teams), dtype=bool)
+    season_idx, slot = np.nonzero(team_indices >= 0)
+    mask[season_idx, team_indices[season_idx, slot]] = True
+    return mask
+
+
+def select_cfp_fields(problem, adjusted_total):
+    """
+    Vectorized generate_correct_cfp_bracket for (S, R) adjusted totals.
+    Returns (order, position, champion, in_field, has_bye) - champion is (S, C) team indices (-1 if none).
+    """
+    num_seasons, num_ranked = adjusted_total.shape
+    rows = np.arange(num_seasons)[:, None]
+
+    # Rankings: stable sort on the rounded total, like get_all_team_stats_bulk
+    order = np.argsort(-np.round(adjusted_total, 3), axis=1, kind='stable')
+    position = np.empty_like(order)
+    position[rows, order] = np.arange(num_ranked)
+
+    # Conference champion = highest-ranked team of each conference
+    num_conferences = len(problem.champion_conferences)
+    champion = np.full((num_seasons, num_conferences), -1, dtype=np.int64)
+    for code in range(num_conferences):
+        members = np.flatnonzero(problem.conference_code == code)
+        if len(members):
+            champion[:, code] = members[np.argmin(position[:, members], axis=1)]
+
+    # Automatic bids: best CFP_AUTO_BIDS champions by adjusted total
+    has_champion = champion >= 0
+    champion_total = np.where(has_champion, adjusted_total[rows, np.maximum(champion, 0)], -np.inf)
+    champion_order = np.argsort(-champion_total, axis=1, kind='stable')[:, :CFP_AUTO_BIDS]
+    auto_bid = champion[rows, champion_order]
+    is_auto = team_mask(auto_bid, num_ranked)
+    num_auto = is_auto.sum(axis=1, keepdims=True)
+
+    # At-large: best non-automatic teams from the top 12 fill the remaining spots
+    top = order[:, :CFP_FIELD_SIZE]
+    at_large_candidate = ~is_auto[rows, top]
+    at_large = at_large_candidate & (np.cumsum(at_large_candidate, axis=1) <= CFP_FIELD_SIZE - num_auto)
+    in_field = is_auto.copy()
+    in_field[rows, top] |= at_large
+
+    # Seeds follow the overall ranking; seeds 1-4 get first-round byes
+    field_in_order = in_field[rows, order]
+    bye_in_order = field_in_order & (np.cumsum(field_in_order, axis=1) <= CFP_BYES)
+    has_bye = np.zeros_like(in_field)
+    has_bye[rows, order] = bye_in_order
+    return order, position, champion, in_field, has_bye
+
+
+def simulate_batch(problem, rng, num_seasons):
+    """Play out the remaining schedule num_seasons times; returns per-team tallies over the ranked teams"""
+    season = problem.season
+    num_ranked = problem.num_ranked
+    home_win, home_margin = sample_pending_results(problem, rng, num_seasons)
+    away_win = ~home_win
+
+    # Per-game results: completed rows fixed, pending rows from the samples
+    result = np.tile(season.result, (num_seasons, 1))
+    margin = np.tile(season.team_score - season.opp_score, (num_seasons, 1))
+    home_side = problem.home_row >= 0
+    away_side = problem.away_row >= 0
+    result[:, problem.home_row[home_side]] = home_win[:, home_side]
+    margin[:, problem.home_row[home_side]] = home_margin[:, home_side]
+    result[:, problem.away_row[away_side]] = away_win[:, away_side]
+    margin[:, problem.away_row[away_side]] = -home_margin[:, away_side]
+
+    # Records: completed + simulated
+    home, away = problem.side_matrices()
+    home_win = home_win.astype(np.float64)
+    away_win = away_win.astype(np.float64)
+    wins = season.wins + home_win @ home + away_win @ away
+    losses = season.losses + away_win @ home + home_win @ away
+    counted = (~problem.vs_fcs).astype(np.float64)[:, None]
+    real_wins = problem.real_wins + home_win @ (home * counted) + away_win @ (away * counted)
+
+    components = cfb_vector_ranking.compute_bulk_components(season, wins, losses, result, margin)
+    adjusted_total = components['adjusted_total'][:, :num_ranked]
+    _, position, champion, in_field, has_bye = select_cfp_fields(problem, adjusted_total)
+
+    is_champion = team_mask(champion, num_ranked)
+
+    return {
+        'seasons': num_seasons,
+        'playoff': in_field.sum(axis=0),
+        'bye': has_bye.sum(axis=0),
+        'conference_title': is_champion.sum(axis=0),
+        'bowl_eligible': (real_wins[:, :num_ranked] >= BOWL_ELIGIBLE_WINS).sum(axis=0),
+        'rank_total': (position + 1).sum(axis=0),
+        'win_total': wins[:, :num_ranked].sum(axis=0)
+    }
+
+
+_worker_problem = None
+
+def _init_worker(problem):
+    """Process pool initializer: keep the problem for every batch this worker runs"""
+    global _worker_problem
+    _worker_problem = problem
+
+def _simulate_chunk(task):
+    num_seasons, seed_sequence = task
+    return simulate_batch(_worker_problem, np.random.default_rng(seed_sequence), num_seasons)
+
+
+def run_simulation(problem, num_seasons, seed=None, workers=1, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Simulate num_seasons seasons and return summed tallies plus the seed used.
+    Batches are fixed by num_seasons/batch_size (not workers), so the same seed
+    reproduces the same odds on any number of processes.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    batch_sizes = [min(batch_size, num_seasons - start) for start in range(0, num_seasons, batch_size)]
+    tasks = list(zip(batch_sizes, seed_sequence.spawn(len(batch_sizes))))
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=cfb_performance.process_pool_context(),
+                                 initializer=_init_worker, initargs=(problem,)) as executor:
+            batches = list(executor.map(_simulate_chunk, tasks))
+    else:
+        batches = [simulate_batch(problem, np.random.default_rng(child), size) for size, child in tasks]
+
+    totals = {key: sum(batch[key] for batch in batches) for key in batches[0]} if batches else {}
+    totals['seed'] = seed_sequence.entropy
+    return totals
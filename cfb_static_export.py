@@ -0,0 +1,208 @@
+# cfb_static_export.py
+"""
+CFB Static Export Module
+Renders public pages through the Flask app into a directory of static HTML that a
+web server can serve with no Python work, e.g. with nginx:
+
+    location / { root <export dir>; try_files $uri $uri/index.html @app; }
+
+(/static stays served from the app's static folder.) /team/Texas%20A%26M is written
+to <export dir>/team/Texas A&M/index.html - the decoded path, as nginx's $uri.
+
+Incremental: manifest.json in the export directory keeps, per page, a digest of the
+page's inputs and of its HTML. Pages whose inputs are unchanged are not rendered at
+all, rendered pages are only rewritten when their HTML changed, and pages that no
+longer exist are deleted. Files are replaced atomically, so the server never reads a
+half-written page. Rendering is spread over a fork()ed process pool - call
+export_pages from a single-threaded process (scripts/export_static.py), since a
+fork() taken while another thread holds a lock can deadlock the child.
+"""
+
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import unquote
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+MANIFEST_FILE = 'manifest.json'
+LOCK_FILE = '.export.lock'
+MANIFEST_VERSION = 1
+CHUNKS_PER_WORKER = 4
+
+_worker_app = None  # Flask app inherited by fork()ed render workers
+
+
+def page_file(path):
+    """Export-relative file for a page path: /rankings/SEC -> rankings/SEC/index.html"""
+    parts = [unquote(part) for part in path.split('?')[0].strip('/').split('/') if part]
+    if any(part in ('.', '..') or '\x00' in part or os.sep in part for part in parts):
+        raise ValueError(f"Unsafe page path {path!r}")
+    return os.path.join(*parts, 'index.html') if parts else 'index.html'
+
+
+def input_digest(*inputs):
+    """Digest of the values a page is rendered from (anything with a stable repr)"""
+    return hashlib.md5(repr(inputs).encode()).hexdigest()
+
+
+def atomic_write(filename, data):
+    directory = os.path.dirname(filename)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(temp_name, 0o644)
+        os.replace(temp_name, filename)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def load_manifest(export_dir):
+    try:
+        with open(os.path.join(export_dir, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('pages', {})
+
+
+def save_manifest(export_dir, pages):
+    data = {'version': MANIFEST_VERSION, 'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'pages': pages}
+    atomic_write(os.path.join(export_dir, MANIFEST_FILE), json.dumps(data, indent=1, sort_keys=True).encode())
+
+
+class ExportLock:
+    """Exclusive lock on the export directory, so worker processes export one at a time"""
+
+    def __init__(self, export_dir):
+        self.filename = os.path.join(export_dir, LOCK_FILE)
+        self._file = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        self._file = open(self.filename, 'a')
+        if FCNTL_AVAILABLE:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if FCNTL_AVAILABLE:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+
+
+def render_pages(app, export_dir, pages):
+    """
+    Render [(path, previous content digest)] with app's test client and write the pages
+    whose HTML changed. Returns [(path, status, content digest or None, written)] -
+    pages that are not a fresh 200 (errors, redirects, stale rankings) are not written.
+    """
+    client = app.test_client()
+    results = []
+    for path, previous in pages:
+        try:
+            response = client.get(path)
+        except Exception as e:
+            print(f"❌ Static export of {path} failed: {e}")
+            results.append((path, 500, None, False))
+            continue
+        if response.status_code != 200 or response.headers.get('X-Ranking-Stale'):
+            results.append((path, response.status_code, None, False))
+            continue
+        html = response.get_data()
+        digest = hashlib.md5(html).hexdigest()
+        written = digest != previous or not os.path.exists(os.path.join(export_dir, page_file(path)))
+        if written:
+            atomic_write(os.path.join(export_dir, page_file(path)), html)
+        results.append((path, 200, digest, written))
+    return results
+
+
+def _init_render_worker(initializer):
+    if initializer is not None:
+        initializer()
+
+
+def _render_chunk(export_dir, pages):
+    return render_pages(_worker_app, export_dir, pages)
+
+
+def export_pages(app, export_dir, pages, workers=1, worker_initializer=None, force=False):
+    """
+    Bring export_dir up to date with pages ({path: input digest}). worker_initializer
+    runs first in each render process (e.g. to drop database connections inherited
+    from the parent). force=True renders every page even if its inputs are unchanged
+    (files are still only rewritten when their HTML changed). Returns a summary dict.
+    """
+    global _worker_app
+    start_time = time.perf_counter()
+    with ExportLock(export_dir):
+        manifest = load_manifest(export_dir)
+        todo = [(path, manifest[path]['content'] if path in manifest else None)
+                for path, inputs in sorted(pages.items())
+                if force or path not in manifest or manifest[path]['inputs'] != inputs]
+
+        workers = max(1, min(workers, len(todo)))
+        if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            workers = 1  # Render workers need the parent's app - only fork() gives them one
+        if workers <= 1:
+            results = render_pages(app, export_dir, todo)
+        else:
+            chunk_size = max(1, math.ceil(len(todo) / (workers * CHUNKS_PER_WORKER)))
+            chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+            _worker_app = app
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                         initializer=_init_render_worker, initargs=(worker_initializer,)) as executor:
+                    results = [result for chunk in executor.map(_render_chunk, [export_dir] * len(chunks), chunks)
+                               for result in chunk]
+            finally:
+                _worker_app = None
+
+        written = failed = 0
+        for path, status, digest, was_written in results:
+            if digest is None:
+                failed += 1
+                if path in manifest:
+                    manifest[path]['inputs'] = None  # Retried next export; the previous file stays in place
+                continue
+            manifest[path] = {'inputs': pages[path], 'content': digest, 'file': page_file(path)}
+            written += was_written
+
+        removed = 0
+        for path in [path for path in manifest if path not in pages]:
+            try:
+                os.unlink(os.path.join(export_dir, manifest.pop(path)['file']))
+                removed += 1
+            except OSError:
+                pass
+
+        save_manifest(export_dir, manifest)
+
+    return {
+        'pages': len(pages),
+        'rendered': len(results),
+        'written': written,
+        'unchanged': len(results) - written - failed,
+        'skipped': len(pages) - len(results),
+        'failed': failed,
+        'removed': removed,
+        'workers': workers,
+        'duration_ms': round((time.perf_counter() - start_time) * 1000, 1)
+    }
@@ -0,0 +1,262 @@
+# cfb_vector_ranking.py
+"""
+CFB Vector Ranking Module
+NumPy backend for the bulk rankings served by get_all_team_stats_bulk().
+
+The season is encoded once as parallel per-game arrays (team index, opponent
+index, scores, location code, week weight, result) and every ranking component
+is computed with array operations instead of per-game dict loops. Every kernel
+also accepts a leading "simulation" axis so many seasons can be ranked at once.
+"""
+
+import numpy as np
+
+# Location encoding - code 3 covers anything unexpected (multiplier 1.0 like .get(..., 1.0))
+LOCATION_CODES = {'Home': 0, 'Away': 1, 'Neutral': 2}
+LOCATION_OTHER = 3
+LOCATION_MULTIPLIERS = np.array([1.0, 1.3, 1.15, 1.0])
+
+# Opponent tiers used by the bulk victory value formula
+TIER_P4 = 0
+TIER_G6 = 1
+TIER_OTHER = 2
+
+
+class EncodedSeason:
+    """
+    Parallel arrays for every team-game row of a season.
+
+    Per-game arrays (length G): team_idx, opp_idx, team_score, opp_score,
+    location, week_weight, result (1 = win, 0 = loss).
+    Per-team arrays (length E, ranked teams first, then outside opponents such
+    as 'FCS'): tier, zone, is_fcs, conference_multiplier, wins, losses.
+    """
+
+    def __init__(self, team_names, num_ranked, team_idx, opp_idx, team_score, opp_score,
+                 location, week_weight, result, tier, zone, is_fcs, conference_multiplier,
+                 wins, losses):
+        self.team_names = team_names
+        self.team_index = {name: i for i, name in enumerate(team_names)}
+        self.num_ranked = num_ranked
+        self.team_idx = team_idx
+        self.opp_idx = opp_idx
+        self.team_score = team_score
+        self.opp_score = opp_score
+        self.location = location
+        self.week_weight = week_weight
+        self.result = result
+        self.tier = tier
+        self.zone = zone
+        self.is_fcs = is_fcs
+        self.conference_multiplier = conference_multiplier
+        self.wins = wins
+        self.losses = losses
+        self._incidence = None
+
+    @property
+    def num_teams(self):
+        return len(self.team_names)
+
+    @property
+    def num_games(self):
+        return len(self.team_idx)
+
+    def incidence(self):
+        """Dense (G, E) one-hot of team_idx - turns per-team sums into one matmul for batches"""
+        if self._incidence is None:
+            incidence = np.zeros((self.num_games, self.num_teams))
+            incidence[np.arange(self.num_games), self.team_idx] = 1.0
+            self._incidence = incidence
+        return self._incidence
+
+
+def encode_season(team_lookup, tier_of, zone_of, multiplier_of, week_weight_of, default_week='7'):
+    """
+    Encode {team_name: stats dict with games} as an EncodedSeason.
+
+    tier_of(name) -> TIER_* code, zone_of(name) -> time zone order (0-3),
+    multiplier_of(name) -> conference multiplier, week_weight_of(week) -> temporal weight.
+    """
+    team_names = list(team_lookup.keys())
+    team_index = {name: i for i, name in enumerate(team_names)}
+    num_ranked = len(team_names)
+
+    team_idx = []
+    opp_idx = []
+    team_score = []
+    opp_score = []
+    location = []
+    weeks = []
+    result = []
+
+    for name in list(team_names):
+        t = team_index[name]
+        for game in team_lookup[name]['games']:
+            opponent = game['opponent']
+            o = team_index.get(opponent)
+            if o is None:
+                o = team_index[opponent] = len(team_names)
+                team_names.append(opponent)
+            team_idx.append(t)
+            opp_idx.append(o)
+            team_score.append(game['team_score'])
+            opp_score.append(game['opp_score'])
+            location.append(LOCATION_CODES.get(game['home_away'], LOCATION_OTHER))
+            weeks.append(str(game.get('week', default_week)))
+            result.append(1 if game['result'] == 'W' else 0)
+
+    # Temporal weights: one lookup per distinct week label, then a vectorized gather
+    week_labels, week_codes = np.unique(np.array(weeks, dtype=str), return_inverse=True)
+    week_weight = temporal_weights(week_codes, [week_weight_of(label) for label in week_labels])
+
+    wins = np.zeros(len(team_names))
+    losses = np.zeros(len(team_names))
+    for i in range(num_ranked):
+        wins[i] = team_lookup[team_names[i]]['wins']
+        losses[i] = team_lookup[team_names[i]]['losses']
+
+    return EncodedSeason(
+        team_names=team_names,
+        num_ranked=num_ranked,
+        team_idx=np.array(team_idx, dtype=np.int64),
+        opp_idx=np.array(opp_idx, dtype=np.int64),
+        team_score=np.array(team_score, dtype=np.float64),
+        opp_score=np.array(opp_score, dtype=np.float64),
+        location=np.array(location, dtype=np.int64),
+        week_weight=week_weight,
+        result=np.array(result, dtype=np.float64),
+        tier=np.array([tier_of(name) for name in team_names], dtype=np.int64),
+        zone=np.array([zone_of(name) for name in team_names], dtype=np.int64),
+        is_fcs=np.array([name == 'FCS' for name in team_names], dtype=bool),
+        conference_multiplier=np.array([multiplier_of(name) for name in team_names]),
+        wins=wins,
+        losses=losses
+    )
+
+
+def temporal_weights(week_codes, weight_table):
+    """Vectorized get_temporal_weight_by_week: gather weights for encoded week labels"""
+    return np.asarray(weight_table, dtype=np.float64)[np.asarray(week_codes, dtype=np.int64).ravel()]
+
+
+def margin_bonus(margin, opponent_quality=None):
+    """
+    Vectorized margin bonus with diminishing returns.
+    With opponent_quality this is calculate_margin_bonus_capped; without it the
+    uncapped curve used by the bulk rankings.
+    """
+    margin = np.asarray(margin, dtype=np.float64)
+    if opponent_quality is not None:
+        caps = np.select(
+            [opponent_quality < 3.0, opponent_quality < 5.0, opponent_quality < 7.0],
+            [17.0, 24.0, 35.0],
+            50.0
+        )
+        margin = np.minimum(margin, caps)
+    bonus = np.select(
+        [margin <= 7, margin <= 14, margin <= 21],
+        [margin * 0.1, 0.7 + (margin - 7) * 0.08, 1.26 + (margin - 14) * 0.04],
+        1.54 + (margin - 21) * 0.02
+    )
+    if opponent_quality is not None:
+        bonus = np.where(margin <= 0, 0.0, bonus)
+    return bonus
+
+
+def _team_sum(season, values):
+    """Sum per-game values into per-team totals (sequential bincount keeps Python's summation order)"""
+    if values.ndim == 1:
+        return np.bincount(season.team_idx, weights=values, minlength=season.num_teams)
+    return values @ season.incidence()
+
+
+def compute_bulk_components(season, wins=None, losses=None, result=None, margin=None):
+    """
+    Bulk ranking components for every encoded team.
+
+    wins/losses default to the encoded records (shape (E,)); pass (S, E) arrays
+    together with (S, G) result/margin arrays to rank S simulated seasons at once.
+    Returns a dict of arrays with a trailing team axis.
+    """
+    wins = season.wins if wins is None else wins
+    losses = season.losses if losses is None else losses
+    result = season.result if result is None else result
+    margin = (season.team_score - season.opp_score) if margin is None else margin
+
+    is_win = result > 0.5
+    opp_fcs = season.is_fcs[season.opp_idx]
+    opp_tier = season.tier[season.opp_idx]
+
+    # Opponent records - the bulk lookup only holds teams that have played
+    opp_w = wins[..., season.opp_idx]
+    opp_l = losses[..., season.opp_idx]
+    opp_games = opp_w + opp_l
+    in_lookup = opp_games > 0
+    opp_win_pct = opp_w / np.where(in_lookup, opp_games, 1.0)
+
+    # 1. Victory value: subdivision-aware opponent quality x location + margin + travel
+    win_quality = np.select(
+        [opp_tier == TIER_P4, opp_tier == TIER_G6],
+        [4.0 + (opp_win_pct * 4.0), 2.5 + (opp_win_pct * 4.0)],
+        2.0 + (opp_win_pct * 6.0)
+    )
+    win_quality = np.where(in_lookup, win_quality, 5.0)
+    win_quality = np.where(opp_fcs, 0.5, win_quality)
+
+    location_mult = LOCATION_MULTIPLIERS[season.location]
+    zone_diff = np.abs(season.zone[season.team_idx] - season.zone[season.opp_idx])
+    travel_bonus = np.where(
+        season.location == LOCATION_CODES['Away'],
+        np.select([zone_diff >= 3, zone_diff == 2], [0.2, 0.1], 0.0),
+        0.0
+    )
+    victory_value = (win_quality * location_mult) + margin_bonus(margin) + travel_bonus
+    victory_value = np.where(opp_fcs, np.minimum(victory_value, 1.0), victory_value)
+    victory_value = np.where(is_win, victory_value, 0.0)
+
+    # 2. Loss penalty: base + opponent quality adjustment + margin penalty (FCS catastrophic)
+    loss_margin = -margin
+    loss_quality = np.where(in_lookup, 2.0 + (opp_win_pct * 6.0), 5.0)
+    quality_adj = np.select(
+        [loss_quality >= 7.0, loss_quality >= 5.5, loss_quality >= 4.0],
+        [-1.5, -0.5, 0.5],
+        2.0
+    )
+    margin_penalty = np.select([loss_margin <= 3, loss_margin <= 7, loss_margin <= 14], [0.0, 0.5, 1.0], 2.0)
+    loss_penalty = 3.0 + quality_adj + margin_penalty
+    loss_penalty = np.where(opp_fcs, 10.0 + (loss_margin * 0.5), loss_penalty)
+    loss_penalty = np.where(is_win, 0.0, loss_penalty)
+
+    # 3. Strength of schedule: opponents' combined record (FCS excluded)
+    counted = in_lookup & ~opp_fcs
+    opp_total_wins = _team_sum(season, np.where(counted, opp_w, 0.0))
+    opp_total_losses = _team_sum(season, np.where(counted, opp_l, 0.0))
+    opp_total_games = opp_total_wins + opp_total_losses
+    strength_of_schedule = np.where(
+        opp_total_games > 0, opp_total_wins / np.where(opp_total_games > 0, opp_total_games, 1.0), 0.5
+    )
+
+    # Temporal-weighted average opponent quality (1-10 style SOS rating)
+    weighted_quality = _team_sum(season, np.broadcast_to(season.week_weight, win_quality.shape) * win_quality)
+    total_weight = np.bincount(season.team_idx, weights=season.week_weight, minlength=season.num_teams)
+    sos_rating = np.where(total_weight > 0, weighted_quality / np.where(total_weight > 0, total_weight, 1.0), 5.0)
+
+    # 4. Final composition
+    total_victory_value = _team_sum(season, victory_value)
+    total_loss_penalty = _team_sum(season, loss_penalty)
+    games_played = np.bincount(season.team_idx, minlength=season.num_teams)
+    games_bonus = np.minimum(2.5, games_played * 0.18)
+    adjusted_total = total_victory_value * season.conference_multiplier - total_loss_penalty + games_bonus
+
+    return {
+        'victory_value': total_victory_value,
+        'loss_penalty': total_loss_penalty,
+        'games_bonus': games_bonus,
+        'adjusted_total': adjusted_total,
+        'opp_w': opp_total_wins,
+        'opp_l': opp_total_losses,
+        'strength_of_schedule': strength_of_schedule,
+        'sos_rating': sos_rating,
+        'wins': wins,
+        'losses': losses
+    }
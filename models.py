@@ -3,6 +3,7 @@
 
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from collections import defaultdict
 import json
 
 # Create the database object
@@ -71,7 +72,7 @@ class TeamStats(db.Model):
     home_wins = db.Column(db.Integer, default=0)  # 6
     road_wins = db.Column(db.Integer, default=0)  # 4
     margin_of_victory_total = db.Column(db.Integer, default=0)  # 240
-    games_json = db.Column(db.Text, default='[]')  # Store individual games as JSON text
+    games_json = db.Column(db.Text, default='[]')  # Legacy JSON game log - NULL once moved to cfb_team_games
     last_updated = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # ADD THESE LINES FOR PERFORMANCE (right before @property):
@@ -84,18 +85,28 @@ class TeamStats(db.Model):
 
 
 
+    @property
+    def games_migrated(self):
+        """True once this team's game log lives in cfb_team_games"""
+        return self.games_json is None
+
     @property
     def games(self):
-        """Get the games list (converts JSON text back to Python list)"""
+        """Get the games list (from cfb_team_games once migrated, else the JSON text)"""
+        if self.games_migrated:
+            rows = TeamGame.query.filter_by(team_name=self.team_name).order_by(TeamGame.sequence).all()
+            return [row.to_dict() for row in rows]
         return json.loads(self.games_json) if self.games_json else []
     
     @games.setter
     def games(self, value):
-        """Set the games list (converts Python list to JSON text)"""
+        """Set the games list (converts Python list to JSON text) - legacy, un-migrated teams only"""
+        if self.games_migrated:
+            raise ValueError(f"{self.team_name} game log is in cfb_team_games - add or delete TeamGame rows instead")
         self.games_json = json.dumps(value)
     
-    def to_dict(self):
-        """Convert to the format your current app expects"""
+    def to_dict(self, games=None):
+        """Convert to the format your current app expects (pass games when already loaded)"""
         return {
             'wins': self.wins,
             'losses': self.losses,
@@ -104,9 +115,136 @@ class TeamStats(db.Model):
             'home_wins': self.home_wins,
             'road_wins': self.road_wins,
             'margin_of_victory_total': self.margin_of_victory_total,
-            'games': self.games  # This automatically uses the @property above
+            'games': self.games if games is None else games  # This automatically uses the @property above
         }
 
+    @staticmethod
+    def to_dicts(records):
+        """{team_name: to_dict()} for many rows - migrated game logs load in one query per 500 teams"""
+        migrated = [record.team_name for record in records if record.games_migrated]
+        game_logs = defaultdict(list)
+        for start in range(0, len(migrated), 500):
+            # Plain column tuples - much cheaper than building TeamGame objects for a whole season
+            rows = db.session.query(
+                TeamGame.team_name, TeamGame.opponent, TeamGame.team_score, TeamGame.opp_score,
+                TeamGame.result, TeamGame.home_away, TeamGame.overtime
+            ).filter(
+                TeamGame.team_name.in_(migrated[start:start + 500])
+            ).order_by(TeamGame.team_name, TeamGame.sequence).all()
+            for team_name, opponent, team_score, opp_score, result, home_away, overtime in rows:
+                game_logs[team_name].append({
+                    'opponent': opponent,
+                    'team_score': team_score,
+                    'opp_score': opp_score,
+                    'result': result,
+                    'home_away': home_away,
+                    'overtime': overtime
+                })
+        return {
+            record.team_name: record.to_dict(game_logs[record.team_name] if record.games_migrated else None)
+            for record in records
+        }
+
+class TeamGame(db.Model):
+    """
+    Normalized game log - replaces TeamStats.games_json
+    Each row = one game from one team's point of view (every game appears twice)
+    """
+    __tablename__ = 'cfb_team_games'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    team_name = db.Column(db.String(100), nullable=False)  # "Alabama"
+    opponent = db.Column(db.String(100), nullable=False)  # "Auburn" or "FCS"
+    week = db.Column(db.String(30), nullable=True)  # "1", "Bowls", ... (NULL when unknown)
+    result = db.Column(db.String(1), nullable=False)  # "W" / "L"
+    team_score = db.Column(db.Integer, nullable=False)
+    opp_score = db.Column(db.Integer, nullable=False)
+    home_away = db.Column(db.String(10), nullable=False)  # "Home", "Away", "Neutral"
+    overtime = db.Column(db.Boolean, default=False)
+    sequence = db.Column(db.Integer, nullable=False)  # Order within the team's season (games_json order)
+    game_id = db.Column(db.Integer, nullable=True, index=True)  # cfb_games.id when known
+    date_added = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        db.Index('idx_team_games_team_sequence', 'team_name', 'sequence'),
+        db.Index('idx_team_games_team_opponent', 'team_name', 'opponent'),
+        db.Index('idx_team_games_opponent', 'opponent'),
+        db.Index('idx_team_games_team_week', 'team_name', 'week'),
+        db.Index('idx_team_games_team_result', 'team_name', 'result'),
+    )
+
+    def to_dict(self):
+        """Same shape as a games_json entry (rankings read these)"""
+        return {
+            'opponent': self.opponent,
+            'team_score': self.team_score,
+            'opp_score': self.opp_score,
+            'result': self.result,
+            'home_away': self.home_away,
+            'overtime': self.overtime
+        }
+
+class RankingResult(db.Model):
+    """
+    Materialized bulk rankings - one row per ranked team per data revision
+    Written when results change; /rankings and friends read them back in rank order
+    """
+    __tablename__ = 'cfb_ranking_results'
+
+    id = db.Column(db.Integer, primary_key=True)
+    revision = db.Column(db.String(64), nullable=False)  # "r<SeasonRevision.revision>"
+    rank = db.Column(db.Integer, nullable=False)
+    team_name = db.Column(db.String(100), nullable=False)
+    conference = db.Column(db.String(50), nullable=True)
+    wins = db.Column(db.Integer, default=0)
+    losses = db.Column(db.Integer, default=0)
+    adjusted_total = db.Column(db.Float, nullable=False)
+    strength_of_schedule = db.Column(db.Float, default=0.5)
+    strength_of_record = db.Column(db.Float, default=0.0)
+    opp_w = db.Column(db.Integer, default=0)
+    opp_l = db.Column(db.Integer, default=0)
+    point_differential = db.Column(db.Integer, default=0)
+    stats_json = db.Column(db.Text, nullable=False)  # Full get_all_team_stats_bulk() entry
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('revision', 'rank', name='uq_ranking_results_revision_rank'),
+        db.Index('idx_ranking_results_revision_team', 'revision', 'team_name'),
+    )
+
+    @classmethod
+    def from_stats(cls, revision, rank, stats):
+        return cls(
+            revision=revision,
+            rank=rank,
+            team_name=stats['team'],
+            conference=stats['conference'],
+            wins=stats['total_wins'],
+            losses=stats['total_losses'],
+            adjusted_total=stats['adjusted_total'],
+            strength_of_schedule=stats['strength_of_schedule'],
+            strength_of_record=stats['strength_of_record'],
+            opp_w=stats['opp_w'],
+            opp_l=stats['opp_l'],
+            point_differential=stats['point_differential'],
+            stats_json=json.dumps(stats)
+        )
+
+    @property
+    def stats(self):
+        return json.loads(self.stats_json)
+
+class SeasonRevision(db.Model):
+    """
+    Single-row counter bumped by every write to the season data (games, team stats, schedule)
+    Derived caches key on it, so they are invalidated exactly - in every worker - and live until the next write
+    """
+    __tablename__ = 'cfb_season_revision'
+
+    id = db.Column(db.Integer, primary_key=True)
+    revision = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
 # Add these fields to your existing ScheduledGame model in models.py
 
 class ScheduledGame(db.Model):
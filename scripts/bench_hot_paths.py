@@ -0,0 +1,246 @@
+# bench_hot_paths.py - Ranking / prediction hot paths on a synthetic full season
+#
+# Usage: python scripts/bench_hot_paths.py [--output bench_results.json] [--compare previous.json]
+#                                          [--repeat 5] [--seed 2025] [--weeks 13] [--db /tmp/bench.db]
+#
+# Generates a synthetic season (scripts/synthetic_season.py) into a scratch SQLite DB,
+# then times the hot paths cold (ranking state and materialized rankings dropped) and
+# warm, counting the SQL statements each one issues. A benchmark fails when it issues
+# more queries than its budget in QUERY_BUDGETS - query counts are deterministic for a
+# given fixture, so any increase is an N+1 regression. Results are written as JSON;
+# --compare prints the change against an earlier results file.
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic_season  # noqa: E402
+
+DEFAULT_SEED = 2025
+DEFAULT_WEEKS = 13
+
+# Maximum SQL statements per call: (fixed, per unit, unit), unit being the fixture's
+# 'teams' or 'pending_games' (one bowl matchup each), so every fixture is checked.
+# Targets - the query count the design calls for, independent of the season size:
+#   bulk rankings cold = revision + stored rankings (a miss, computed in memory) +
+#   ranking state load (revision, TeamStats, TeamGame) + first-use table check, warm =
+#   revision + stored rankings; snapshot rankings reuse the ranking state; the enhanced
+#   ranking of one team outside a request re-reads only the revision.
+# Snapshots - today's cost, NOT a target; lower them as the per-call queries go:
+#   predict_matchup_ultra_enhanced ~9 per matchup (a revision read per helper, both
+#   teams' game logs and TeamStats rows); auto_predict_week ~16 per game (the same,
+#   plus the duplicate-prediction and scheduled-game lookups and the log insert).
+QUERY_BUDGETS = {
+    'get_all_team_stats_bulk (cold)': (6, 0, None),
+    'get_all_team_stats_bulk (warm)': (2, 0, None),
+    'calculate_enhanced_scientific_ranking (all teams)': (0, 1, 'teams'),
+    'calculate_all_team_rankings (cold)': (3, 0, None),
+    'calculate_all_team_rankings (warm)': (1, 0, None),
+    'predict_matchup_ultra_enhanced (bowl matchups)': (0, 9, 'pending_games'),  # snapshot
+    'auto_predict_week (bowls)': (2, 16, 'pending_games'),  # snapshot
+}
+
+
+def query_budget(name, fixture):
+    if name not in QUERY_BUDGETS:
+        return None
+    fixed, per_unit, unit = QUERY_BUDGETS[name]
+    return fixed + (per_unit * fixture[unit] if unit else 0)
+
+
+class QueryCounter:
+    """Counts statements on the app engine while active"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.count = 0
+        self.active = False
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        if self.active:
+            self.count += 1
+
+    @contextlib.contextmanager
+    def counting(self):
+        self.count = 0
+        self.active = True
+        try:
+            yield self
+        finally:
+            self.active = False
+
+
+def reset_ranking_state(app):
+    """Drop every derived ranking table so the next call rebuilds from TeamStats"""
+    app._opponent_quality_state['revision'] = None
+    app._local_revision_changes.clear()
+    app.clear_cache()
+    app.RankingResult.query.delete()
+    app.db.session.commit()
+
+
+def bowl_matchups(app):
+    return [(game.home_team, game.away_team) for game in
+            app.ScheduledGame.query.filter_by(completed=False).order_by(app.ScheduledGame.id)]
+
+
+def clear_automated_predictions(app, week):
+    app.CFBPredictionLog.query.filter_by(week=week, prediction_type='automated').delete()
+    app.db.session.commit()
+
+
+def build_benchmarks(app, fixture):
+    """(name, setup, run) - setup runs untimed before every repetition"""
+    # Prediction math only - the tracking decorator's log write is not part of the hot path
+    predict = getattr(app.predict_matchup_ultra_enhanced, '__wrapped__', app.predict_matchup_ultra_enhanced)
+    matchups = bowl_matchups(app)
+    team_names = [stats.team_name for stats in app.TeamStats.query.order_by(app.TeamStats.team_name)]
+    pending_week = fixture['pending_week']
+
+    def warm_rankings():
+        # As after a write: the post-write hook has stored the rankings for the revision
+        app.materialize_ranking_results()
+        app.get_all_team_stats_bulk()
+        app.get_opponent_quality_state()
+
+    def predict_week():
+        # The admin route body, without the login check; it flashes, so it needs a request
+        with app.app.test_request_context():
+            app.auto_predict_week.__wrapped__(pending_week)
+
+    benchmarks = [
+        ('get_all_team_stats_bulk (cold)', lambda: reset_ranking_state(app), app.get_all_team_stats_bulk),
+        ('get_all_team_stats_bulk (warm)', warm_rankings, app.get_all_team_stats_bulk),
+        ('calculate_enhanced_scientific_ranking (all teams)', warm_rankings,
+         lambda: [app.calculate_enhanced_scientific_ranking(team_name) for team_name in team_names]),
+        ('calculate_all_team_rankings (cold)', lambda: reset_ranking_state(app), app.calculate_all_team_rankings),
+        ('calculate_all_team_rankings (warm)', warm_rankings, app.calculate_all_team_rankings),
+        ('predict_matchup_ultra_enhanced (bowl matchups)', warm_rankings,
+         lambda: [predict(home, away, 'neutral') for home, away in matchups]),
+    ]
+    if pending_week:
+        benchmarks.append(('auto_predict_week (bowls)',
+                           lambda: (warm_rankings(), clear_automated_predictions(app, pending_week)), predict_week))
+    return benchmarks
+
+
+def run_benchmark(counter, setup, run, repeat):
+    """Best/median/mean wall time and the most queries any repetition issued"""
+    times = []
+    queries = 0
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            setup()
+            with counter.counting():
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+        queries = max(queries, counter.count)
+    return {
+        'repeat': repeat,
+        'min_ms': round(min(times) * 1000, 2),
+        'median_ms': round(statistics.median(times) * 1000, 2),
+        'mean_ms': round(statistics.mean(times) * 1000, 2),
+        'queries': queries
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nvs {baseline_path} ({baseline.get('git_revision')}, {baseline.get('generated_at')}):")
+    for name, result in results['benchmarks'].items():
+        previous = baseline.get('benchmarks', {}).get(name)
+        if previous is None:
+            print(f"  {name:<52} (new)")
+            continue
+        change = (result['median_ms'] - previous['median_ms']) / previous['median_ms'] * 100 if previous['median_ms'] else 0.0
+        query_change = result['queries'] - previous['queries']
+        print(f"  {name:<52} {change:+7.1f}% time  {query_change:+d} queries")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot path benchmarks on a synthetic season')
+    parser.add_argument('--output', default='bench_results.json', help='results JSON file')
+    parser.add_argument('--compare', help='earlier results JSON to compare against')
+    parser.add_argument('--repeat', type=int, default=5, help='repetitions per benchmark')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='synthetic season seed')
+    parser.add_argument('--weeks', type=int, default=DEFAULT_WEEKS, choices=range(12, 16), metavar='12-15',
+                        help='regular season weeks')
+    parser.add_argument('--db', help='scratch SQLite file (default: a temporary file, removed afterwards)')
+    args = parser.parse_args()
+
+    # Synchronous, in-process recomputes: timings must not depend on a background thread
+    os.environ['RANKING_RECOMPUTE_WORKER'] = 'false'
+
+    scratch_dir = None
+    db_path = args.db
+    if db_path is None:
+        scratch_dir = tempfile.TemporaryDirectory(prefix='cfb_bench_')
+        db_path = os.path.join(scratch_dir.name, 'bench.db')
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            app, fixture = synthetic_season.generate_into(db_path, seed=args.seed, weeks=args.weeks, force=True)
+        print(f"Fixture: {fixture['teams']} teams, {fixture['games']} games, {fixture['pending_games']} pending "
+              f"(seed {fixture['seed']}, {fixture['elapsed_s']} s to generate)")
+
+        results = {
+            'generated_at': datetime.utcnow().isoformat() + 'Z',
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'ranking_workers': app.RANKING_WORKERS,
+            'fixture': fixture,
+            'benchmarks': {}
+        }
+        failures = []
+        with app.app.app_context():
+            counter = QueryCounter(app.db.engine)
+            for name, setup, run in build_benchmarks(app, fixture):
+                result = run_benchmark(counter, setup, run, args.repeat)
+                result['query_budget'] = query_budget(name, fixture)
+                results['benchmarks'][name] = result
+                over_budget = result['query_budget'] is not None and result['queries'] > result['query_budget']
+                if over_budget:
+                    failures.append(name)
+                print(f"{name:<52} {result['median_ms']:9.1f} ms median  {result['min_ms']:9.1f} ms best  "
+                      f"{result['queries']:4d} queries{'  ❌ budget ' + str(result['query_budget']) if over_budget else ''}")
+    finally:
+        if scratch_dir is not None:
+            scratch_dir.cleanup()
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+    if failures:
+        print(f"❌ Query budget exceeded: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# bench_parallel_rankings.py - Serial vs process-pool enhanced rankings
+#
+# Usage: OFFSEASON_MODE=true python scripts/bench_parallel_rankings.py [--workers 1 2 4 8] [--repeat 3] [--scale 1]
+#
+# Ranks every team of the current season the way calculate_all_team_rankings and
+# archive_current_season_db do, once serially and once per worker count with
+# rank_teams_parallel, and checks every parallel result matches the serial one.
+# --scale N ranks the season N times per pass to simulate heavier workloads.
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.environ.setdefault('OFFSEASON_MODE', 'true')
+
+import app  # noqa: E402
+
+
+def best_time(run, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parallel ranking benchmark')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='worker counts to time')
+    parser.add_argument('--repeat', type=int, default=3, help='timing repetitions (best is reported)')
+    parser.add_argument('--scale', type=int, default=1, help='rank every team this many times per pass')
+    args = parser.parse_args()
+
+    with app.app.app_context():
+        state = app.get_opponent_quality_state()
+        season_data = state['season_data']
+        qualities = state['qualities']
+        team_names = list(season_data.keys()) * args.scale
+        if not season_data:
+            print("❌ No team stats in the database - add games or seed a season first")
+            sys.exit(1)
+
+        serial_time, expected = best_time(
+            lambda: app.rank_teams_parallel(season_data, qualities, team_names, workers=1), args.repeat
+        )
+        print(f"{len(team_names)} team rankings per pass ({len(season_data)} teams x {args.scale}), {os.cpu_count()} CPUs")
+        print(f"Serial:       {serial_time * 1000:9.1f} ms")
+
+        for workers in args.workers:
+            if workers <= 1:
+                continue
+            elapsed, result = best_time(
+                lambda: app.rank_teams_parallel(season_data, qualities, team_names, workers=workers), args.repeat
+            )
+            if result != expected or list(result) != list(expected):
+                print(f"❌ {workers} workers: results differ from the serial ranking")
+                sys.exit(1)
+            print(f"{workers} workers:  {elapsed * 1000:9.1f} ms  ({serial_time / elapsed:.2f}x, "
+                  f"{serial_time / elapsed / workers * 100:.0f}% efficiency)")
+
+
+if __name__ == '__main__':
+    main()
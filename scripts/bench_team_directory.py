@@ -0,0 +1,135 @@
+# bench_team_directory.py - Per-game lookup overhead: legacy scans vs TeamDirectory
+#
+# Usage: OFFSEASON_MODE=true python scripts/bench_team_directory.py [--games 1600] [--repeat 5]
+#
+# Replays the lookups every ranking loop does per game (conference for both teams,
+# P4/G6 tier, rivalry bonus, travel time zones, logo) with the old linear-scan
+# implementations and with the precomputed TEAM_DIRECTORY, and checks they agree.
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.environ.setdefault('OFFSEASON_MODE', 'true')
+
+import app  # noqa: E402
+
+
+# Legacy implementations (as they were before TeamDirectory)
+def legacy_team_conference(team_name):
+    for conf_name, teams in app.CONFERENCES.items():
+        if team_name in teams:
+            return conf_name
+    return 'Unknown'
+
+def legacy_is_p4_team(team_name):
+    if team_name in app.P4_INDEPENDENT_TEAMS:
+        return True
+    return legacy_team_conference(team_name) in app.P4_CONFERENCES
+
+def legacy_is_G6_team(team_name):
+    if team_name in app.G6_INDEPENDENT_TEAMS:
+        return True
+    return legacy_team_conference(team_name) in app.G6_CONFERENCES
+
+def legacy_rivalry_bonus(team_name, opponent_name):
+    if not (opponent_name in app.RIVALRIES.get(team_name, []) or
+            team_name in app.RIVALRIES.get(opponent_name, [])):
+        return 0.0
+    rivalry_pair = tuple(sorted([team_name, opponent_name]))
+    for (team_a, team_b), bonus in dict(app.MAJOR_RIVALRY_BONUSES).items():
+        if rivalry_pair == tuple(sorted([team_a, team_b])):
+            return bonus
+    return 0.6
+
+def legacy_time_zone(team):
+    # The old calculate_travel_adjustment rebuilt these lists on every call
+    pacific_teams = list(app.PACIFIC_TEAMS)
+    mountain_teams = list(app.MOUNTAIN_TEAMS)
+    central_teams = list(app.CENTRAL_TEAMS)
+    eastern_teams = list(app.EASTERN_TEAMS)
+    if team in pacific_teams: return 'Pacific'
+    elif team in mountain_teams: return 'Mountain'
+    elif team in central_teams: return 'Central'
+    elif team in eastern_teams: return 'Eastern'
+    else: return 'Central'
+
+def legacy_logo_url(team_name, size='60'):
+    team_id = app.TEAM_LOGOS.get(team_name)
+    if team_id:
+        return f"/static/images/team-logos/{team_id}_{size}.png"
+    return None
+
+
+def legacy_game_lookups(team, opponent):
+    return (
+        legacy_team_conference(team),
+        legacy_team_conference(opponent),
+        legacy_is_p4_team(opponent),
+        legacy_is_G6_team(opponent),
+        legacy_rivalry_bonus(team, opponent),
+        legacy_time_zone(team),
+        legacy_time_zone(opponent),
+        legacy_logo_url(opponent)
+    )
+
+def directory_game_lookups(team, opponent, directory=app.TEAM_DIRECTORY):
+    return (
+        directory.conference(team),
+        directory.conference(opponent),
+        directory.is_p4(opponent),
+        directory.is_g6(opponent),
+        directory.rivalry_bonus(team, opponent),
+        directory.time_zone(team),
+        directory.time_zone(opponent),
+        directory.logo_url(opponent)
+    )
+
+
+def build_games(num_games, seed=42):
+    """Random pairings plus every rivalry pair so the rivalry path is exercised"""
+    rng = random.Random(seed)
+    teams = list(app.TEAMS) + ['FCS', 'Unknown State']
+    games = [(team, rival) for team, rivals in app.RIVALRIES.items() for rival in rivals]
+    while len(games) < num_games:
+        games.append((rng.choice(teams), rng.choice(teams)))
+    return games[:num_games]
+
+def time_per_game(lookup, games, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for team, opponent in games:
+            lookup(team, opponent)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(games) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TeamDirectory per-game lookup benchmark')
+    parser.add_argument('--games', type=int, default=1600, help='team-games to replay (about one FBS season)')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    games = build_games(args.games)
+
+    mismatches = [(team, opponent) for team, opponent in games
+                  if legacy_game_lookups(team, opponent) != directory_game_lookups(team, opponent)]
+    if mismatches:
+        print(f"❌ {len(mismatches)} lookups differ, e.g. {mismatches[:5]}")
+        sys.exit(1)
+    print(f"✅ {len(games)} games: TeamDirectory matches the legacy lookups")
+
+    legacy_ns = time_per_game(legacy_game_lookups, games, args.repeat)
+    directory_ns = time_per_game(directory_game_lookups, games, args.repeat)
+    print(f"Legacy scans:    {legacy_ns:8.0f} ns/game")
+    print(f"TeamDirectory:   {directory_ns:8.0f} ns/game")
+    print(f"Removed:         {legacy_ns - directory_ns:8.0f} ns/game ({legacy_ns / directory_ns:.1f}x faster)")
+    print(f"Per season:      {(legacy_ns - directory_ns) * args.games / 1e6:8.2f} ms saved per full pass")
+
+
+if __name__ == '__main__':
+    main()
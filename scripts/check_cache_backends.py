@@ -0,0 +1,120 @@
+# check_cache_backends.py - Behaviour check of the cfb_cache backends
+#
+# Usage: python scripts/check_cache_backends.py [--backends memory,sqlite] [--sqlite-path /tmp/cache.sqlite3]
+#        python scripts/check_cache_backends.py --backends redis --redis-url redis://127.0.0.1:6379/15
+#
+# Runs the same checks against each backend: round trip of a ranking-sized value,
+# TTL expiry, delete/clear, concurrent misses computed once, and (for the shared
+# backends) that a second worker process sees what the first one stored. memory and
+# sqlite need no network; redis needs a Redis-protocol server the check may write to
+# (keys go under a throwaway prefix and are cleared afterwards). Exits 1 on failure.
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+
+import cfb_cache  # noqa: E402
+
+SAMPLE_VALUE = {
+    'rankings': [{'team': f"Team {i}", 'score': i * 1.5, 'record': (i % 12, 12 - i % 12)} for i in range(136)],
+    'revision': 'r42'
+}
+
+
+def make_cache(backend, args, prefix):
+    return cfb_cache.create_cache(backend, prefix=prefix, path=args.sqlite_path, url=args.redis_url,
+                                  max_entries=64, max_bytes=4 * 1024 * 1024)
+
+
+def store_in_child(backend, args, prefix):
+    """Runs in a separate process - the "other worker" """
+    make_cache(backend, args, prefix).set('from_child', SAMPLE_VALUE, namespace='check')
+
+
+def check_backend(backend, args):
+    prefix = f"cfb-check-{os.getpid()}-{int(time.time())}:"
+    cache = make_cache(backend, args, prefix)
+    failures = []
+
+    def expect(condition, message):
+        print(f"  {'ok  ' if condition else 'FAIL'} {message}")
+        if not condition:
+            failures.append(message)
+
+    try:
+        cache.clear()
+        expect(cache.get('absent', namespace='check') is cfb_cache.MISSING, 'missing key is a miss')
+        start = time.perf_counter()
+        cache.set('value', SAMPLE_VALUE, namespace='check')
+        expect(cache.get('value', namespace='check') == SAMPLE_VALUE, 'value round-trips')
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"       set + get of {len(cfb_cache.dumps(SAMPLE_VALUE))} encoded bytes in {elapsed_ms:.2f} ms")
+
+        cache.set('short', 'x', ttl=0.2, namespace='check')
+        time.sleep(0.3)
+        expect(cache.get('short', namespace='check') is cfb_cache.MISSING, 'entry expires after its TTL')
+
+        expect(cache.delete('value') and cache.get('value', namespace='check') is cfb_cache.MISSING,
+               'delete removes the entry')
+
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return SAMPLE_VALUE
+
+        threads = [threading.Thread(target=cache.get_or_compute, args=('shared', compute),
+                                    kwargs={'namespace': 'check'}) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        expect(len(calls) == 1, f"8 concurrent misses computed once (computed {len(calls)}x)")
+
+        if backend != 'memory':
+            child = multiprocessing.Process(target=store_in_child, args=(backend, args, prefix))
+            child.start()
+            child.join()
+            expect(cache.get('from_child', namespace='check') == SAMPLE_VALUE,
+                   'value stored by another process is visible')
+
+        cache.clear()
+        expect(cache.get('shared', namespace='check') is cfb_cache.MISSING, 'clear empties the cache')
+        stats = cache.stats()
+        expect(stats['errors'] == 0, f"no backend errors ({stats['errors']})")
+    except Exception as e:
+        failures.append(repr(e))
+        print(f"  FAIL {e!r}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the cfb_cache backends')
+    parser.add_argument('--backends', default='memory,sqlite',
+                        help=f"comma-separated, from {', '.join(cfb_cache.CACHE_BACKENDS)}")
+    parser.add_argument('--sqlite-path', default=os.path.join(tempfile.gettempdir(), 'cfb_cache_check.sqlite3'),
+                        help='SQLite cache file')
+    parser.add_argument('--redis-url', default=os.environ.get('CACHE_REDIS_URL'),
+                        help='Redis-protocol server (default CACHE_REDIS_URL)')
+    args = parser.parse_args()
+
+    failed = False
+    for backend in args.backends.split(','):
+        print(f"{backend}:")
+        failures = check_backend(backend.strip(), args)
+        failed = failed or bool(failures)
+    if failed:
+        print('❌ Cache backend check failed')
+        sys.exit(1)
+    print('✅ All cache backends passed')
+
+
+if __name__ == '__main__':
+    main()
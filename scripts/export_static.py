@@ -0,0 +1,56 @@
+# export_static.py - Render the public pages to static HTML
+#
+# Usage: python scripts/export_static.py [--export-dir /var/www/cfb] [--workers 8] [--force] [--json]
+#
+# Writes the rankings, every conference view, every team page, the CFP bracket, bowl
+# projections and the archived seasons under --export-dir (default STATIC_EXPORT_DIR,
+# else instance/static_export), rendering only the pages whose inputs changed since the
+# last export (manifest.json there) on --workers processes. The app runs this itself
+# after every write when STATIC_EXPORT_DIR is set; run it by hand after a deploy or with
+# --force to re-render everything. Uses the app's configured database (OFFSEASON_MODE /
+# DATABASE_URL as for the server). --json prints the summary as one JSON line.
+import argparse
+import json
+import os
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(SCRIPTS_DIR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the public pages as static HTML')
+    parser.add_argument('--export-dir', default=os.environ.get('STATIC_EXPORT_DIR'),
+                        help='output directory (default STATIC_EXPORT_DIR, else instance/static_export)')
+    parser.add_argument('--workers', type=int, help='render processes (default STATIC_EXPORT_WORKERS or all cores)')
+    parser.add_argument('--force', action='store_true', help='re-render pages even if their inputs are unchanged')
+    parser.add_argument('--json', action='store_true', help='print the summary as JSON')
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_DIR)
+    # No recompute thread in this process: it forks render workers, and a page must
+    # not queue a background recompute - rankings not stored yet are computed in memory
+    os.environ['RANKING_RECOMPUTE_WORKER'] = 'false'
+    if args.json:
+        # Keep stdout for the summary - the app prints while it starts
+        stdout, sys.stdout = sys.stdout, sys.stderr
+    import app
+
+    export_dir = os.path.abspath(args.export_dir or os.path.join(app.app.instance_path, 'static_export'))
+    with app.app.app_context():
+        result = app.export_static_site(export_dir, workers=args.workers, force=args.force)
+
+    if args.json:
+        sys.stdout = stdout
+        print(json.dumps(dict(result, export_dir=export_dir)))
+        return
+    print(f"{result['pages']} pages in {export_dir}: {result['rendered']} rendered on {result['workers']} "
+          f"process(es), {result['written']} written, {result['unchanged']} unchanged, "
+          f"{result['skipped']} skipped (inputs unchanged), {result['removed']} removed, "
+          f"{result['failed']} failed - {result['duration_ms']} ms")
+    if result['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
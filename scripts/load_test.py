@@ -0,0 +1,258 @@
+# load_test.py - Concurrent HTTP load against a local server with a synthetic season
+#
+# Usage: python scripts/load_test.py [--scenario scripts/load_scenario.json] [--db /tmp/load.db]
+#                                    [--server werkzeug|gunicorn] [--server-workers 4] [--server-threads 4]
+#                                    [--concurrency 32] [--duration 120] [--output load_results.json]
+#        python scripts/load_test.py --url http://127.0.0.1:5001 --db /path/to/the/servers.db
+#
+# Boots the app in offseason mode against a SQLite season (generated with
+# scripts/synthetic_season.py when --db does not exist yet), then drives
+# `concurrency` client threads with keep-alive sessions for the scenario duration.
+# Each thread picks routes by scenario weight from its own seeded RNG, so the
+# request mix is reproducible. {team}, {team2} and {week} in paths/forms are filled
+# from the season's teams and weeks. Reports throughput and p50/p95/p99 latency per
+# route - run it with different --server-workers to size workers before game days.
+import argparse
+import json
+import os
+import platform
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+
+import requests
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_SCENARIO = os.path.join(SCRIPTS_DIR, 'load_scenario.json')
+READY_TIMEOUT_S = 120
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def serve(port, workers):
+    """--serve mode (child process): Werkzeug server, threaded or forking"""
+    sys.path.insert(0, REPO_DIR)
+    import app
+    if workers > 1:
+        app.app.run(host='127.0.0.1', port=port, processes=workers, threaded=False)
+    else:
+        app.app.run(host='127.0.0.1', port=port, threaded=True)
+
+
+def start_server(args, db_path, port):
+    env = dict(os.environ, OFFSEASON_MODE='true', OFFSEASON_DATABASE_URL=f"sqlite:///{os.path.abspath(db_path)}")
+    if args.server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '--workers', str(args.server_workers),
+                   '--threads', str(args.server_threads), '--bind', f"127.0.0.1:{port}", 'app:app']
+    else:
+        command = [sys.executable, os.path.abspath(__file__), '--serve', '--port', str(port),
+                   '--server-workers', str(args.server_workers)]
+    log = open(args.server_log, 'w') if args.server_log else subprocess.DEVNULL
+    return subprocess.Popen(command, cwd=REPO_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+
+def wait_until_ready(base_url, process=None):
+    """First /rankings also materializes the rankings, so it can take a while"""
+    deadline = time.time() + READY_TIMEOUT_S
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"server exited with code {process.returncode} (see --server-log)")
+        try:
+            if requests.get(f"{base_url}/rankings", timeout=READY_TIMEOUT_S).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"server at {base_url} not ready after {READY_TIMEOUT_S} s")
+
+
+def load_placeholder_values(db_path):
+    """Teams with games and weeks with results - what real users click on"""
+    with sqlite3.connect(db_path) as conn:
+        teams = [row[0] for row in conn.execute(
+            'SELECT team_name FROM cfb_team_stats WHERE wins + losses > 0 ORDER BY team_name')]
+        weeks = [row[0] for row in conn.execute('SELECT DISTINCT week FROM cfb_games ORDER BY week')]
+    if len(teams) < 2 or not weeks:
+        raise RuntimeError(f"{db_path} has no season - generate one with scripts/synthetic_season.py")
+    return {'teams': teams, 'weeks': weeks}
+
+
+def fill(template, rng, values):
+    team, team2 = rng.sample(values['teams'], 2)
+    return template.format(team=team, team2=team2, week=rng.choice(values['weeks']))
+
+
+def client_loop(base_url, scenario, values, rng, deadline, samples):
+    routes = scenario['routes']
+    weights = [route.get('weight', 1) for route in routes]
+    timeout = scenario.get('timeout_s', 30)
+    session = requests.Session()
+    while time.time() < deadline:
+        route = rng.choices(routes, weights)[0]
+        url = base_url + fill(route['path'], rng, values)
+        form = {key: fill(value, rng, values) for key, value in route.get('form', {}).items()}
+        start = time.perf_counter()
+        try:
+            response = session.request(route.get('method', 'GET'), url, data=form or None, timeout=timeout,
+                                       allow_redirects=False)
+            response.content  # Include the body transfer
+            status = response.status_code
+        except requests.RequestException as e:
+            status = type(e).__name__
+        samples.append((route['name'], time.perf_counter() - start, status))
+
+
+def drive(base_url, scenario, values, concurrency, duration, seed):
+    """Run concurrency client threads for duration seconds; returns (samples, elapsed)"""
+    samples = []  # list.append is atomic - shared by all client threads
+    deadline = time.time() + duration
+    threads = [
+        threading.Thread(target=client_loop, args=(base_url, scenario, values, random.Random(seed * 1000 + i),
+                                                   deadline, samples), daemon=True)
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - start
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, statuses, elapsed):
+    latencies = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if not isinstance(status, int) or status >= 400)
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 1) if latencies else None,
+        'p95_ms': round(percentile(latencies, 95) * 1000, 1) if latencies else None,
+        'p99_ms': round(percentile(latencies, 99) * 1000, 1) if latencies else None,
+        'max_ms': round(latencies[-1] * 1000, 1) if latencies else None,
+        'statuses': {str(status): count for status, count in sorted(statuses.items(), key=str)}
+    }
+
+
+def build_report(samples, elapsed, scenario):
+    by_route = defaultdict(list)
+    statuses = defaultdict(Counter)
+    for name, latency, status in samples:
+        by_route[name].append(latency)
+        statuses[name][status] += 1
+    routes = {
+        route['name']: summarize(by_route[route['name']], statuses[route['name']], elapsed)
+        for route in scenario['routes']
+    }
+    overall = summarize([latency for _, latency, _ in samples],
+                        sum(statuses.values(), Counter()), elapsed)
+    return routes, overall
+
+
+def print_report(routes, overall):
+    print(f"{'Route':<20}{'Reqs':>8}{'Err':>6}{'Req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in list(routes.items()) + [('TOTAL', overall)]:
+        if not stats['requests']:
+            print(f"{name:<20}{0:>8}")
+            continue
+        print(f"{name:<20}{stats['requests']:>8}{stats['errors']:>6}{stats['throughput_rps']:>9.1f}"
+              f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP load test against a local synthetic season')
+    parser.add_argument('--scenario', default=DEFAULT_SCENARIO, help='scenario JSON file')
+    parser.add_argument('--db', default=os.path.join(REPO_DIR, 'instance', 'load_test.db'),
+                        help='SQLite season (generated if missing)')
+    parser.add_argument('--seed', type=int, default=2025, help='synthetic season seed when generating --db')
+    parser.add_argument('--url', help='load an already running server instead of booting one')
+    parser.add_argument('--server', choices=['werkzeug', 'gunicorn'], default='werkzeug', help='server to boot')
+    parser.add_argument('--server-workers', type=int, default=1, help='server processes')
+    parser.add_argument('--server-threads', type=int, default=4, help='threads per gunicorn worker')
+    parser.add_argument('--server-log', help='write server output to this file')
+    parser.add_argument('--concurrency', type=int, help='client threads (default from scenario)')
+    parser.add_argument('--duration', type=float, help='measured seconds (default from scenario)')
+    parser.add_argument('--output', default='load_results.json', help='results JSON file')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.server_workers)
+        return
+
+    with open(args.scenario) as f:
+        scenario = json.load(f)
+    concurrency = args.concurrency or scenario.get('concurrency', 8)
+    duration = args.duration or scenario.get('duration_s', 60)
+    seed = scenario.get('seed', 0)
+
+    if not os.path.exists(args.db):
+        if args.url:
+            print(f"❌ {args.db} not found - pass the database the server at {args.url} uses")
+            sys.exit(1)
+        os.makedirs(os.path.dirname(os.path.abspath(args.db)), exist_ok=True)
+        print(f"Generating synthetic season into {args.db}...")
+        subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, 'synthetic_season.py'), '--db', args.db,
+                        '--seed', str(args.seed)], check=True, stdout=subprocess.DEVNULL)
+    values = load_placeholder_values(args.db)
+
+    process = None
+    base_url = args.url.rstrip('/') if args.url else None
+    try:
+        if base_url is None:
+            port = free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            process = start_server(args, args.db, port)
+        wait_until_ready(base_url, process)
+
+        if scenario.get('warmup_s'):
+            drive(base_url, scenario, values, concurrency, scenario['warmup_s'], seed + 1)
+        print(f"{concurrency} clients for {duration:.0f} s against {base_url} "
+              f"({'external' if process is None else f'{args.server}, {args.server_workers} worker(s)'})")
+        samples, elapsed = drive(base_url, scenario, values, concurrency, duration, seed)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+
+    routes, overall = build_report(samples, elapsed, scenario)
+    print_report(routes, overall)
+
+    results = {
+        'generated_at': datetime.utcnow().isoformat() + 'Z',
+        'scenario': os.path.basename(args.scenario),
+        'target': args.url or {'server': args.server, 'workers': args.server_workers,
+                               'threads': args.server_threads if args.server == 'gunicorn' else None},
+        'concurrency': concurrency,
+        'duration_s': round(elapsed, 2),
+        'client': {'python': platform.python_version(), 'cpu_count': os.cpu_count()},
+        'routes': routes,
+        'overall': overall
+    }
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
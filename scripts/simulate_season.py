@@ -0,0 +1,74 @@
+# simulate_season.py - Monte Carlo CFP / bowl odds for the remaining schedule
+#
+# Usage: OFFSEASON_MODE=true python scripts/simulate_season.py [--seasons 10000] [--seed 42] [--workers 4] [--top 25] [--json]
+#
+# Plays out every pending ScheduledGame --seasons times with simulate_remaining_season
+# and prints playoff, bye, conference title and bowl-eligibility odds. Before simulating
+# it checks the vectorized CFP selection against generate_correct_cfp_bracket on the
+# current standings. The same --seed gives the same odds for any --workers.
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.environ.setdefault('OFFSEASON_MODE', 'true')
+
+import app  # noqa: E402
+
+
+def check_cfp_selection():
+    """Vectorized selection on today's standings must pick the same field and byes as the app"""
+    problem = app.build_season_simulation_problem(pending_games=[])
+    components = app.cfb_vector_ranking.compute_bulk_components(problem.season)
+    adjusted_total = components['adjusted_total'][None, :problem.num_ranked]
+    _, _, _, in_field, has_bye = app.cfb_season_simulator.select_cfp_fields(problem, adjusted_total)
+    team_names = problem.season.team_names
+
+    bracket = app.generate_correct_cfp_bracket()
+    expected_field = {team['team'] for team in bracket['all_teams']}
+    expected_byes = {team['team'] for team in bracket['first_round_byes']}
+    field = {team_names[i] for i in in_field[0].nonzero()[0]}
+    byes = {team_names[i] for i in has_bye[0].nonzero()[0]}
+    return field == expected_field and byes == expected_byes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo season simulator')
+    parser.add_argument('--seasons', type=int, default=app.SEASON_SIMULATOR_DEFAULT_SEASONS, help='seasons to simulate')
+    parser.add_argument('--seed', type=int, default=None, help='fixed seed for reproducible odds')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default RANKING_WORKERS)')
+    parser.add_argument('--top', type=int, default=25, help='teams to print')
+    parser.add_argument('--json', action='store_true', help='print the full result as JSON')
+    args = parser.parse_args()
+
+    if not app.CFB_SEASON_SIMULATOR_ENABLED:
+        print("❌ cfb_season_simulator is not available (NumPy required)")
+        sys.exit(1)
+
+    with app.app.app_context():
+        if not check_cfp_selection():
+            print("❌ Simulated CFP selection differs from generate_correct_cfp_bracket")
+            sys.exit(1)
+
+        start = time.perf_counter()
+        result = app.simulate_remaining_season(args.seasons, seed=args.seed, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{result['seasons']} seasons, {result['pending_games']} pending games, {result['workers']} workers, "
+          f"seed {result['seed']}")
+    print(f"Setup {result['setup_ms']:.0f} ms, simulation {result['simulation_ms']:.0f} ms, total {elapsed:.1f} s")
+    print(f"{'Team':<24}{'Now':>5}{'CFP%':>8}{'Bye%':>8}{'Conf%':>8}{'Bowl%':>8}{'AvgRk':>8}{'AvgW':>7}")
+    for team in result['teams'][:args.top]:
+        print(f"{team['team']:<24}{team['current_rank']:>5}{team['playoff_odds']:>8.1f}{team['bye_odds']:>8.1f}"
+              f"{team['conference_title_odds']:>8.1f}{team['bowl_eligible_odds']:>8.1f}"
+              f"{team['average_rank']:>8.1f}{team['average_wins']:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+# synthetic_season.py - Generate a reproducible full season into a scratch SQLite DB
+#
+# Usage: python scripts/synthetic_season.py --db /tmp/synthetic.db [--seed 2025] [--weeks 13] [--play-bowls] [--force]
+#
+# Every FBS team in CONFERENCES gets a hidden strength; weeks 1-4 are non-conference
+# (with FCS games), the rest are conference play, then bowl-eligible teams are paired
+# into neutral-site bowl games. Completed games go through the same write path as
+# the add game form (Game row + update_team_stats_in_db for both teams) and are
+# mirrored as completed ScheduledGame rows. Bowls stay scheduled (pending) unless
+# --play-bowls is given, so auto-prediction has a week to work on.
+#
+# The app reads OFFSEASON_DATABASE_URL at import, so this module must set it before
+# importing app - use generate_into(path, ...) or run it as a script.
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+NON_CONFERENCE_WEEKS = 4
+FCS_GAME_RATE = 0.35  # Share of teams with an FCS opponent in a non-conference week 1-3
+BYE_RATE = 0.08
+BOWL_WEEK = 'Bowls'
+BOWL_ELIGIBLE_WINS = 6
+HOME_FIELD = 2.5
+MARGIN_SD = 14.0
+TIER_STRENGTH = {'P4': 6.0, 'G6': 0.0}
+
+
+def point_app_at(db_path):
+    """Point the app at db_path - must run before the first `import app`"""
+    if 'app' in sys.modules:
+        raise RuntimeError('app is already imported - OFFSEASON_DATABASE_URL must be set first')
+    os.environ['OFFSEASON_MODE'] = 'true'
+    os.environ['OFFSEASON_DATABASE_URL'] = f"sqlite:///{os.path.abspath(db_path)}"
+
+
+def build_schedule(app, rng, weeks):
+    """
+    Returns (teams, strengths, games) - games are dicts with
+    week, home, away, neutral and bowl_name (scores come from play_game).
+    """
+    teams = [team for team in app.TEAMS if not app.is_fcs_opponent(team)]
+    strengths = {
+        team: rng.gauss(TIER_STRENGTH['P4' if app.is_p4_team(team) else 'G6'], 8.0)
+        for team in teams
+    }
+    conference_of = {team: app.get_team_conference(team) for team in teams}
+    games = []
+
+    for week in range(1, weeks + 1):
+        playing = [team for team in teams if rng.random() > BYE_RATE]
+        rng.shuffle(playing)
+        if week < NON_CONFERENCE_WEEKS:
+            fcs_count = int(len(playing) * FCS_GAME_RATE * rng.random())
+            for team in playing[:fcs_count]:
+                games.append({'week': str(week), 'home': team, 'away': 'FCS', 'neutral': False, 'bowl_name': None})
+            playing = playing[fcs_count:]
+        if week > NON_CONFERENCE_WEEKS:
+            # Conference play: pair within conferences, leftovers play each other
+            playing.sort(key=lambda team: conference_of[team])
+            paired = []
+            leftovers = []
+            i = 0
+            while i < len(playing):
+                if i + 1 < len(playing) and conference_of[playing[i]] == conference_of[playing[i + 1]]:
+                    paired.append((playing[i], playing[i + 1]))
+                    i += 2
+                else:
+                    leftovers.append(playing[i])
+                    i += 1
+            paired.extend(zip(leftovers[0::2], leftovers[1::2]))
+        else:
+            paired = list(zip(playing[0::2], playing[1::2]))
+        for home, away in paired:
+            if rng.random() < 0.5:
+                home, away = away, home
+            games.append({'week': str(week), 'home': home, 'away': away, 'neutral': rng.random() < 0.03, 'bowl_name': None})
+
+    return teams, strengths, games
+
+
+def play_game(game, strengths, rng):
+    """Sample a final score from the teams' hidden strengths"""
+    home_strength = strengths.get(game['home'], -20.0)  # FCS
+    away_strength = strengths.get(game['away'], -20.0)
+    expected_margin = home_strength - away_strength + (0.0 if game['neutral'] else HOME_FIELD)
+    margin = int(round(rng.gauss(expected_margin, MARGIN_SD)))
+    overtime = margin == 0
+    if overtime:
+        margin = rng.choice([-7, -3, 3, 7])
+    winner_score = max(abs(margin), int(round(rng.gauss(30, 8))))
+    loser_score = max(0, winner_score - abs(margin))
+    if margin > 0:
+        return winner_score, loser_score, overtime
+    return loser_score, winner_score, overtime
+
+
+def record_game(app, game, home_score, away_score, overtime):
+    """Same writes as the add game form"""
+    db = app.db
+    row = app.Game(
+        week=game['week'],
+        home_team=game['home'],
+        away_team=game['away'],
+        home_score=home_score,
+        away_score=away_score,
+        is_neutral_site=game['neutral'],
+        overtime=overtime,
+        is_bowl_game=game['bowl_name'] is not None,
+        bowl_game_name=game['bowl_name']
+    )
+    db.session.add(row)
+    db.session.flush()
+    app.update_team_stats_in_db(game['home'], game['away'], home_score, away_score, True, game['neutral'], overtime,
+                                week=game['week'], game_id=row.id)
+    app.update_team_stats_in_db(game['away'], game['home'], away_score, home_score, False, game['neutral'], overtime,
+                                week=game['week'], game_id=row.id)
+
+
+def schedule_game(app, game, completed, home_score=None, away_score=None, overtime=False):
+    app.db.session.add(app.ScheduledGame(
+        week=game['week'],
+        home_team=game['home'],
+        away_team=game['away'],
+        neutral=game['neutral'],
+        completed=completed,
+        bowl_game_name=game['bowl_name'],
+        final_home_score=home_score,
+        final_away_score=away_score,
+        overtime=overtime
+    ))
+
+
+def pair_bowls(app, teams, rng):
+    """Bowl-eligible teams (6+ wins) paired by record into neutral-site bowl games"""
+    wins = {stats.team_name: stats.wins for stats in app.TeamStats.query.filter(app.TeamStats.team_name.in_(teams))}
+    eligible = sorted((team for team in teams if wins.get(team, 0) >= BOWL_ELIGIBLE_WINS),
+                      key=lambda team: (-wins[team], rng.random()))
+    bowl_names = [bowl['name'] for bowl in app.BOWL_GAMES.values() if bowl.get('tier') != 'CFP']
+    games = []
+    for i, (team1, team2) in enumerate(zip(eligible[0::2], eligible[1::2])):
+        name = bowl_names[i] if i < len(bowl_names) else f"Synthetic Bowl {i + 1}"
+        games.append({'week': BOWL_WEEK, 'home': team1, 'away': team2, 'neutral': True, 'bowl_name': name})
+    return games
+
+
+def generate_season(app, seed=2025, weeks=13, play_bowls=False):
+    """Fill the (empty) app database with a synthetic season; returns a summary dict"""
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    with app.app.app_context():
+        app.db.create_all()
+        if app.TeamStats.query.first() is not None:
+            raise RuntimeError('Database already has team stats - use an empty database')
+
+        teams, strengths, games = build_schedule(app, rng, weeks)
+        for game in games:
+            home_score, away_score, overtime = play_game(game, strengths, rng)
+            record_game(app, game, home_score, away_score, overtime)
+            schedule_game(app, game, True, home_score, away_score, overtime)
+        app.db.session.commit()
+
+        bowls = pair_bowls(app, teams, rng)
+        for game in bowls:
+            if play_bowls:
+                home_score, away_score, overtime = play_game(game, strengths, rng)
+                record_game(app, game, home_score, away_score, overtime)
+                schedule_game(app, game, True, home_score, away_score, overtime)
+            else:
+                schedule_game(app, game, False)
+        app.db.session.commit()
+
+    return {
+        'seed': seed,
+        'weeks': weeks,
+        'teams': len(teams),
+        'games': len(games) + (len(bowls) if play_bowls else 0),
+        'fcs_games': sum(1 for game in games if game['away'] == 'FCS'),
+        'bowl_games': len(bowls),
+        'pending_games': 0 if play_bowls else len(bowls),
+        'pending_week': None if play_bowls or not bowls else BOWL_WEEK,
+        'elapsed_s': round(time.perf_counter() - start, 2)
+    }
+
+
+def generate_into(db_path, seed=2025, weeks=13, play_bowls=False, force=False):
+    """Create db_path, import the app against it and generate the season; returns (app, summary)"""
+    if os.path.exists(db_path):
+        if not force:
+            raise RuntimeError(f"{db_path} exists - pass force=True (--force) to replace it")
+        os.remove(db_path)
+    point_app_at(db_path)
+    import app
+    return app, generate_season(app, seed=seed, weeks=weeks, play_bowls=play_bowls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Synthetic season generator')
+    parser.add_argument('--db', required=True, help='SQLite file to create')
+    parser.add_argument('--seed', type=int, default=2025, help='random seed (same seed = same season)')
+    parser.add_argument('--weeks', type=int, default=13, choices=range(12, 16), metavar='12-15',
+                        help='regular season weeks')
+    parser.add_argument('--play-bowls', action='store_true', help='complete the bowl games too (nothing pending)')
+    parser.add_argument('--force', action='store_true', help='replace an existing --db file')
+    args = parser.parse_args()
+
+    try:
+        _, summary = generate_into(args.db, seed=args.seed, weeks=args.weeks, play_bowls=args.play_bowls, force=args.force)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ {summary['teams']} teams, {summary['games']} games ({summary['fcs_games']} vs FCS), "
+          f"{summary['bowl_games']} bowls{' pending' if summary['pending_games'] else ''} "
+          f"in {summary['elapsed_s']} s -> {args.db}")
+
+
+if __name__ == '__main__':
+    main()